@@ -1,7 +1,8 @@
 # app.py (root of dhi_finish)
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+import math
 import pathlib
 import sys
 import traceback
@@ -22,6 +23,22 @@ from backend.routes.candidates import (
 # NEW: auth router
 from backend.routes.login_route import router as login_router, startup_auth
 
+from backend.routes.migrations import check_schema_version
+from backend.routes.resume_backfill import start_resume_backfill, stop_resume_backfill
+from backend.routes.schema_catalog import start_schema_catalog, stop_schema_catalog
+from backend.routes.name_index import start_name_index, stop_name_index
+from backend.routes.password_hasher import shutdown_hasher
+from backend.routes.sessions import AUTH_REQUIRED, require_session, start_sessions, stop_sessions
+from backend.routes.write_behind import start_write_behind, stop_write_behind
+from backend.routes.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, METRICS, MetricsMiddleware, render as render_metrics
+from backend.routes.db_connection import (
+    PG_REPLICA_DSNS,
+    PG_RYW_SECONDS,
+    RYW_COOKIE,
+    RYW_HEADER,
+    begin_request_routing,
+)
+
 # ---------- Applications router (safe import) ----------
 applications_router = None
 try:
@@ -51,18 +68,69 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # X-Next-After: /api/applications page cursor; X-Primary-Until: read-your-writes pin
+    expose_headers=["X-Next-After", RYW_HEADER],
 )
 
+# Per-route latency, DB time and bytes for /metrics (backend/routes/metrics.py)
+if METRICS:
+    app.add_middleware(MetricsMiddleware)
+
+# ---------------- Read replicas: read-your-writes ----------------
+# Only installed when replicas are configured. A request that writes pins the
+# client's reads to the primary for PGREPLICA_RYW_SECONDS. The deadline goes
+# out in the X-Primary-Until response header, which the SPA echoes back on its
+# next requests (src/lib/readYourWrites.ts): the API is cross-origin and called
+# without credentials, so a cookie would never come back. The cookie is still
+# set and read for same-origin clients.
+def _pinned_until(request: Request) -> float:
+    for raw in (request.headers.get(RYW_HEADER), request.cookies.get(RYW_COOKIE)):
+        try:
+            return float(raw or 0.0)
+        except ValueError:
+            continue
+    return 0.0
+
+if PG_REPLICA_DSNS:
+    @app.middleware("http")
+    async def _read_your_writes(request: Request, call_next):
+        pinned = _pinned_until(request)
+        holder = begin_request_routing(pinned)
+        response = await call_next(request)
+        if holder["primary_until"] > pinned:
+            until = f"{holder['primary_until']:.3f}"
+            response.headers[RYW_HEADER] = until
+            response.set_cookie(
+                RYW_COOKIE,
+                until,
+                max_age=max(1, math.ceil(PG_RYW_SECONDS)),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
 # ---------------- Lifecycle ----------------
 @app.on_event("startup")
 async def _startup():
     await startup_candidates()  # existing
-    await startup_auth()        # NEW: ensure login table
+    await startup_auth()
+    await check_schema_version()  # DDL lives in backend/migrations (CLI: python -m backend.routes.migrations up)
+    await start_schema_catalog()  # after any startup migration
+    await start_name_index()  # no-op with NAME_INDEX=off
+    await start_sessions()  # revoked session tokens (migration 0012)
+    start_resume_backfill()  # no-op unless RESUME_BACKFILL=on
+    start_write_behind()  # buffered last_login updates
     print("[app] Startup complete — DB and routers ready.")
 
 @app.on_event("shutdown")
 async def _shutdown():
+    stop_resume_backfill()
+    await stop_schema_catalog()
+    await stop_name_index()
+    await stop_sessions()
+    await stop_write_behind()  # final flush, before the pool closes
     await shutdown_candidates()
+    shutdown_hasher()
     print("[app] Shutdown complete — DB connections closed.")
 
 # ---------------- Health ----------------
@@ -70,14 +138,24 @@ async def _shutdown():
 def up():
     return {"ok": True, "service": "DHI Master API"}
 
+# Prometheus text format; open like /up so scrapers need no session
+# async: render() reads loop-owned counters, so it must run on the event loop
+# (a sync def would run it on the threadpool while requests update them).
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
 # ---------------- Mount routers ----------------
 # (no extra prefix — routes already start with /api/…)
-app.include_router(jobs_router)
-app.include_router(candidates_router)
+# AUTH_REQUIRED=on: every API route except /api/auth/* needs a session token
+# (backend/routes/sessions.py); /up stays open for probes.
+protected = [Depends(require_session)] if AUTH_REQUIRED else []
+app.include_router(jobs_router, dependencies=protected)
+app.include_router(candidates_router, dependencies=protected)
 app.include_router(login_router)  # /api/auth/*
 
 # Register Applications only if import actually worked
 if applications_router is not None:
-    app.include_router(applications_router)  # /api/applications/*
+    app.include_router(applications_router, dependencies=protected)  # /api/applications/*
 else:
     print("[app] Applications router NOT registered (see warning above).")
@@ -0,0 +1,86 @@
+# backend/bench/app_writes.py
+# p50/p99 latency of the application write endpoints against a running API.
+#
+#   python -m backend.bench.app_writes --save before.json
+#   python -m backend.bench.app_writes --compare before.json
+#
+# POST creates real rows, so point it at a local/scratch database. Names and
+# ids are taken from the newest existing application, so the name-based
+# variants exercise the exact-match path. The bulk case posts --bulk-size
+# name-based items per request; compare its p50 with --bulk-size x the
+# single POST (names) p50.
+from __future__ import annotations
+
+import argparse
+import json
+import urllib.request
+from typing import Any, Dict, List
+
+from .common import compare, print_table, run_load
+
+
+def _sample_application(base: str) -> Dict[str, Any]:
+    with urllib.request.urlopen(base + "/api/applications", timeout=30) as resp:
+        rows = json.loads(resp.read())
+    if not rows:
+        raise SystemExit("no applications to take names from; create one first")
+    return rows[0]
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="create/update application latency")
+    ap.add_argument("--base-url", default="http://127.0.0.1:8000")
+    ap.add_argument("--requests", type=int, default=300)
+    ap.add_argument("--concurrency", type=int, default=1)
+    ap.add_argument("--warmup", type=int, default=20)
+    ap.add_argument("--bulk-size", type=int, default=200, help="items per /api/applications/bulk request")
+    ap.add_argument("--bulk-requests", type=int, default=20)
+    ap.add_argument("--save", help="write results to this JSON file")
+    ap.add_argument("--compare", help="JSON file from an earlier --save run")
+    args = ap.parse_args(argv)
+
+    base = args.base_url.rstrip("/")
+    s = _sample_application(base)
+    by_id = {"candidate_id": s["candidate_id"], "job_id": s["job_id"], "status": "Applied"}
+    by_name = {
+        "candidate_name": s["candidate_name"],
+        "job_title": s["job_title"],
+        "company": s["company"],
+        "status": "Applied",
+    }
+    cases = [
+        ("POST /api/applications (ids)", "POST", "/api/applications", by_id),
+        ("POST /api/applications (names)", "POST", "/api/applications", by_name),
+        ("PUT /api/applications/{id} (fields)", "PUT", f"/api/applications/{s['id']}", {"status": s["status"], "comments": "bench"}),
+        ("PUT /api/applications/{id} (names)", "PUT", f"/api/applications/{s['id']}", {**by_name, "status": s["status"]}),
+    ]
+
+    rows = []
+    for label, method, path, body in cases:
+        if args.warmup:
+            run_load(base + path, args.warmup, 1, method, body)
+        res = run_load(base + path, args.requests, args.concurrency, method, body)
+        res["path"] = label
+        rows.append(res)
+
+    if args.bulk_size:
+        path = "/api/applications/bulk"
+        body = {"items": [by_name] * args.bulk_size}
+        if args.warmup:
+            run_load(base + path, 2, 1, "POST", body)
+        res = run_load(base + path, args.bulk_requests, args.concurrency, "POST", body)
+        res["path"] = f"POST {path} ({args.bulk_size} names)"
+        rows.append(res)
+
+    print_table(f"application writes ({args.requests} req, concurrency {args.concurrency})", rows)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            compare(json.load(fh), rows)
+
+
+if __name__ == "__main__":
+    main()
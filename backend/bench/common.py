@@ -0,0 +1,102 @@
+# backend/bench/common.py
+# Small stdlib-only helpers shared by the HTTP benchmarks.
+# Run the API first (e.g. `uvicorn App:app`), then point a benchmark at it.
+from __future__ import annotations
+
+import json
+import math
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile; `samples` does not need to be sorted."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    k = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[k]
+
+
+def timed_request(
+    url: str,
+    method: str = "GET",
+    body: Optional[Dict[str, Any]] = None,
+    timeout: float = 30.0,
+) -> Dict[str, Any]:
+    data = None
+    headers = {}
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    req = urllib.request.Request(url, data=data, method=method, headers=headers)
+    t0 = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            payload = resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        payload = e.read()
+        status = e.code
+    except Exception:
+        payload = b""
+        status = 0
+    return {"ms": (time.perf_counter() - t0) * 1000.0, "status": status, "bytes": len(payload)}
+
+
+def run_load(
+    url: str,
+    requests: int,
+    concurrency: int,
+    method: str = "GET",
+    body: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Fire `requests` calls at `url` from `concurrency` threads and summarise them."""
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        results = list(ex.map(lambda _: timed_request(url, method, body), range(requests)))
+    wall = time.perf_counter() - t0
+
+    ok = [r["ms"] for r in results if 200 <= r["status"] < 300]
+    return {
+        "url": url,
+        "requests": requests,
+        "concurrency": concurrency,
+        "ok": len(ok),
+        "errors": len(results) - len(ok),
+        "p50_ms": round(percentile(ok, 50), 2),
+        "p99_ms": round(percentile(ok, 99), 2),
+        "rps": round(len(results) / wall, 1) if wall > 0 else 0.0,
+        "bytes_avg": int(sum(r["bytes"] for r in results) / len(results)) if results else 0,
+    }
+
+
+def print_table(label: str, rows: List[Dict[str, Any]]) -> None:
+    print(f"== {label} ==")
+    print(f"{'path':<40} {'ok':>6} {'err':>5} {'p50 ms':>9} {'p99 ms':>9} {'rps':>8}")
+    for r in rows:
+        print(
+            f"{r['path']:<40} {r['ok']:>6} {r['errors']:>5} "
+            f"{r['p50_ms']:>9} {r['p99_ms']:>9} {r['rps']:>8}"
+        )
+
+
+def _pct(new: float, old: float) -> str:
+    return f"{(new - old) / old * 100.0:+.1f}%" if old else "n/a"
+
+
+def compare(before: List[Dict[str, Any]], after: List[Dict[str, Any]]) -> None:
+    """Print the p50/p99/rps delta for rows that share a path."""
+    prev = {r["path"]: r for r in before}
+    print("== delta (after vs before) ==")
+    for r in after:
+        b = prev.get(r["path"])
+        if not b:
+            continue
+        print(
+            f"{r['path']:<40} p50 {_pct(r['p50_ms'], b['p50_ms']):>8}  "
+            f"p99 {_pct(r['p99_ms'], b['p99_ms']):>8}  rps {_pct(r['rps'], b['rps']):>8}"
+        )
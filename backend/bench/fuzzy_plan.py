@@ -0,0 +1,121 @@
+# backend/bench/fuzzy_plan.py
+# Plan check for the fuzzy name resolution in Applications.py at scale.
+#
+#   python -m backend.bench.fuzzy_plan [--rows 1000000] [--keep]
+#
+# Builds a scratch schema (dhi_fuzzy_bench) with `--rows` synthetic candidates
+# and the same trigram indexes as migration 0007, then runs
+# EXPLAIN (ANALYZE, BUFFERS) on the exact statements the resolver sends.
+# Fails if a plan falls back to a sequential scan. Needs pg_trgm.
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import List
+
+import psycopg
+
+from ..routes.Applications import (
+    _CANDIDATE_FUZZY_SQL,
+    _CANDIDATE_SIM_THRESHOLD,
+    _JOB_AVG_SIM_THRESHOLD,
+    _JOB_FUZZY_SQL,
+)
+from ..routes.db_connection import DSN, _schema_sql
+
+SCHEMA = "dhi_fuzzy_bench"
+
+_SETUP = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+CREATE SCHEMA {SCHEMA};
+CREATE TABLE {SCHEMA}.candidates (id BIGSERIAL PRIMARY KEY, full_name TEXT);
+CREATE TABLE {SCHEMA}.jobs (id BIGSERIAL PRIMARY KEY, job_title TEXT, company TEXT);
+"""
+
+# Words from random syllables: varied enough that trigram selectivity looks
+# like real names, with the repetition real names have. Seeded, so runs match.
+_WORD = (
+    "initcap("
+    + " || ".join(
+        "(ARRAY['ra','vi','an','ku','ma','pri','ya','shi','ar','ne','de','sa','ka','mi','lo',"
+        "'ta','ho','ber','jo','el','gu','pa','re','chi','nsa','dd','ve','ol','wi','tz'])"
+        "[1 + floor(random() * 30)::int]"
+        for _ in range(3)
+    )
+    + ")"
+)
+
+_FILL_CANDIDATES = f"""
+INSERT INTO {SCHEMA}.candidates (full_name)
+SELECT {_WORD} || ' ' || {_WORD}
+FROM generate_series(1, %(rows)s) AS g;
+"""
+
+_FILL_JOBS = f"""
+INSERT INTO {SCHEMA}.jobs (job_title, company)
+SELECT (ARRAY['Backend Engineer','Data Analyst','Sales Lead','Product Manager','QA Engineer',
+              'Frontend Developer','HR Executive','Accountant','Support Engineer','Designer'])
+           [1 + floor(random() * 10)::int],
+       {_WORD} || ' ' || (ARRAY['Labs','Systems','Pvt Ltd','Solutions','Retail'])[1 + floor(random() * 5)::int]
+FROM generate_series(1, %(rows)s) AS g;
+"""
+
+_INDEXES = [
+    f"CREATE INDEX ON {SCHEMA}.candidates USING GIN (lower(full_name) gin_trgm_ops);",
+    f"CREATE INDEX ON {SCHEMA}.jobs USING GIN (lower(job_title) gin_trgm_ops);",
+    f"CREATE INDEX ON {SCHEMA}.jobs USING GIN (lower(company) gin_trgm_ops);",
+]
+
+
+def _explain(conn: psycopg.Connection, sql: str, params: dict, threshold: float) -> List[str]:
+    sql = sql.replace("dhi.", f"{SCHEMA}.")
+    with conn.transaction():
+        conn.execute("SELECT set_config('pg_trgm.similarity_threshold', %s, true);", (str(threshold),))
+        rows = conn.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql, params).fetchall()
+    return [r[0] for r in rows]
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="EXPLAIN the fuzzy resolver queries on a large scratch table")
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--keep", action="store_true", help="keep the scratch schema afterwards")
+    args = ap.parse_args(argv)
+
+    ok = True
+    with psycopg.connect(DSN, autocommit=True) as conn:
+        conn.execute(_schema_sql())  # same search_path as the app (pg_trgm may live in the app schema)
+        if not conn.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm';").fetchone():
+            sys.exit("pg_trgm is not installed in this database")
+        try:
+            t0 = time.perf_counter()
+            conn.execute(_SETUP)
+            conn.execute("SELECT setseed(0.42);")
+            conn.execute(_FILL_CANDIDATES, {"rows": args.rows})
+            conn.execute(_FILL_JOBS, {"rows": max(args.rows // 20, 1000)})
+            for ddl in _INDEXES:
+                conn.execute(ddl)
+            conn.execute(f"ANALYZE {SCHEMA}.candidates; ANALYZE {SCHEMA}.jobs;")
+            print(f"[bench] {args.rows} candidates loaded and indexed in {time.perf_counter() - t0:.1f}s")
+
+            checks = [
+                ("candidate (typo)", _CANDIDATE_FUZZY_SQL, {"name": "Ravijo Kamiber"}, _CANDIDATE_SIM_THRESHOLD),
+                ("candidate (no match)", _CANDIDATE_FUZZY_SQL, {"name": "zzqx wvvk"}, _CANDIDATE_SIM_THRESHOLD),
+                ("job", _JOB_FUZZY_SQL, {"job_title": "Backend Enginer", "company": "Tavishi Labs"}, _JOB_AVG_SIM_THRESHOLD),
+            ]
+            for label, sql, params, threshold in checks:
+                plan = _explain(conn, sql, params, threshold)
+                seq = any("Seq Scan" in line for line in plan)
+                ok = ok and not seq
+                print(f"\n== {label}: {'SEQ SCAN' if seq else 'index'} ==")
+                print("\n".join(plan))
+        finally:
+            if not args.keep:
+                conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;")
+
+    if not ok:
+        sys.exit("a fuzzy resolver plan used a sequential scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# backend/bench/latency.py
+# p50/p99 latency for the read endpoints against a running API.
+#
+#   git stash / checkout the old revision, start uvicorn, then:
+#     python -m backend.bench.latency --save before.json
+#   switch back to the new revision, restart uvicorn, then:
+#     python -m backend.bench.latency --compare before.json
+from __future__ import annotations
+
+import argparse
+import json
+from typing import List
+
+from .common import compare, print_table, run_load
+
+DEFAULT_PATHS = [
+    "/api/candidates?page=1&page_size=100",
+    "/api/applications",
+    "/api/applications/typeahead?q=an&limit=10",
+]
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Per-endpoint p50/p99 latency")
+    ap.add_argument("--base-url", default="http://127.0.0.1:8000")
+    ap.add_argument("--path", action="append", dest="paths", help="repeatable; defaults to candidates, applications, typeahead")
+    ap.add_argument("--requests", type=int, default=500)
+    ap.add_argument("--concurrency", type=int, default=1)
+    ap.add_argument("--warmup", type=int, default=20)
+    ap.add_argument("--save", help="write results to this JSON file")
+    ap.add_argument("--compare", help="JSON file from an earlier --save run")
+    args = ap.parse_args(argv)
+
+    rows = []
+    for path in args.paths or DEFAULT_PATHS:
+        url = args.base_url.rstrip("/") + path
+        if args.warmup:
+            run_load(url, args.warmup, 1)
+        res = run_load(url, args.requests, args.concurrency)
+        res["path"] = path
+        rows.append(res)
+
+    print_table(f"latency ({args.requests} req, concurrency {args.concurrency})", rows)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            compare(json.load(fh), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# backend/bench/throughput.py
+# Throughput of the jobs endpoints at increasing client concurrency.
+#
+#   run against the old revision:  python -m backend.bench.throughput --save before.json
+#   run against the new revision:  python -m backend.bench.throughput --compare before.json
+#
+# Use a single uvicorn worker for both runs so the numbers compare like for like.
+from __future__ import annotations
+
+import argparse
+import json
+from typing import List
+
+from .common import compare, print_table, run_load
+
+DEFAULT_PATHS = ["/api/jobs", "/api/health"]
+
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Requests/second per endpoint and concurrency level")
+    ap.add_argument("--base-url", default="http://127.0.0.1:8000")
+    ap.add_argument("--path", action="append", dest="paths", help="repeatable; defaults to /api/jobs + /api/health")
+    ap.add_argument("--concurrency", default="1,8,32,64", help="comma-separated client concurrency levels")
+    ap.add_argument("--requests", type=int, default=1000, help="requests per (path, concurrency) cell")
+    ap.add_argument("--save", help="write results to this JSON file")
+    ap.add_argument("--compare", help="JSON file from an earlier --save run")
+    args = ap.parse_args(argv)
+
+    levels = [int(x) for x in args.concurrency.split(",") if x.strip()]
+    rows = []
+    for path in args.paths or DEFAULT_PATHS:
+        url = args.base_url.rstrip("/") + path
+        run_load(url, 20, 1)  # warm the pool and prepared statements
+        for c in levels:
+            res = run_load(url, args.requests, c)
+            res["path"] = f"{path} @c={c}"
+            rows.append(res)
+
+    print_table(f"throughput ({args.requests} req per cell)", rows)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            compare(json.load(fh), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+-- 0001: auth table (was created by startup_auth on every worker start)
+CREATE SCHEMA IF NOT EXISTS dhi;
+
+CREATE TABLE IF NOT EXISTS dhi.login_users (
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    created_on TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_login TIMESTAMPTZ
+);
@@ -0,0 +1,11 @@
+-- 0002: optional candidate columns + inline resume storage
+-- (was run by startup_candidates on every worker start)
+ALTER TABLE candidates
+  ADD COLUMN IF NOT EXISTS source TEXT,
+  ADD COLUMN IF NOT EXISTS notes  TEXT,
+  ADD COLUMN IF NOT EXISTS company TEXT,
+  ADD COLUMN IF NOT EXISTS resume_data BYTEA,
+  ADD COLUMN IF NOT EXISTS resume_filename TEXT,
+  ADD COLUMN IF NOT EXISTS resume_mime_type TEXT,
+  ADD COLUMN IF NOT EXISTS resume_size_bytes INT,
+  ADD COLUMN IF NOT EXISTS resume_url TEXT;
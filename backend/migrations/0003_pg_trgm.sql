@@ -0,0 +1,9 @@
+-- 0003: pg_trgm for fuzzy name matching (was created on the request path).
+-- Non-fatal: hosted databases may not allow it; fuzzy matching is then skipped.
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+EXCEPTION WHEN insufficient_privilege OR undefined_file OR feature_not_supported THEN
+    RAISE NOTICE 'pg_trgm not available: fuzzy name matching disabled';
+END
+$$;
@@ -0,0 +1,5 @@
+-- migrate: no-transaction
+-- 0004: matches /api/candidates ordering (created_at DESC, id DESC) so keyset
+-- pages are an index range scan instead of a sort + OFFSET.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_created_at_id_idx
+    ON candidates (created_at DESC, id DESC);
@@ -0,0 +1,23 @@
+-- migrate: no-transaction
+-- 0005: indexes behind the /api/candidates filter/sort engine.
+-- status sets page in the default order straight off the composite index.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_status_created_at_id_idx
+    ON candidates (status, created_at DESC, id DESC);
+-- case-insensitive equality filters
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_company_lower_idx
+    ON candidates (lower(company));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_job_position_lower_idx
+    ON candidates (lower(job_position));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_city_lower_idx
+    ON candidates (lower(city));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_pincode_idx
+    ON candidates (pincode);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_work_experience_id_idx
+    ON candidates (work_experience, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_full_name_id_idx
+    ON candidates (full_name, id);
+-- array containment (@>)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_select_languages_gin
+    ON candidates USING GIN (select_languages);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_preferred_employment_types_gin
+    ON candidates USING GIN (preferred_employment_types);
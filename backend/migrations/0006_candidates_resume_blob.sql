@@ -0,0 +1,5 @@
+-- 0006: resumes move to the content-addressed blob store; the row keeps the
+-- SHA-256 digest (hex) next to the existing filename/mime/size columns.
+-- resume_data stays until resume_backfill has moved every row out.
+ALTER TABLE candidates
+  ADD COLUMN IF NOT EXISTS resume_sha256 TEXT;
@@ -0,0 +1,26 @@
+-- 0007: indexes behind /api/applications/typeahead.
+-- Prefix matches (lower(col) LIKE 'abc%') use the text_pattern_ops btrees;
+-- substring/similarity matches use trigram GIN indexes when pg_trgm is
+-- installed (0003). Built in-transaction so the pg_trgm check and the builds
+-- stay together; this blocks writes to candidates/jobs while they build.
+CREATE INDEX IF NOT EXISTS candidates_full_name_prefix_idx
+    ON candidates (lower(full_name) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS jobs_job_title_prefix_idx
+    ON jobs (lower(job_title) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS jobs_company_prefix_idx
+    ON jobs (lower(company) text_pattern_ops);
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        EXECUTE 'CREATE INDEX IF NOT EXISTS candidates_full_name_trgm_idx '
+             || 'ON candidates USING GIN (lower(full_name) gin_trgm_ops)';
+        EXECUTE 'CREATE INDEX IF NOT EXISTS jobs_job_title_trgm_idx '
+             || 'ON jobs USING GIN (lower(job_title) gin_trgm_ops)';
+        EXECUTE 'CREATE INDEX IF NOT EXISTS jobs_company_trgm_idx '
+             || 'ON jobs USING GIN (lower(company) gin_trgm_ops)';
+    ELSE
+        RAISE NOTICE 'pg_trgm not installed: typeahead uses prefix/substring matching only';
+    END IF;
+END
+$$;
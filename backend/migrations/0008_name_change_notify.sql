@@ -0,0 +1,24 @@
+-- 0008: change feed for the in-process name index (backend/routes/name_index.py).
+-- Sends '<table>:<id>' on dhi_names_changed whenever a candidate name or a job
+-- title/company is inserted, changed or deleted. NOTIFY is delivered on commit.
+CREATE OR REPLACE FUNCTION notify_name_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('dhi_names_changed', TG_TABLE_NAME || ':' || OLD.id);
+    ELSE
+        PERFORM pg_notify('dhi_names_changed', TG_TABLE_NAME || ':' || NEW.id);
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS candidates_name_notify ON candidates;
+CREATE TRIGGER candidates_name_notify
+    AFTER INSERT OR DELETE OR UPDATE OF full_name ON candidates
+    FOR EACH ROW EXECUTE FUNCTION notify_name_change();
+
+DROP TRIGGER IF EXISTS jobs_name_notify ON jobs;
+CREATE TRIGGER jobs_name_notify
+    AFTER INSERT OR DELETE OR UPDATE OF job_title, company ON jobs
+    FOR EACH ROW EXECUTE FUNCTION notify_name_change();
@@ -0,0 +1,9 @@
+-- migrate: no-transaction
+-- 0009: indexes on the applications foreign keys, ending in the list order
+-- COALESCE(applied_on, '-infinity') DESC, id DESC. They serve the ON DELETE
+-- CASCADE lookups from candidates/jobs; the /api/applications list and its
+-- filters read applications_read (0010) and are indexed there.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS applications_job_id_applied_on_id_idx
+    ON applications (job_id, (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS applications_candidate_id_applied_on_id_idx
+    ON applications (candidate_id, (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
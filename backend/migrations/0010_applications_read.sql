@@ -0,0 +1,162 @@
+-- 0010: denormalized read model for /api/applications (backend/routes/applications_read.py).
+-- applications_read holds one row per application with the candidate/job names
+-- copied in and the dates already formatted, so list/get read one table.
+-- applications_read_source is the single definition of a row; triggers, the
+-- rebuild and the consistency check all go through it.
+--
+-- interview_text is formatted with the writing session's TimeZone, like the
+-- old per-read to_char; the app never changes TimeZone, so all writers agree.
+CREATE TABLE IF NOT EXISTS applications_read (
+    id              BIGINT PRIMARY KEY,
+    candidate_id    BIGINT,
+    candidate_name  TEXT,
+    job_id          BIGINT,
+    job_title       TEXT,
+    company         TEXT,
+    status          TEXT NOT NULL,
+    sourced_by      TEXT,
+    sourced_from    TEXT,
+    assigned_to     TEXT,
+    applied_on      DATE,   -- sort/filter key
+    applied_on_text TEXT,   -- 'YYYY-MM-DD'
+    interview_text  TEXT,   -- 'YYYY-MM-DD"T"HH24:MI:SSOF'
+    comments        TEXT
+);
+
+CREATE OR REPLACE VIEW applications_read_source AS
+SELECT
+    a.id,
+    a.candidate_id,
+    c.full_name AS candidate_name,
+    a.job_id,
+    j.job_title,
+    j.company,
+    a.status::text AS status,
+    a.sourced_by,
+    a.sourced_from,
+    a.assigned_to,
+    a.applied_on,
+    to_char(a.applied_on, 'YYYY-MM-DD') AS applied_on_text,
+    to_char(a.interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview_text,
+    a.comments
+FROM applications a
+LEFT JOIN candidates c ON c.id = a.candidate_id
+LEFT JOIN jobs j       ON j.id = a.job_id;
+
+-- Statement-level with transition tables: a multi-row INSERT/UPDATE costs one
+-- upsert, not one per row.
+CREATE OR REPLACE FUNCTION applications_read_upsert() RETURNS trigger
+LANGUAGE plpgsql SET search_path FROM CURRENT AS $$
+BEGIN
+    -- Wait for in-flight renames of the referenced candidates/jobs (and make
+    -- later ones wait for us), so the names copied below are current. Each
+    -- statement here takes a fresh snapshot.
+    PERFORM 1 FROM candidates WHERE id IN (SELECT candidate_id FROM new_rows) ORDER BY id FOR SHARE;
+    PERFORM 1 FROM jobs WHERE id IN (SELECT job_id FROM new_rows) ORDER BY id FOR SHARE;
+
+    INSERT INTO applications_read AS r (
+        id, candidate_id, candidate_name, job_id, job_title, company, status,
+        sourced_by, sourced_from, assigned_to, applied_on, applied_on_text,
+        interview_text, comments
+    )
+    SELECT
+        s.id, s.candidate_id, s.candidate_name, s.job_id, s.job_title, s.company, s.status,
+        s.sourced_by, s.sourced_from, s.assigned_to, s.applied_on, s.applied_on_text,
+        s.interview_text, s.comments
+    FROM applications_read_source s
+    WHERE s.id IN (SELECT id FROM new_rows)
+    ON CONFLICT (id) DO UPDATE SET
+        candidate_id    = EXCLUDED.candidate_id,
+        candidate_name  = EXCLUDED.candidate_name,
+        job_id          = EXCLUDED.job_id,
+        job_title       = EXCLUDED.job_title,
+        company         = EXCLUDED.company,
+        status          = EXCLUDED.status,
+        sourced_by      = EXCLUDED.sourced_by,
+        sourced_from    = EXCLUDED.sourced_from,
+        assigned_to     = EXCLUDED.assigned_to,
+        applied_on      = EXCLUDED.applied_on,
+        applied_on_text = EXCLUDED.applied_on_text,
+        interview_text  = EXCLUDED.interview_text,
+        comments        = EXCLUDED.comments;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION applications_read_delete() RETURNS trigger
+LANGUAGE plpgsql SET search_path FROM CURRENT AS $$
+BEGIN
+    DELETE FROM applications_read WHERE id IN (SELECT id FROM old_rows);
+    RETURN NULL;
+END
+$$;
+
+-- Renames are rare and single-row: row-level, and only when the name changed.
+CREATE OR REPLACE FUNCTION applications_read_candidate_renamed() RETURNS trigger
+LANGUAGE plpgsql SET search_path FROM CURRENT AS $$
+BEGIN
+    UPDATE applications_read SET candidate_name = NEW.full_name WHERE candidate_id = NEW.id;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION applications_read_job_renamed() RETURNS trigger
+LANGUAGE plpgsql SET search_path FROM CURRENT AS $$
+BEGIN
+    UPDATE applications_read
+    SET job_title = NEW.job_title, company = NEW.company
+    WHERE job_id = NEW.id;
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS applications_read_ins ON applications;
+CREATE TRIGGER applications_read_ins
+    AFTER INSERT ON applications REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION applications_read_upsert();
+
+DROP TRIGGER IF EXISTS applications_read_upd ON applications;
+CREATE TRIGGER applications_read_upd
+    AFTER UPDATE ON applications REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION applications_read_upsert();
+
+DROP TRIGGER IF EXISTS applications_read_del ON applications;
+CREATE TRIGGER applications_read_del
+    AFTER DELETE ON applications REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION applications_read_delete();
+
+DROP TRIGGER IF EXISTS applications_read_candidate_name ON candidates;
+CREATE TRIGGER applications_read_candidate_name
+    AFTER UPDATE OF full_name ON candidates
+    FOR EACH ROW WHEN (OLD.full_name IS DISTINCT FROM NEW.full_name)
+    EXECUTE FUNCTION applications_read_candidate_renamed();
+
+DROP TRIGGER IF EXISTS applications_read_job_name ON jobs;
+CREATE TRIGGER applications_read_job_name
+    AFTER UPDATE OF job_title, company ON jobs
+    FOR EACH ROW WHEN (OLD.job_title IS DISTINCT FROM NEW.job_title OR OLD.company IS DISTINCT FROM NEW.company)
+    EXECUTE FUNCTION applications_read_job_renamed();
+
+-- Initial fill (the triggers above are already in place in this transaction).
+INSERT INTO applications_read
+SELECT * FROM applications_read_source
+ON CONFLICT (id) DO NOTHING;
+
+-- The list filters and (applied_on, id) sort key. candidate_id/job_id
+-- also serve the rename triggers.
+CREATE INDEX IF NOT EXISTS applications_read_applied_on_id_idx
+    ON applications_read ((COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applications_read_status_applied_on_id_idx
+    ON applications_read (status, (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applications_read_job_id_applied_on_id_idx
+    ON applications_read (job_id, (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applications_read_candidate_id_applied_on_id_idx
+    ON applications_read (candidate_id, (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applications_read_assigned_to_lower_idx
+    ON applications_read (lower(assigned_to), (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applications_read_sourced_by_lower_idx
+    ON applications_read (lower(sourced_by), (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applications_read_sourced_from_lower_idx
+    ON applications_read (lower(sourced_from), (COALESCE(applied_on, '-infinity'::date)) DESC, id DESC);
+
+ANALYZE applications_read;
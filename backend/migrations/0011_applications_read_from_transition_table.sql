@@ -0,0 +1,46 @@
+-- 0011: build applications_read rows straight from the trigger's transition
+-- table instead of re-reading applications through applications_read_source.
+-- new_rows already holds every applications column, so a multi-row INSERT
+-- (POST /api/applications/bulk) only probes candidates/jobs by primary key;
+-- the old form could hash-join a full scan of applications. Must produce the
+-- same row as applications_read_source (`applications_read check` verifies).
+CREATE OR REPLACE FUNCTION applications_read_upsert() RETURNS trigger
+LANGUAGE plpgsql SET search_path FROM CURRENT AS $$
+BEGIN
+    -- Wait for in-flight renames of the referenced candidates/jobs (and make
+    -- later ones wait for us), so the names copied below are current. Each
+    -- statement here takes a fresh snapshot.
+    PERFORM 1 FROM candidates WHERE id IN (SELECT candidate_id FROM new_rows) ORDER BY id FOR SHARE;
+    PERFORM 1 FROM jobs WHERE id IN (SELECT job_id FROM new_rows) ORDER BY id FOR SHARE;
+
+    INSERT INTO applications_read AS r (
+        id, candidate_id, candidate_name, job_id, job_title, company, status,
+        sourced_by, sourced_from, assigned_to, applied_on, applied_on_text,
+        interview_text, comments
+    )
+    SELECT
+        a.id, a.candidate_id, c.full_name, a.job_id, j.job_title, j.company, a.status::text,
+        a.sourced_by, a.sourced_from, a.assigned_to, a.applied_on,
+        to_char(a.applied_on, 'YYYY-MM-DD'),
+        to_char(a.interview,  'YYYY-MM-DD"T"HH24:MI:SSOF'),
+        a.comments
+    FROM new_rows a
+    LEFT JOIN candidates c ON c.id = a.candidate_id
+    LEFT JOIN jobs j       ON j.id = a.job_id
+    ON CONFLICT (id) DO UPDATE SET
+        candidate_id    = EXCLUDED.candidate_id,
+        candidate_name  = EXCLUDED.candidate_name,
+        job_id          = EXCLUDED.job_id,
+        job_title       = EXCLUDED.job_title,
+        company         = EXCLUDED.company,
+        status          = EXCLUDED.status,
+        sourced_by      = EXCLUDED.sourced_by,
+        sourced_from    = EXCLUDED.sourced_from,
+        assigned_to     = EXCLUDED.assigned_to,
+        applied_on      = EXCLUDED.applied_on,
+        applied_on_text = EXCLUDED.applied_on_text,
+        interview_text  = EXCLUDED.interview_text,
+        comments        = EXCLUDED.comments;
+    RETURN NULL;
+END
+$$;
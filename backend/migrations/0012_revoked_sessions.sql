@@ -0,0 +1,29 @@
+-- 0012: revoked session tokens (backend/routes/sessions.py).
+-- Tokens are verified in process from their HMAC; this table only lists the
+-- ones logged out before they expire. Each app keeps the live rows in memory
+-- and hears about new ones on dhi_sessions_revoked ('<jti hex>:<expiry epoch>').
+-- Rows past expires_at are dead weight and are deleted at app startup.
+CREATE TABLE IF NOT EXISTS revoked_sessions (
+    jti        BYTEA       PRIMARY KEY,
+    user_id    BIGINT      NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL,
+    revoked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS revoked_sessions_expires_at_idx ON revoked_sessions (expires_at);
+
+CREATE OR REPLACE FUNCTION notify_session_revoked() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify(
+        'dhi_sessions_revoked',
+        encode(NEW.jti, 'hex') || ':' || floor(extract(epoch FROM NEW.expires_at))::bigint
+    );
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS revoked_sessions_notify ON revoked_sessions;
+CREATE TRIGGER revoked_sessions_notify
+    AFTER INSERT ON revoked_sessions
+    FOR EACH ROW EXECUTE FUNCTION notify_session_revoked();
@@ -0,0 +1,5 @@
+-- migrate: no-transaction
+-- 0013: release_resume_blob() (blob_store.py) asks whether any candidate still
+-- references a digest before deleting the file; keep that an index probe.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_resume_sha256_idx
+    ON candidates (resume_sha256) WHERE resume_sha256 IS NOT NULL;
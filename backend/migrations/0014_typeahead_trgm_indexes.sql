@@ -0,0 +1,14 @@
+-- migrate: no-transaction
+-- 0014: trigram GIN indexes for /api/applications/typeahead on databases where
+-- pg_trgm arrived after 0007 ran (0007 skips them without the extension).
+-- CONCURRENTLY so writes to candidates/jobs carry on; no-op where 0007 built
+-- them, skipped while pg_trgm is still missing.
+-- migrate: if-extension pg_trgm
+CREATE INDEX CONCURRENTLY IF NOT EXISTS candidates_full_name_trgm_idx
+    ON candidates USING GIN (lower(full_name) gin_trgm_ops);
+-- migrate: if-extension pg_trgm
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_job_title_trgm_idx
+    ON jobs USING GIN (lower(job_title) gin_trgm_ops);
+-- migrate: if-extension pg_trgm
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_company_trgm_idx
+    ON jobs USING GIN (lower(company) gin_trgm_ops);
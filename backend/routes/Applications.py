@@ -1,24 +1,36 @@
 # backend/routes/Applications.py
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
-from fastapi import APIRouter, HTTPException
+import base64
+import json
+import re
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple, Union
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
+import psycopg
+from psycopg.rows import dict_row
 
 # Same helpers as candidates.py
-from .db_connection import async_query, async_exec
+from .db_connection import _env, async_query, async_exec, async_pipeline, async_transaction
+from .name_index import NAME_INDEX
+from .schema_catalog import SCHEMA_CATALOG
 
 router = APIRouter(tags=["applications"])
 
 # ---------- Allowed values ----------
-_ALLOWED_STATUS = {
+# pipeline order; also the column order of /api/applications/board
+_STATUS_ORDER = (
     "Applied",
     "Interview Scheduled",
     "Qualified",
     "Rejected",
     "Offer",
     "Joined",
-}
+)
+_ALLOWED_STATUS = set(_STATUS_ORDER)
 
 # ---------- Fuzzy thresholds (tweakable) ----------
 # Candidate name fuzzy threshold (0..1). Lower = more permissive.
@@ -27,6 +39,151 @@ _CANDIDATE_SIM_THRESHOLD = 0.45
 # Job average (title+company) fuzzy threshold (0..1).
 _JOB_AVG_SIM_THRESHOLD = 0.50
 
+# ---------- Hot statements (sent as prepared statements) ----------
+_APP_BY_ID_SQL = """
+    SELECT
+      id,
+      candidate_id,
+      candidate_name,
+      job_id,
+      job_title,
+      company,
+      status,
+      sourced_by,
+      sourced_from,
+      assigned_to,
+      to_char(applied_on, 'YYYY-MM-DD')  AS applied_on,
+      to_char(interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
+      comments
+    FROM dhi.applications_view
+    WHERE id = %(id)s
+    LIMIT 1;
+"""
+
+_CANDIDATE_EXACT_SQL = """
+    SELECT id
+    FROM dhi.candidates
+    WHERE full_name = %(name)s
+    LIMIT 1;
+"""
+
+_JOB_EXACT_SQL = """
+    SELECT id
+    FROM dhi.jobs
+    WHERE job_title = %(job_title)s AND company = %(company)s
+    LIMIT 1;
+"""
+
+# ---------- Single-statement writes ----------
+# create/update run as one data-modifying CTE: resolve names by exact match
+# (inlined), write, and return the row joined and formatted like
+# _APP_BY_ID_SQL. The new row is not visible through applications_view within
+# the same statement, so the join below mirrors the view; keep them in sync.
+_APP_COLUMNS = ("status", "sourced_by", "sourced_from", "assigned_to", "applied_on", "interview", "comments")
+
+_WRITTEN_SELECT_SQL = """
+    SELECT
+      a.id,
+      a.candidate_id,
+      c.full_name AS candidate_name,
+      a.job_id,
+      j.job_title,
+      j.company,
+      a.status,
+      a.sourced_by,
+      a.sourced_from,
+      a.assigned_to,
+      to_char(a.applied_on, 'YYYY-MM-DD')  AS applied_on,
+      to_char(a.interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
+      a.comments
+    FROM written a
+    LEFT JOIN dhi.candidates c ON c.id = a.candidate_id
+    LEFT JOIN dhi.jobs j       ON j.id = a.job_id;
+"""
+
+_CANDIDATE_ID_EXPR = "%(candidate_id)s::bigint"
+_CANDIDATE_LOOKUP_EXPR = "(SELECT id FROM dhi.candidates WHERE full_name = %(candidate_name)s LIMIT 1)"
+_JOB_ID_EXPR = "%(job_id)s::bigint"
+_JOB_LOOKUP_EXPR = (
+    "(SELECT id FROM dhi.jobs WHERE job_title = %(job_title)s AND company = %(company)s LIMIT 1)"
+)
+
+
+def _insert_application_sql(lookup_candidate: bool, lookup_job: bool) -> str:
+    """INSERT only when both ids resolve; no row back means a lookup missed."""
+    cols = ", ".join(_APP_COLUMNS)
+    vals = ", ".join(f"%({c})s" for c in _APP_COLUMNS)
+    return f"""
+    WITH cand AS (SELECT {_CANDIDATE_LOOKUP_EXPR if lookup_candidate else _CANDIDATE_ID_EXPR} AS id),
+         job  AS (SELECT {_JOB_LOOKUP_EXPR if lookup_job else _JOB_ID_EXPR} AS id),
+         written AS (
+           INSERT INTO dhi.applications (candidate_id, job_id, {cols})
+           SELECT cand.id, job.id, {vals}
+           FROM cand, job
+           WHERE cand.id IS NOT NULL AND job.id IS NOT NULL
+           RETURNING *
+         )
+    {_WRITTEN_SELECT_SQL}"""
+
+
+def _update_application_sql(set_cols: List[str], lookup_candidate: bool, lookup_job: bool) -> str:
+    """
+    UPDATE by id; an inlined name lookup that misses leaves the row untouched
+    (no row back), so the caller can fall back to fuzzy matching.
+    """
+    ctes = []
+    sets = [f"{c} = %({c})s" for c in set_cols]
+    guards = []
+    if lookup_candidate:
+        ctes.append(f"cand AS (SELECT {_CANDIDATE_LOOKUP_EXPR} AS id)")
+        sets.append("candidate_id = (SELECT id FROM cand)")
+        guards.append("(SELECT id FROM cand) IS NOT NULL")
+    if lookup_job:
+        ctes.append(f"job AS (SELECT {_JOB_LOOKUP_EXPR} AS id)")
+        sets.append("job_id = (SELECT id FROM job)")
+        guards.append("(SELECT id FROM job) IS NOT NULL")
+    ctes.append(
+        f"""written AS (
+           UPDATE dhi.applications
+           SET {", ".join(sets)}
+           WHERE {" AND ".join(["id = %(id)s"] + guards)}
+           RETURNING *
+         )"""
+    )
+    return f"""
+    WITH {",".join(ctes)}
+    {_WRITTEN_SELECT_SQL}"""
+
+
+# Fuzzy fallbacks. `%` only matches above pg_trgm.similarity_threshold, which
+# _fuzzy_pipeline sets per transaction to our own threshold, so the GIN
+# trigram indexes (0007) return just the few qualifying rows and `<->`
+# (1 - similarity) orders those, nearest first. A GiST index would let `<->`
+# drive a KNN scan, but at 1M candidates it measured ~4x slower than the GIN
+# bitmap scan (python -m backend.bench.fuzzy_plan), so there is none.
+_SET_TRGM_THRESHOLD_SQL = "SELECT set_config('pg_trgm.similarity_threshold', %(threshold)s, true);"
+
+_CANDIDATE_FUZZY_SQL = """
+    SELECT id, similarity(lower(full_name), lower(%(name)s)) AS sim
+    FROM dhi.candidates
+    WHERE lower(full_name) %% lower(%(name)s)
+    ORDER BY lower(full_name) <-> lower(%(name)s)
+    LIMIT 1;
+"""
+
+# avg(title_sim, company_sim) >= t implies one of them is >= t, so filtering
+# on `title % x OR company % y` at threshold t loses no qualifying row.
+_JOB_FUZZY_SQL = """
+    SELECT id,
+      similarity(lower(job_title), lower(%(job_title)s)) AS title_sim,
+      similarity(lower(company), lower(%(company)s)) AS company_sim
+    FROM dhi.jobs
+    WHERE lower(job_title) %% lower(%(job_title)s)
+       OR lower(company) %% lower(%(company)s)
+    ORDER BY (lower(job_title) <-> lower(%(job_title)s)) + (lower(company) <-> lower(%(company)s))
+    LIMIT 1;
+"""
+
 # ---------- Models ----------
 class ApplicationIn(BaseModel):
     # prefer IDs; names kept for backward compatibility / UI convenience
@@ -71,57 +228,33 @@ class ApplicationOut(BaseModel):
 
 
 # ---------- Helpers ----------
-async def _ensure_trgm_extension() -> None:
-    """
-    Try to create the pg_trgm extension if it doesn't exist.
-    Non-fatal: if it fails (no permissions), fuzzy queries will be skipped.
-    """
+def _first_id(rows: List[Dict[str, Any]]) -> Optional[int]:
+    if not rows:
+        return None
     try:
-        await async_exec("CREATE EXTENSION IF NOT EXISTS pg_trgm;", params=None, set_schema=False)
+        return int(rows[0]["id"])
     except Exception:
-        # silent fallback — some hosted DBs restrict extension creation
-        pass
-
-
-async def _resolve_candidate_id(candidate_id: Optional[int], candidate_name: Optional[str]) -> Optional[int]:
-    # 1) prefer explicit numeric id
-    if candidate_id is not None:
-        return candidate_id
-
-    if not candidate_name:
         return None
 
-    # 3) exact match
-    rows = await async_query(
-        """
-        SELECT id
-        FROM dhi.candidates
-        WHERE full_name = %(name)s
-        LIMIT 1;
-        """,
-        {"name": candidate_name},
+
+async def _fuzzy_pipeline(sql: str, params: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Run a fuzzy lookup with the trigram threshold set for its transaction only."""
+    _, rows = await async_pipeline(
+        [
+            (_SET_TRGM_THRESHOLD_SQL, {"threshold": str(threshold)}),
+            (sql, params),
+        ],
         set_schema=False,
+        prepare=True,
     )
-    if rows:
-        try:
-            return int(rows[0]["id"])
-        except Exception:
-            return None
+    return rows
 
-    # 4) fuzzy match fallback using pg_trgm
-    await _ensure_trgm_extension()
 
+async def _fuzzy_candidate_id(candidate_name: str) -> Optional[int]:
+    # fuzzy match fallback using pg_trgm (installed by migration 0003;
+    # if it is missing the query fails and we fall through to None)
     try:
-        sim_rows = await async_query(
-            """
-            SELECT id, similarity(lower(full_name), lower(%(name)s)) AS sim
-            FROM dhi.candidates
-            ORDER BY sim DESC
-            LIMIT 1;
-            """,
-            {"name": candidate_name},
-            set_schema=False,
-        )
+        sim_rows = await _fuzzy_pipeline(_CANDIDATE_FUZZY_SQL, {"name": candidate_name}, _CANDIDATE_SIM_THRESHOLD)
         if sim_rows:
             try:
                 sim_val = float(sim_rows[0].get("sim") or 0.0)
@@ -139,43 +272,33 @@ async def _resolve_candidate_id(candidate_id: Optional[int], candidate_name: Opt
     return None
 
 
-async def _resolve_job_id(job_id: Optional[int], job_title: Optional[str], company: Optional[str]) -> Optional[int]:
-    if job_id is not None:
-        return job_id
+async def _resolve_candidate_id(candidate_id: Optional[int], candidate_name: Optional[str]) -> Optional[int]:
+    # 1) prefer explicit numeric id
+    if candidate_id is not None:
+        return candidate_id
 
-    if not job_title or not company:
+    if not candidate_name:
         return None
 
-    rows = await async_query(
-        """
-        SELECT id
-        FROM dhi.jobs
-        WHERE job_title = %(job_title)s AND company = %(company)s
-        LIMIT 1;
-        """,
-        {"job_title": job_title, "company": company},
-        set_schema=False,
-    )
+    # 2) in-process index (exact, then fuzzy); a miss may just mean it is stale
+    if NAME_INDEX.ready:
+        cid = NAME_INDEX.resolve_candidate(candidate_name, _CANDIDATE_SIM_THRESHOLD)
+        if cid is not None:
+            return cid
+
+    # 3) exact match
+    rows = await async_query(_CANDIDATE_EXACT_SQL, {"name": candidate_name}, set_schema=False, prepare=True)
     if rows:
-        try:
-            return int(rows[0]["id"])
-        except Exception:
-            return None
+        return _first_id(rows)
+
+    # 4) fuzzy match
+    return await _fuzzy_candidate_id(candidate_name)
 
-    await _ensure_trgm_extension()
 
+async def _fuzzy_job_id(job_title: str, company: str) -> Optional[int]:
     try:
-        sim_rows = await async_query(
-            """
-            SELECT id,
-              similarity(lower(job_title), lower(%(job_title)s)) AS title_sim,
-              similarity(lower(company), lower(%(company)s)) AS company_sim
-            FROM dhi.jobs
-            ORDER BY (similarity(lower(job_title), lower(%(job_title)s)) + similarity(lower(company), lower(%(company)s))) DESC
-            LIMIT 1;
-            """,
-            {"job_title": job_title, "company": company},
-            set_schema=False,
+        sim_rows = await _fuzzy_pipeline(
+            _JOB_FUZZY_SQL, {"job_title": job_title, "company": company}, _JOB_AVG_SIM_THRESHOLD
         )
         if sim_rows:
             try:
@@ -198,6 +321,69 @@ async def _resolve_job_id(job_id: Optional[int], job_title: Optional[str], compa
     return None
 
 
+async def _resolve_job_id(job_id: Optional[int], job_title: Optional[str], company: Optional[str]) -> Optional[int]:
+    if job_id is not None:
+        return job_id
+
+    if not job_title or not company:
+        return None
+
+    if NAME_INDEX.ready:
+        jid = NAME_INDEX.resolve_job(job_title, company, _JOB_AVG_SIM_THRESHOLD)
+        if jid is not None:
+            return jid
+
+    rows = await async_query(
+        _JOB_EXACT_SQL,
+        {"job_title": job_title, "company": company},
+        set_schema=False,
+        prepare=True,
+    )
+    if rows:
+        return _first_id(rows)
+
+    return await _fuzzy_job_id(job_title, company)
+
+
+async def _resolve_candidate_and_job(
+    candidate_id: Optional[int],
+    candidate_name: Optional[str],
+    job_id: Optional[int],
+    job_title: Optional[str],
+    company: Optional[str],
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Same rules as _resolve_candidate_id/_resolve_job_id: the name index answers
+    first, and when both sides still need Postgres the two exact matches go
+    out in one pipeline flush.
+    """
+    if NAME_INDEX.ready:
+        if candidate_id is None and candidate_name:
+            candidate_id = NAME_INDEX.resolve_candidate(candidate_name, _CANDIDATE_SIM_THRESHOLD)
+        if job_id is None and job_title and company:
+            job_id = NAME_INDEX.resolve_job(job_title, company, _JOB_AVG_SIM_THRESHOLD)
+
+    need_candidate = candidate_id is None and bool(candidate_name)
+    need_job = job_id is None and bool(job_title) and bool(company)
+    if not (need_candidate and need_job):
+        return (
+            await _resolve_candidate_id(candidate_id, candidate_name),
+            await _resolve_job_id(job_id, job_title, company),
+        )
+
+    cand_rows, job_rows = await async_pipeline(
+        [
+            (_CANDIDATE_EXACT_SQL, {"name": candidate_name}),
+            (_JOB_EXACT_SQL, {"job_title": job_title, "company": company}),
+        ],
+        set_schema=False,
+        prepare=True,
+    )
+    cid = _first_id(cand_rows) if cand_rows else await _fuzzy_candidate_id(candidate_name)  # type: ignore[arg-type]
+    jid = _first_id(job_rows) if job_rows else await _fuzzy_job_id(job_title, company)  # type: ignore[arg-type]
+    return cid, jid
+
+
 def _non_null_fields(payload: Dict[str, Any], allowed: List[str]) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     for k in allowed:
@@ -226,6 +412,7 @@ async def candidate_options() -> Dict[str, List[Dict[str, Union[int, str]]]]:
             """,
             params=None,
             set_schema=False,
+            read_only=True,
         )
 
         jobs = await async_query(
@@ -238,6 +425,7 @@ async def candidate_options() -> Dict[str, List[Dict[str, Union[int, str]]]]:
             """,
             params=None,
             set_schema=False,
+            read_only=True,
         )
 
         return {"candidates": candidates, "jobs": jobs}
@@ -245,6 +433,129 @@ async def candidate_options() -> Dict[str, List[Dict[str, Union[int, str]]]]:
         raise HTTPException(status_code=500, detail=f"/api/applications/candidate-options failed: {e}")
 
 
+# ---------- Typeahead (replaces the 5000-row option dumps) ----------
+# Ranked: prefix hits first, then trigram similarity, then name. Prefix terms
+# use the text_pattern_ops btrees, the rest the trigram GIN indexes (0007, 0014).
+# Without pg_trgm it degrades to prefix + substring matching. Terms shorter
+# than a trigram have none to look up (the GIN scan would read every row), so
+# they are answered from the prefix btrees alone.
+_TYPEAHEAD_MAX = 50
+_TYPEAHEAD_MIN_FUZZY = 3
+
+_CANDIDATE_TYPEAHEAD_TRGM_SQL = """
+    SELECT id, full_name,
+           lower(full_name) LIKE %(prefix)s AS prefix_hit,
+           similarity(lower(full_name), %(q)s) AS score
+    FROM dhi.candidates
+    WHERE lower(full_name) LIKE %(prefix)s
+       OR lower(full_name) LIKE %(contains)s
+       OR lower(full_name) %% %(q)s
+    ORDER BY prefix_hit DESC, score DESC, full_name ASC
+    LIMIT %(limit)s;
+"""
+
+_CANDIDATE_TYPEAHEAD_PLAIN_SQL = """
+    SELECT id, full_name,
+           lower(full_name) LIKE %(prefix)s AS prefix_hit,
+           NULL::real AS score
+    FROM dhi.candidates
+    WHERE lower(full_name) LIKE %(contains)s
+    ORDER BY prefix_hit DESC, full_name ASC
+    LIMIT %(limit)s;
+"""
+
+_CANDIDATE_TYPEAHEAD_PREFIX_SQL = """
+    SELECT id, full_name, NULL::real AS score
+    FROM dhi.candidates
+    WHERE lower(full_name) LIKE %(prefix)s
+    ORDER BY full_name ASC
+    LIMIT %(limit)s;
+"""
+
+_JOB_TYPEAHEAD_TRGM_SQL = """
+    SELECT id, job_title, company,
+           (lower(job_title) LIKE %(prefix)s OR lower(company) LIKE %(prefix)s) AS prefix_hit,
+           GREATEST(similarity(lower(job_title), %(q)s), similarity(lower(company), %(q)s)) AS score
+    FROM dhi.jobs
+    WHERE lower(job_title) LIKE %(prefix)s
+       OR lower(company) LIKE %(prefix)s
+       OR lower(job_title) LIKE %(contains)s
+       OR lower(company) LIKE %(contains)s
+       OR lower(job_title) %% %(q)s
+       OR lower(company) %% %(q)s
+    ORDER BY prefix_hit DESC, score DESC, job_title ASC
+    LIMIT %(limit)s;
+"""
+
+_JOB_TYPEAHEAD_PLAIN_SQL = """
+    SELECT id, job_title, company,
+           (lower(job_title) LIKE %(prefix)s OR lower(company) LIKE %(prefix)s) AS prefix_hit,
+           NULL::real AS score
+    FROM dhi.jobs
+    WHERE lower(job_title) LIKE %(contains)s
+       OR lower(company) LIKE %(contains)s
+    ORDER BY prefix_hit DESC, job_title ASC
+    LIMIT %(limit)s;
+"""
+
+_JOB_TYPEAHEAD_PREFIX_SQL = """
+    SELECT id, job_title, company, NULL::real AS score
+    FROM dhi.jobs
+    WHERE lower(job_title) LIKE %(prefix)s
+       OR lower(company) LIKE %(prefix)s
+    ORDER BY job_title ASC
+    LIMIT %(limit)s;
+"""
+
+
+def _like_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@router.get("/api/applications/typeahead")
+async def typeahead(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=_TYPEAHEAD_MAX),
+    kind: str = Query("all", regex="^(all|candidates|jobs)$"),
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Top-N candidates ({ id, full_name, score }) and/or jobs
+    ({ id, job_title, company, score }) matching `q`.
+    """
+    term = " ".join(q.lower().split())
+    if not term:
+        return {"candidates": [], "jobs": []}
+    esc = _like_escape(term)
+    params = {"q": term, "prefix": esc + "%", "contains": "%" + esc + "%", "limit": limit}
+
+    try:
+        if len(term) < _TYPEAHEAD_MIN_FUZZY:
+            candidate_sql, job_sql = _CANDIDATE_TYPEAHEAD_PREFIX_SQL, _JOB_TYPEAHEAD_PREFIX_SQL
+        elif await SCHEMA_CATALOG.has_extension("pg_trgm"):
+            candidate_sql, job_sql = _CANDIDATE_TYPEAHEAD_TRGM_SQL, _JOB_TYPEAHEAD_TRGM_SQL
+        else:
+            candidate_sql, job_sql = _CANDIDATE_TYPEAHEAD_PLAIN_SQL, _JOB_TYPEAHEAD_PLAIN_SQL
+        statements = []
+        if kind in ("all", "candidates"):
+            statements.append((candidate_sql, params))
+        if kind in ("all", "jobs"):
+            statements.append((job_sql, params))
+        results = await async_pipeline(statements, set_schema=False, prepare=True)
+
+        out: Dict[str, List[Dict[str, Any]]] = {"candidates": [], "jobs": []}
+        for key in ("candidates", "jobs"):
+            if kind in ("all", key):
+                rows = results.pop(0)
+                for r in rows:
+                    r.pop("prefix_hit", None)
+                    if r.get("score") is not None:
+                        r["score"] = round(float(r["score"]), 3)
+                out[key] = rows
+        return out
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/api/applications/typeahead failed: {e}")
+
+
 # ---------- Backwards-compatible alias route ----------
 # Some frontends call /api/candidates/options — provide the same data there.
 @router.get("/api/candidates/options")
@@ -257,64 +568,418 @@ async def candidate_options_alias() -> Dict[str, List[Dict[str, Union[int, str]]
     return await candidate_options()
 
 
+# ---------- Listing: filters + keyset pagination ----------
+# Order is `applied_on DESC NULLS LAST, id DESC` (unchanged), written as
+# _APPLIED_KEY DESC so that a NULL date is just the smallest value and the
+# cursor is a single row comparison the indexes can seek on. Filters are
+# whitelisted columns of dhi.applications. With migration 0010 the page is
+# read from dhi.applications_read (names copied in, dates pre-formatted; see
+# applications_read.py) and needs no join. Before it, the page is cut from
+# applications alone and only those rows are joined to
+# candidates/jobs. The body stays a plain list; the cursor
+# for the next page comes back in the X-Next-After header (absent on the last
+# page). Cursors are urlsafe base64 of [applied_on, id].
+_LIST_MAX = 1000
+
+_APPLIED_KEY = "COALESCE(applied_on, '-infinity'::date)"
+
+_LIST_SQL = """
+    SELECT
+      a.id,
+      a.candidate_id,
+      c.full_name AS candidate_name,
+      a.job_id,
+      j.job_title,
+      j.company,
+      a.status,
+      a.sourced_by,
+      a.sourced_from,
+      a.assigned_to,
+      to_char(a.applied_on, 'YYYY-MM-DD')  AS applied_on,
+      to_char(a.interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
+      a.comments
+    FROM (
+      SELECT *
+      FROM dhi.applications
+      {where}
+      ORDER BY {key} DESC, id DESC
+      LIMIT %(limit)s
+    ) a
+    LEFT JOIN dhi.candidates c ON c.id = a.candidate_id
+    LEFT JOIN dhi.jobs j       ON j.id = a.job_id
+    ORDER BY a.applied_on DESC NULLS LAST, a.id DESC;
+"""
+
+
+_READ_LIST_SQL = """
+    SELECT
+      id,
+      candidate_id,
+      candidate_name,
+      job_id,
+      job_title,
+      company,
+      status,
+      sourced_by,
+      sourced_from,
+      assigned_to,
+      applied_on_text AS applied_on,
+      interview_text  AS interview,
+      comments
+    FROM dhi.applications_read
+    {where}
+    ORDER BY {key} DESC, id DESC
+    LIMIT %(limit)s;
+"""
+
+_READ_BY_ID_SQL = """
+    SELECT
+      id,
+      candidate_id,
+      candidate_name,
+      job_id,
+      job_title,
+      company,
+      status,
+      sourced_by,
+      sourced_from,
+      assigned_to,
+      applied_on_text AS applied_on,
+      interview_text  AS interview,
+      comments
+    FROM dhi.applications_read
+    WHERE id = %(id)s;
+"""
+
+
+async def _has_read_model() -> bool:
+    return await SCHEMA_CATALOG.has_column("applications_read", "interview_text")
+
+
+async def _fetch_application(app_id: int) -> List[Dict[str, Any]]:
+    sql = _READ_BY_ID_SQL if await _has_read_model() else _APP_BY_ID_SQL
+    return await async_query(sql, {"id": app_id}, set_schema=False, prepare=True)
+
+
+def _encode_app_cursor(applied_on: Optional[str], app_id: int) -> str:
+    raw = json.dumps([applied_on, int(app_id)])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_app_cursor(token: str) -> Tuple[Optional[date], int]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        applied_on, app_id = json.loads(raw)
+        return (date.fromisoformat(applied_on) if applied_on is not None else None), int(app_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid 'after' cursor")
+
+
+def _split_multi(values: Optional[List[str]]) -> List[str]:
+    """Accept both ?k=a&k=b and ?k=a,b."""
+    out: List[str] = []
+    for v in values or []:
+        out.extend(x.strip() for x in v.split(",") if x.strip())
+    return out
+
+
+def _compile_application_filters(
+    status: Optional[List[str]] = None,
+    job_id: Optional[int] = None,
+    candidate_id: Optional[int] = None,
+    assigned_to: Optional[str] = None,
+    sourced_by: Optional[str] = None,
+    sourced_from: Optional[str] = None,
+    applied_from: Optional[date] = None,
+    applied_to: Optional[date] = None,
+) -> Tuple[List[str], Dict[str, Any]]:
+    where: List[str] = []
+    params: Dict[str, Any] = {}
+
+    statuses = sorted(set(_split_multi(status)))
+    bad = [s for s in statuses if s not in _ALLOWED_STATUS]
+    if bad:
+        raise HTTPException(status_code=400, detail=f"Invalid status '{bad[0]}'")
+    if statuses:
+        where.append("status = ANY(%(f_status)s)")
+        params["f_status"] = statuses
+    for col, val in (("job_id", job_id), ("candidate_id", candidate_id)):
+        if val is not None:
+            where.append(f"{col} = %(f_{col})s")
+            params[f"f_{col}"] = val
+    for col, val in (("assigned_to", assigned_to), ("sourced_by", sourced_by), ("sourced_from", sourced_from)):
+        if val and val.strip():
+            where.append(f"lower({col}) = lower(%(f_{col})s)")
+            params[f"f_{col}"] = val.strip()
+    # on the sort key so the range is an index condition; NULL dates never match
+    if applied_from is not None:
+        where.append(f"{_APPLIED_KEY} >= %(f_applied_from)s")
+        params["f_applied_from"] = applied_from
+    if applied_to is not None:
+        where.append(f"{_APPLIED_KEY} <= %(f_applied_to)s")
+        params["f_applied_to"] = applied_to
+        if applied_from is None:
+            where.append(f"{_APPLIED_KEY} > '-infinity'::date")
+    return where, params
+
+
+def _app_keyset_clause() -> str:
+    """Rows strictly after (applied_on, id) in list order; a NULL date compares as -infinity."""
+    return f"({_APPLIED_KEY}, id) < (COALESCE(%(after_value)s::date, '-infinity'::date), %(after_id)s)"
+
+
 # ---------- CRUD (use applications_view for joined fields) ----------
 @router.get("/api/applications", response_model=List[ApplicationOut])
-async def list_applications() -> List[ApplicationOut]:
+async def list_applications(
+    response: Response,
+    limit: int = Query(_LIST_MAX, ge=1, le=_LIST_MAX),
+    after: Optional[str] = Query(None, description="Cursor from a previous response's X-Next-After header"),
+    status_: Optional[List[str]] = Query(None, alias="status"),
+    job_id: Optional[int] = None,
+    candidate_id: Optional[int] = None,
+    assigned_to: Optional[str] = None,
+    sourced_by: Optional[str] = None,
+    sourced_from: Optional[str] = None,
+    applied_from: Optional[date] = None,
+    applied_to: Optional[date] = None,
+) -> List[ApplicationOut]:
     try:
+        where, params = _compile_application_filters(
+            status=status_,
+            job_id=job_id,
+            candidate_id=candidate_id,
+            assigned_to=assigned_to,
+            sourced_by=sourced_by,
+            sourced_from=sourced_from,
+            applied_from=applied_from,
+            applied_to=applied_to,
+        )
+        if after:
+            after_value, after_id = _decode_app_cursor(after)
+            where.append(_app_keyset_clause())
+            params.update({"after_value": after_value, "after_id": after_id})
+        params["limit"] = limit
+
+        sql = _READ_LIST_SQL if await _has_read_model() else _LIST_SQL
         rows = await async_query(
-            """
-            SELECT
-              id,
-              candidate_id,
-              candidate_name,
-              job_id,
-              job_title,
-              company,
-              status,
-              sourced_by,
-              sourced_from,
-              assigned_to,
-              to_char(applied_on, 'YYYY-MM-DD')  AS applied_on,
-              to_char(interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
-              comments
-            FROM dhi.applications_view
-            ORDER BY applied_on DESC NULLS LAST, id DESC
-            LIMIT 1000;
-            """,
-            params=None,
+            sql.format(where=("WHERE " + " AND ".join(where)) if where else "", key=_APPLIED_KEY),
+            params,
             set_schema=False,
+            prepare=True,
+            read_only=True,
         )
+        if len(rows) == limit:
+            last = rows[-1]
+            response.headers["X-Next-After"] = _encode_app_cursor(last["applied_on"], last["id"])
         return rows
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/api/applications failed: {e}")
 
 
+# ---------- Board (one column per status) ----------
+# Each column is an index seek on (status, sort key, id) with LIMIT, run for
+# all columns at once through a LATERAL join, so the initial board costs
+# O(columns x per_column) however many applications exist. (Ranking with
+# row_number()/count(*) OVER (PARTITION BY status) reads every row: ~2.8 s at
+# 1M applications, against ~0.3 ms for the seeks.)
+#
+# Totals are a GROUP BY over the filtered rows, sent in the same pipeline flush
+# and cached per process and per filter like /api/candidates totals; writes
+# through this router invalidate the cache, others age out after the TTL.
+#
+# A column loads lazily with ?status=<column>&after=<its next_after> (count=none
+# skips the totals). Cards use the same order and cursors as /api/applications.
+_BOARD_MAX = 100
+
+_BOARD_CARD_COLUMNS = """
+        id,
+        candidate_id,
+        candidate_name,
+        job_id,
+        job_title,
+        company,
+        status,
+        sourced_by,
+        sourced_from,
+        assigned_to,
+        {applied_on} AS applied_on,
+        {interview} AS interview,
+        comments"""
+
+# (source, applied_on text, interview text): the read model (0010) or, before
+# it, applications_view with per-read formatting
+_BOARD_SOURCES = {
+    True: ("dhi.applications_read", "applied_on_text", "interview_text"),
+    False: (
+        "dhi.applications_view",
+        "to_char(applied_on, 'YYYY-MM-DD')",
+        "to_char(interview,  'YYYY-MM-DD\"T\"HH24:MI:SSOF')",
+    ),
+}
+
+_BOARD_CARDS_SQL = """
+    SELECT col.status AS _column, c.*
+    FROM unnest(%(columns)s::{status_type}[]) WITH ORDINALITY AS col(status, ord)
+    CROSS JOIN LATERAL (
+      SELECT {cards}
+      FROM {source}
+      WHERE status = col.status{filters}
+      ORDER BY {key} DESC, id DESC
+      LIMIT %(limit)s
+    ) c
+    ORDER BY col.ord, c.applied_on DESC NULLS LAST, c.id DESC;
+"""
+
+_BOARD_TOTALS_SQL = """
+    SELECT status, count(*) AS n
+    FROM {source}
+    WHERE status = ANY(%(columns)s::{status_type}[]){filters}
+    GROUP BY status;
+"""
+
+# format_type() output, e.g. text, dhi.app_status_t, "Status"
+_SQL_TYPE_RE = re.compile(r'^[A-Za-z_"][A-Za-z0-9_."]*$')
+
+
+async def _status_type(source: str) -> str:
+    """
+    Type of `status` in a board source, so the columns parameter is cast to
+    it: an enum or domain column has no `= text` operator, and casting the
+    column instead would keep the status indexes from being used.
+    """
+    t = (await SCHEMA_CATALOG.columns(source.rpartition(".")[2])).get("status", "text")
+    return t if _SQL_TYPE_RE.match(t) else "text"
+
+
+_COUNT_TTL_SECONDS = float(_env("APPLICATIONS_COUNT_TTL", "30"))
+_COUNT_CACHE_MAX = 256
+_count_cache: Dict[Any, Tuple[float, Dict[str, int]]] = {}
+
+
+def _invalidate_counts() -> None:
+    _count_cache.clear()
+
+
+def _count_key(sql: str, params: Dict[str, Any]) -> Any:
+    return (sql, tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())))
+
+
+class BoardColumn(BaseModel):
+    status: str
+    total: Optional[int] = None
+    cards: List[ApplicationOut]
+    next_after: Optional[str] = None
+
+
+class BoardOut(BaseModel):
+    per_column: int
+    columns: List[BoardColumn]
+
+
+@router.get("/api/applications/board", response_model=BoardOut)
+async def applications_board(
+    per_column: int = Query(20, ge=1, le=_BOARD_MAX),
+    status_: Optional[List[str]] = Query(None, alias="status", description="columns to return (default: all)"),
+    after: Optional[str] = Query(None, description="next_after of a column; needs exactly one status"),
+    count: str = Query("cached", regex="^(cached|exact|none)$"),
+    job_id: Optional[int] = None,
+    candidate_id: Optional[int] = None,
+    assigned_to: Optional[str] = None,
+    sourced_by: Optional[str] = None,
+    sourced_from: Optional[str] = None,
+    applied_from: Optional[date] = None,
+    applied_to: Optional[date] = None,
+) -> BoardOut:
+    try:
+        wanted = set(_split_multi(status_))
+        bad = sorted(wanted - _ALLOWED_STATUS)
+        if bad:
+            raise HTTPException(status_code=400, detail=f"Invalid status '{bad[0]}'")
+        columns = [st for st in _STATUS_ORDER if not wanted or st in wanted]
+
+        where, params = _compile_application_filters(
+            job_id=job_id,
+            candidate_id=candidate_id,
+            assigned_to=assigned_to,
+            sourced_by=sourced_by,
+            sourced_from=sourced_from,
+            applied_from=applied_from,
+            applied_to=applied_to,
+        )
+        params["columns"] = columns
+        source, applied_expr, interview_expr = _BOARD_SOURCES[await _has_read_model()]
+        status_type = await _status_type(source)
+        totals_sql = _BOARD_TOTALS_SQL.format(
+            source=source, status_type=status_type, filters="".join(f" AND {w}" for w in where)
+        )
+        totals_params = dict(params)
+
+        if after:
+            if len(columns) != 1:
+                raise HTTPException(status_code=400, detail="'after' needs exactly one status column")
+            after_value, after_id = _decode_app_cursor(after)
+            where.append(_app_keyset_clause())
+            params.update({"after_value": after_value, "after_id": after_id})
+        params["limit"] = per_column + 1  # one extra row tells whether a column has more
+
+        cards_sql = _BOARD_CARDS_SQL.format(
+            cards=_BOARD_CARD_COLUMNS.format(applied_on=applied_expr, interview=interview_expr),
+            source=source,
+            status_type=status_type,
+            filters="".join(f" AND {w}" for w in where),
+            key=_APPLIED_KEY,
+        )
+
+        totals: Optional[Dict[str, int]] = None
+        key = _count_key(totals_sql, totals_params)
+        if count == "cached":
+            hit = _count_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] <= _COUNT_TTL_SECONDS:
+                totals = hit[1]
+
+        if count == "none" or totals is not None:
+            card_rows = await async_query(cards_sql, params, set_schema=False, prepare=True, read_only=True)
+        else:
+            card_rows, total_rows = await async_pipeline(
+                [(cards_sql, params), (totals_sql, totals_params)], set_schema=False, prepare=True
+            )
+            totals = {r["status"]: int(r["n"]) for r in total_rows}
+            if len(_count_cache) >= _COUNT_CACHE_MAX:
+                _count_cache.clear()
+            _count_cache[key] = (time.monotonic(), totals)
+
+        by_column: Dict[str, List[Dict[str, Any]]] = {st: [] for st in columns}
+        for r in card_rows:
+            by_column[r.pop("_column")].append(r)
+
+        out = []
+        for st in columns:
+            cards = by_column[st]
+            next_after = None
+            if len(cards) > per_column:
+                cards = cards[:per_column]
+                next_after = _encode_app_cursor(cards[-1]["applied_on"], cards[-1]["id"])
+            out.append(
+                {
+                    "status": st,
+                    "total": totals.get(st, 0) if totals is not None else None,
+                    "cards": cards,
+                    "next_after": next_after,
+                }
+            )
+        return {"per_column": per_column, "columns": out}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/api/applications/board failed: {e}")
+
+
 @router.get("/api/applications/{app_id}", response_model=ApplicationOut)
 async def get_application(app_id: int) -> ApplicationOut:
     try:
-        rows = await async_query(
-            """
-            SELECT
-              id,
-              candidate_id,
-              candidate_name,
-              job_id,
-              job_title,
-              company,
-              status,
-              sourced_by,
-              sourced_from,
-              assigned_to,
-              to_char(applied_on, 'YYYY-MM-DD') AS applied_on,
-              to_char(interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
-              comments
-            FROM dhi.applications_view
-            WHERE id = %(id)s
-            LIMIT 1;
-            """,
-            {"id": app_id},
-            set_schema=False,
-        )
+        rows = await _fetch_application(app_id)
         if not rows:
             raise HTTPException(status_code=404, detail="not found")
         return rows[0]
@@ -328,71 +993,42 @@ async def get_application(app_id: int) -> ApplicationOut:
 async def create_application(payload: ApplicationIn) -> ApplicationOut:
     try:
         data = payload.normalized()
-
-        # Resolve candidate_id and job_id (accept either IDs or names/titles)
-        cid = await _resolve_candidate_id(data.get("candidate_id"), data.get("candidate_name"))
-        jid = await _resolve_job_id(data.get("job_id"), data.get("job_title"), data.get("company"))
-
-        # Validation: require candidate and job (either by id or resolvable by text)
-        if cid is None:
-            raise HTTPException(status_code=400, detail="candidate_id or candidate_name (existing) is required")
-        if jid is None:
-            raise HTTPException(status_code=400, detail="job_id or (job_title and company) is required")
         if "status" not in data:
             raise HTTPException(status_code=400, detail="status is required")
 
-        # Insert minimal canonical fields into applications table
-        insert_sql = """
-            INSERT INTO dhi.applications
-              (candidate_id, job_id, status, sourced_by, sourced_from, assigned_to, applied_on, interview, comments)
-            VALUES
-              (%(candidate_id)s, %(job_id)s, %(status)s, %(sourced_by)s, %(sourced_from)s, %(assigned_to)s, %(applied_on)s, %(interview)s, %(comments)s)
-            RETURNING id;
-        """
-        params = {
-            "candidate_id": cid,
-            "job_id": jid,
-            "status": data["status"],
-            "sourced_by": data.get("sourced_by"),
-            "sourced_from": data.get("sourced_from"),
-            "assigned_to": data.get("assigned_to"),
-            "applied_on": data.get("applied_on"),
-            "interview": data.get("interview"),
-            "comments": data.get("comments"),
-        }
+        cid, jid = data.get("candidate_id"), data.get("job_id")
+        name, title, company = data.get("candidate_name"), data.get("job_title"), data.get("company")
+        if cid is None and not name:
+            raise HTTPException(status_code=400, detail="candidate_id or candidate_name (existing) is required")
+        if jid is None and not (title and company):
+            raise HTTPException(status_code=400, detail="job_id or (job_title and company) is required")
 
-        inserted = await async_query(insert_sql, params, set_schema=False)
-        if not inserted:
-            raise HTTPException(status_code=500, detail="Insert failed")
+        # Names the in-process index knows need no lookup at all
+        if NAME_INDEX.ready:
+            if cid is None:
+                cid = NAME_INDEX.resolve_candidate(name, _CANDIDATE_SIM_THRESHOLD)
+            if jid is None:
+                jid = NAME_INDEX.resolve_job(title, company, _JOB_AVG_SIM_THRESHOLD)
 
-        new_id = int(inserted[0]["id"])
+        params: Dict[str, Any] = {c: data.get(c) for c in _APP_COLUMNS}
+        params.update(candidate_id=cid, candidate_name=name, job_id=jid, job_title=title, company=company)
 
-        # Return the joined row from the view
+        # One round trip: exact-match resolution, INSERT and joined read-back
         rows = await async_query(
-            """
-            SELECT
-              id,
-              candidate_id,
-              candidate_name,
-              job_id,
-              job_title,
-              company,
-              status,
-              sourced_by,
-              sourced_from,
-              assigned_to,
-              to_char(applied_on, 'YYYY-MM-DD')  AS applied_on,
-              to_char(interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
-              comments
-            FROM dhi.applications_view
-            WHERE id = %(id)s
-            LIMIT 1;
-            """,
-            {"id": new_id},
-            set_schema=False,
+            _insert_application_sql(cid is None, jid is None), params, set_schema=False, prepare=True
         )
         if not rows:
-            raise HTTPException(status_code=500, detail="Failed to fetch created application")
+            # An exact lookup missed: resolve fuzzily, then insert with ids
+            cid, jid = await _resolve_candidate_and_job(cid, name, jid, title, company)
+            if cid is None:
+                raise HTTPException(status_code=400, detail="candidate_id or candidate_name (existing) is required")
+            if jid is None:
+                raise HTTPException(status_code=400, detail="job_id or (job_title and company) is required")
+            params.update(candidate_id=cid, job_id=jid)
+            rows = await async_query(_insert_application_sql(False, False), params, set_schema=False, prepare=True)
+        if not rows:
+            raise HTTPException(status_code=500, detail="Insert failed")
+        _invalidate_counts()
         return rows[0]
     except HTTPException:
         raise
@@ -400,6 +1036,292 @@ async def create_application(payload: ApplicationIn) -> ApplicationOut:
         raise HTTPException(status_code=500, detail=f"/api/applications POST failed: {e}")
 
 
+# ---------- Bulk create ----------
+# One request, one transaction. Names are resolved for the whole batch at once
+# (name index, then one pipeline of set-based exact + fuzzy lookups that also
+# checks the ids we did not just read from the tables), and every valid item
+# goes in with a single INSERT ... SELECT FROM unnest(...) that returns the
+# joined, formatted rows. If that INSERT fails (e.g. a malformed date), the
+# items are retried one by one under savepoints to find the culprits.
+# mode=all_or_nothing commits only when every item succeeds; best_effort
+# commits those that did. 201 when anything was created, else 422; the body
+# is BulkApplicationsOut either way.
+_BULK_MAX = 1000
+
+_BULK_CANDIDATES_EXACT_SQL = """
+    SELECT q.name, e.id
+    FROM unnest(%(names)s::text[]) AS q(name)
+    LEFT JOIN LATERAL (
+      SELECT id FROM dhi.candidates WHERE full_name = q.name LIMIT 1
+    ) e ON true;
+"""
+
+_BULK_CANDIDATES_FUZZY_SQL = """
+    SELECT q.name, COALESCE(e.id, f.id) AS id
+    FROM unnest(%(names)s::text[]) AS q(name)
+    LEFT JOIN LATERAL (
+      SELECT id FROM dhi.candidates WHERE full_name = q.name LIMIT 1
+    ) e ON true
+    LEFT JOIN LATERAL (
+      SELECT id
+      FROM dhi.candidates
+      WHERE e.id IS NULL AND lower(full_name) %% lower(q.name)
+      ORDER BY lower(full_name) <-> lower(q.name)
+      LIMIT 1
+    ) f ON true;
+"""
+
+_BULK_JOBS_EXACT_SQL = """
+    SELECT q.job_title, q.company, e.id
+    FROM unnest(%(job_titles)s::text[], %(companies)s::text[]) AS q(job_title, company)
+    LEFT JOIN LATERAL (
+      SELECT id FROM dhi.jobs WHERE job_title = q.job_title AND company = q.company LIMIT 1
+    ) e ON true;
+"""
+
+_BULK_JOBS_FUZZY_SQL = """
+    SELECT q.job_title, q.company, COALESCE(e.id, f.id) AS id
+    FROM unnest(%(job_titles)s::text[], %(companies)s::text[]) AS q(job_title, company)
+    LEFT JOIN LATERAL (
+      SELECT id FROM dhi.jobs WHERE job_title = q.job_title AND company = q.company LIMIT 1
+    ) e ON true
+    LEFT JOIN LATERAL (
+      SELECT id
+      FROM dhi.jobs
+      WHERE e.id IS NULL
+        AND (lower(job_title) %% lower(q.job_title) OR lower(company) %% lower(q.company))
+        AND (similarity(lower(job_title), lower(q.job_title))
+             + similarity(lower(company), lower(q.company))) / 2 >= %(threshold)s::float8
+      ORDER BY (lower(job_title) <-> lower(q.job_title)) + (lower(company) <-> lower(q.company))
+      LIMIT 1
+    ) f ON true;
+"""
+
+_BULK_CANDIDATE_IDS_SQL = "SELECT id FROM dhi.candidates WHERE id = ANY(%(ids)s::bigint[]);"
+_BULK_JOB_IDS_SQL = "SELECT id FROM dhi.jobs WHERE id = ANY(%(ids)s::bigint[]);"
+
+_BULK_COLUMNS = ("candidate_id", "job_id") + _APP_COLUMNS
+
+# element types for the unnest() arrays when the schema catalog has no entry
+_BULK_DEFAULT_TYPES = {
+    "candidate_id": "bigint",
+    "job_id": "bigint",
+    "status": "text",
+    "sourced_by": "text",
+    "sourced_from": "text",
+    "assigned_to": "text",
+    "applied_on": "date",
+    "interview": "timestamp with time zone",
+    "comments": "text",
+}
+
+
+class BulkApplicationsIn(BaseModel):
+    items: List[ApplicationIn] = Field(..., min_items=1, max_items=_BULK_MAX)
+    mode: str = Field("all_or_nothing", regex="^(all_or_nothing|best_effort)$")
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    ok: bool
+    application: Optional[ApplicationOut] = None
+    error: Optional[str] = None
+
+
+class BulkApplicationsOut(BaseModel):
+    mode: str
+    created: int
+    failed: int
+    items: List[BulkItemResult]
+
+
+async def _bulk_insert_sql() -> str:
+    """Multi-row INSERT from parallel arrays; array types follow the live column types (enums included)."""
+    known = await SCHEMA_CATALOG.columns("applications")
+    cols = ", ".join(_BULK_COLUMNS)
+    arrays = ", ".join(f"%({c})s::{known.get(c, _BULK_DEFAULT_TYPES[c])}[]" for c in _BULK_COLUMNS)
+    select = _WRITTEN_SELECT_SQL.rstrip().rstrip(";")
+    # identity ids are drawn in ORDER BY ord order, so ORDER BY id below
+    # returns the rows in input order
+    return f"""
+    WITH written AS (
+      INSERT INTO dhi.applications ({cols})
+      SELECT {cols}
+      FROM unnest({arrays}) WITH ORDINALITY AS t({cols}, ord)
+      ORDER BY ord
+      RETURNING *
+    )
+    {select}
+    ORDER BY a.id;"""
+
+
+async def _bulk_resolve(items: Dict[int, Dict[str, Any]]) -> Dict[int, str]:
+    """Set candidate_id/job_id on every item in place; returns index -> error for the ones that fail."""
+    names = [d["candidate_name"] for d in items.values() if d.get("candidate_id") is None]
+    pairs = [(d["job_title"], d["company"]) for d in items.values() if d.get("job_id") is None]
+
+    cand_ids: Dict[str, int] = {}
+    job_ids: Dict[Tuple[str, str], int] = {}
+    if NAME_INDEX.ready:
+        cand_ids = {
+            n: i for n, i in NAME_INDEX.resolve_candidates(names, _CANDIDATE_SIM_THRESHOLD).items() if i is not None
+        }
+        job_ids = {p: i for p, i in NAME_INDEX.resolve_jobs(pairs, _JOB_AVG_SIM_THRESHOLD).items() if i is not None}
+    left_names = [n for n in dict.fromkeys(names) if n not in cand_ids]
+    left_pairs = [p for p in dict.fromkeys(pairs) if p not in job_ids]
+
+    # explicit ids and index hits (the index may lag a delete) must still exist
+    given_cands = {d["candidate_id"] for d in items.values() if d.get("candidate_id") is not None}
+    given_jobs = {d["job_id"] for d in items.values() if d.get("job_id") is not None}
+    check_cands = sorted(given_cands | set(cand_ids.values()))
+    check_jobs = sorted(given_jobs | set(job_ids.values()))
+
+    fuzzy = await SCHEMA_CATALOG.has_extension("pg_trgm")
+    statements: List[Tuple[str, Dict[str, Any]]] = []
+    slots: Dict[str, int] = {}
+    if left_names:
+        if fuzzy:
+            statements.append((_SET_TRGM_THRESHOLD_SQL, {"threshold": str(_CANDIDATE_SIM_THRESHOLD)}))
+        slots["names"] = len(statements)
+        statements.append(
+            (_BULK_CANDIDATES_FUZZY_SQL if fuzzy else _BULK_CANDIDATES_EXACT_SQL, {"names": left_names})
+        )
+    if left_pairs:
+        params: Dict[str, Any] = {
+            "job_titles": [p[0] for p in left_pairs],
+            "companies": [p[1] for p in left_pairs],
+        }
+        if fuzzy:
+            statements.append((_SET_TRGM_THRESHOLD_SQL, {"threshold": str(_JOB_AVG_SIM_THRESHOLD)}))
+            params["threshold"] = _JOB_AVG_SIM_THRESHOLD
+        slots["pairs"] = len(statements)
+        statements.append((_BULK_JOBS_FUZZY_SQL if fuzzy else _BULK_JOBS_EXACT_SQL, params))
+    if check_cands:
+        slots["cand_ids"] = len(statements)
+        statements.append((_BULK_CANDIDATE_IDS_SQL, {"ids": check_cands}))
+    if check_jobs:
+        slots["job_ids"] = len(statements)
+        statements.append((_BULK_JOB_IDS_SQL, {"ids": check_jobs}))
+
+    results = await async_pipeline(statements, set_schema=False, prepare=True) if statements else []
+    if "names" in slots:
+        cand_ids.update({r["name"]: int(r["id"]) for r in results[slots["names"]] if r["id"] is not None})
+    if "pairs" in slots:
+        job_ids.update(
+            {(r["job_title"], r["company"]): int(r["id"]) for r in results[slots["pairs"]] if r["id"] is not None}
+        )
+    live_cands = {int(r["id"]) for r in results[slots["cand_ids"]]} if "cand_ids" in slots else set()
+    live_jobs = {int(r["id"]) for r in results[slots["job_ids"]]} if "job_ids" in slots else set()
+    # ids read from the tables in this flush exist by construction
+    live_cands |= {i for n, i in cand_ids.items() if n in left_names}
+    live_jobs |= {i for p, i in job_ids.items() if p in left_pairs}
+
+    errors: Dict[int, str] = {}
+    for idx, d in items.items():
+        cid = d.get("candidate_id")
+        if cid is None:
+            cid = cand_ids.get(d["candidate_name"])
+            if cid is None:
+                errors[idx] = f"candidate not found: {d['candidate_name']!r}"
+                continue
+        if cid not in live_cands:
+            errors[idx] = f"candidate_id {cid} does not exist"
+            continue
+        jid = d.get("job_id")
+        if jid is None:
+            jid = job_ids.get((d["job_title"], d["company"]))
+            if jid is None:
+                errors[idx] = f"job not found: {d['job_title']!r} at {d['company']!r}"
+                continue
+        if jid not in live_jobs:
+            errors[idx] = f"job_id {jid} does not exist"
+            continue
+        d["candidate_id"], d["job_id"] = cid, jid
+    return errors
+
+
+async def _fetch_all(conn: Any, sql: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async with conn.cursor(row_factory=dict_row) as cur:
+        await cur.execute(sql, params, prepare=True)
+        return await cur.fetchall()
+
+
+@router.post("/api/applications/bulk", response_model=BulkApplicationsOut, status_code=201)
+async def create_applications_bulk(payload: BulkApplicationsIn) -> JSONResponse:
+    try:
+        all_or_nothing = payload.mode == "all_or_nothing"
+        items: Dict[int, Dict[str, Any]] = {}
+        errors: Dict[int, str] = {}
+        for idx, item in enumerate(payload.items):
+            try:
+                data = item.normalized()
+            except HTTPException as e:
+                errors[idx] = str(e.detail)
+                continue
+            if data.get("candidate_id") is None and not data.get("candidate_name"):
+                errors[idx] = "candidate_id or candidate_name (existing) is required"
+            elif data.get("job_id") is None and not (data.get("job_title") and data.get("company")):
+                errors[idx] = "job_id or (job_title and company) is required"
+            else:
+                items[idx] = data
+
+        if items:
+            errors.update(await _bulk_resolve(items))
+        valid = [i for i in sorted(items) if i not in errors]
+
+        created: Dict[int, Dict[str, Any]] = {}
+        if valid and not (errors and all_or_nothing):
+            insert_sql = await _bulk_insert_sql()
+            params = {c: [items[i].get(c) for i in valid] for c in _BULK_COLUMNS}
+            async with async_transaction() as conn:
+                async with conn.transaction():
+                    try:
+                        async with conn.transaction():
+                            rows = await _fetch_all(conn, insert_sql, params)
+                        created = dict(zip(valid, rows))
+                    except psycopg.Error:
+                        # find the failing items; each one is its own savepoint
+                        single_sql = _insert_application_sql(False, False)
+                        for i in valid:
+                            try:
+                                async with conn.transaction():
+                                    rows = await _fetch_all(
+                                        conn, single_sql, {c: items[i].get(c) for c in _BULK_COLUMNS}
+                                    )
+                                created[i] = rows[0]
+                            except psycopg.Error as e:
+                                errors[i] = e.diag.message_primary or str(e)
+                    if errors and all_or_nothing:
+                        created = {}
+                        raise psycopg.Rollback()
+
+        results: List[Dict[str, Any]] = []
+        for idx in range(len(payload.items)):
+            if idx in created:
+                results.append({"index": idx, "ok": True, "application": created[idx]})
+            elif idx in errors:
+                results.append({"index": idx, "ok": False, "error": errors[idx]})
+            else:
+                results.append({"index": idx, "ok": False, "error": "not created: another item failed (all_or_nothing)"})
+        if created:
+            _invalidate_counts()
+        # rows already have the ApplicationOut shape; returning a Response skips
+        # re-validating hundreds of them through the response_model
+        return JSONResponse(
+            {
+                "mode": payload.mode,
+                "created": len(created),
+                "failed": len(results) - len(created),
+                "items": results,
+            },
+            status_code=201 if created else 422,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/api/applications/bulk failed: {e}")
+
+
 @router.put("/api/applications/{app_id}", response_model=ApplicationOut)
 async def update_application(app_id: int, payload: ApplicationIn) -> ApplicationOut:
     try:
@@ -410,88 +1332,69 @@ async def update_application(app_id: int, payload: ApplicationIn) -> Application
         ]
         incoming = _non_null_fields(payload.normalized(), allowed)
 
-        if "candidate_id" not in incoming and "candidate_name" in incoming:
-            resolved = await _resolve_candidate_id(None, incoming.get("candidate_name"))
-            if resolved is not None:
-                incoming["candidate_id"] = resolved
-
-        if "job_id" not in incoming and ("job_title" in incoming or "company" in incoming):
-            resolved_job = await _resolve_job_id(None, incoming.get("job_title"), incoming.get("company"))
-            if resolved_job is not None:
-                incoming["job_id"] = resolved_job
-
-        if not incoming:
-            rows = await async_query(
-                """
-                SELECT
-                  id, candidate_id, candidate_name, job_id, job_title, company,
-                  status, sourced_by, sourced_from, assigned_to,
-                  to_char(applied_on, 'YYYY-MM-DD') AS applied_on,
-                  to_char(interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
-                  comments
-                FROM dhi.applications_view
-                WHERE id = %(id)s
-                LIMIT 1;
-                """,
-                {"id": app_id},
-                set_schema=False,
-            )
-            if not rows:
-                raise HTTPException(status_code=404, detail="not found")
-            return rows[0]
-
         if "status" in incoming and incoming["status"] not in _ALLOWED_STATUS:
             raise HTTPException(status_code=400, detail=f"Invalid status '{incoming['status']}'")
 
-        set_parts = []
-        params: Dict[str, Any] = {}
-        for col, val in incoming.items():
-            if col in {"candidate_id", "job_id", "status", "sourced_by", "sourced_from", "assigned_to", "applied_on", "interview", "comments"}:
-                set_parts.append(f"{col} = %({col})s")
-                params[col] = val
-        if not set_parts:
-            rows = await async_query(
-                "SELECT * FROM dhi.applications_view WHERE id = %(id)s LIMIT 1;",
-                {"id": app_id},
-                set_schema=False,
-            )
+        want_candidate = "candidate_id" not in incoming and "candidate_name" in incoming
+        want_job = "job_id" not in incoming and ("job_title" in incoming or "company" in incoming)
+        # The job lookup needs both title and company; with only one the old
+        # code resolved nothing, so neither do we.
+        if want_job and not (incoming.get("job_title") and incoming.get("company")):
+            want_job = False
+        if NAME_INDEX.ready:
+            if want_candidate:
+                resolved = NAME_INDEX.resolve_candidate(incoming["candidate_name"], _CANDIDATE_SIM_THRESHOLD)
+                if resolved is not None:
+                    incoming["candidate_id"], want_candidate = resolved, False
+            if want_job:
+                resolved = NAME_INDEX.resolve_job(incoming["job_title"], incoming["company"], _JOB_AVG_SIM_THRESHOLD)
+                if resolved is not None:
+                    incoming["job_id"], want_job = resolved, False
+
+        set_cols = [c for c in ("candidate_id", "job_id") + _APP_COLUMNS if c in incoming]
+        if not set_cols and not want_candidate and not want_job:
+            rows = await _fetch_application(app_id)
             if not rows:
                 raise HTTPException(status_code=404, detail="not found")
             return rows[0]
 
-        params["id"] = app_id
-        set_sql = ", ".join(set_parts)
-
-        updated = await async_query(
-            f"""
-            UPDATE dhi.applications
-            SET {set_sql}
-            WHERE id = %(id)s
-            RETURNING id;
-            """,
-            params,
-            set_schema=False,
+        params: Dict[str, Any] = {c: incoming[c] for c in set_cols}
+        params.update(
+            id=app_id,
+            candidate_name=incoming.get("candidate_name"),
+            job_title=incoming.get("job_title"),
+            company=incoming.get("company"),
         )
-        if not updated:
-            raise HTTPException(status_code=404, detail="not found")
 
+        # One round trip: exact-match resolution, UPDATE and joined read-back
         rows = await async_query(
-            """
-            SELECT
-              id, candidate_id, candidate_name, job_id, job_title, company,
-              status, sourced_by, sourced_from, assigned_to,
-              to_char(applied_on, 'YYYY-MM-DD') AS applied_on,
-              to_char(interview,  'YYYY-MM-DD"T"HH24:MI:SSOF') AS interview,
-              comments
-            FROM dhi.applications_view
-            WHERE id = %(id)s
-            LIMIT 1;
-            """,
-            {"id": app_id},
-            set_schema=False,
+            _update_application_sql(set_cols, want_candidate, want_job), params, set_schema=False, prepare=True
         )
+        if not rows and (want_candidate or want_job):
+            # Either the id does not exist or an exact lookup missed: fall back
+            # to fuzzy matching; names that still do not resolve are ignored.
+            resolved, resolved_job = await _resolve_candidate_and_job(
+                None,
+                incoming.get("candidate_name") if want_candidate else None,
+                None,
+                incoming.get("job_title") if want_job else None,
+                incoming.get("company") if want_job else None,
+            )
+            if resolved is not None:
+                params["candidate_id"] = resolved
+                set_cols.append("candidate_id")
+            if resolved_job is not None:
+                params["job_id"] = resolved_job
+                set_cols.append("job_id")
+            if set_cols:
+                rows = await async_query(
+                    _update_application_sql(set_cols, False, False), params, set_schema=False, prepare=True
+                )
+            else:
+                rows = await _fetch_application(app_id)
         if not rows:
-            raise HTTPException(status_code=500, detail="Failed to fetch updated application")
+            raise HTTPException(status_code=404, detail="not found")
+        _invalidate_counts()
         return rows[0]
     except HTTPException:
         raise
@@ -509,6 +1412,7 @@ async def delete_application(app_id: int) -> None:
         )
         if affected == 0:
             raise HTTPException(status_code=404, detail="not found")
+        _invalidate_counts()
         return None
     except HTTPException:
         raise
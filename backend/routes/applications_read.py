@@ -0,0 +1,135 @@
+# backend/routes/applications_read.py
+# Maintenance for the applications_read table (migration 0010): the
+# denormalized copy of applications_view that /api/applications reads.
+#
+#   python -m backend.routes.applications_read check [--fix] [--show 20]
+#   python -m backend.routes.applications_read rebuild
+#
+# Triggers keep the table current; these commands exist for repairs (restored
+# backups, hand-run SQL with triggers disabled, a changed row definition).
+# `check` compares every row with applications_read_source in one snapshot and
+# exits 1 when anything differs (after --fix: when anything is left). `rebuild`
+# replaces the contents in one transaction; readers keep seeing the old rows
+# until it commits, writers to applications/candidates/jobs wait.
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+import psycopg
+
+from .db_connection import DSN, _schema_sql
+
+COLUMNS = (
+    "id",
+    "candidate_id",
+    "candidate_name",
+    "job_id",
+    "job_title",
+    "company",
+    "status",
+    "sourced_by",
+    "sourced_from",
+    "assigned_to",
+    "applied_on",
+    "applied_on_text",
+    "interview_text",
+    "comments",
+)
+
+_COLS = ", ".join(COLUMNS)
+_DATA_COLS = [c for c in COLUMNS if c != "id"]
+
+_DIFF_SQL = f"""
+SELECT COALESCE(s.id, r.id) AS id,
+       CASE WHEN r.id IS NULL THEN 'missing'
+            WHEN s.id IS NULL THEN 'orphan'
+            ELSE 'stale' END AS problem
+FROM applications_read_source s
+FULL JOIN applications_read r ON r.id = s.id
+WHERE r.id IS NULL
+   OR s.id IS NULL
+   OR ({", ".join("s." + c for c in _DATA_COLS)}) IS DISTINCT FROM
+      ({", ".join("r." + c for c in _DATA_COLS)})
+ORDER BY 1;
+"""
+
+_UPSERT_SQL = f"""
+INSERT INTO applications_read ({_COLS})
+SELECT {_COLS} FROM applications_read_source WHERE id = ANY(%s)
+ON CONFLICT (id) DO UPDATE SET
+    {", ".join(f"{c} = EXCLUDED.{c}" for c in _DATA_COLS)};
+"""
+
+
+def check(fix: bool = False) -> Dict[str, List[int]]:
+    """Ids per problem ('missing', 'orphan', 'stale'). With fix=True they are repaired."""
+    found: Dict[str, List[int]] = {"missing": [], "orphan": [], "stale": []}
+    with psycopg.connect(DSN) as conn:
+        if fix:
+            conn.execute(_schema_sql())
+            # no writer may slip in between the diff and the repair
+            conn.execute("LOCK TABLE applications, candidates, jobs IN SHARE MODE;")
+        else:
+            conn.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY;")
+            conn.execute(_schema_sql())
+        for app_id, problem in conn.execute(_DIFF_SQL).fetchall():
+            found[problem].append(int(app_id))
+        if fix:
+            repair = found["missing"] + found["stale"]
+            if repair:
+                conn.execute(_UPSERT_SQL, (repair,))
+            if found["orphan"]:
+                conn.execute("DELETE FROM applications_read WHERE id = ANY(%s);", (found["orphan"],))
+        conn.commit()
+    return found
+
+
+def rebuild() -> int:
+    """Recreate every row from applications_read_source; returns the row count."""
+    with psycopg.connect(DSN) as conn:
+        conn.execute(_schema_sql())
+        conn.execute("LOCK TABLE applications, candidates, jobs IN SHARE MODE;")
+        conn.execute("DELETE FROM applications_read;")
+        n = conn.execute(f"INSERT INTO applications_read ({_COLS}) SELECT {_COLS} FROM applications_read_source;").rowcount
+        conn.commit()
+    with psycopg.connect(DSN, autocommit=True) as conn:
+        conn.execute(_schema_sql())
+        conn.execute("VACUUM (ANALYZE) applications_read;")
+    return n
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="Check or rebuild dhi.applications_read")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    chk = sub.add_parser("check", help="compare applications_read with its source rows")
+    chk.add_argument("--fix", action="store_true", help="repair the rows that differ")
+    chk.add_argument("--show", type=int, default=20, help="ids to print per problem")
+    sub.add_parser("rebuild", help="recreate every row")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "rebuild":
+        print(f"[read-model] rebuilt applications_read: {rebuild()} rows")
+        return
+
+    found = check(fix=args.fix)
+    total = sum(len(ids) for ids in found.values())
+    for problem, ids in found.items():
+        if ids:
+            more = f" (+{len(ids) - args.show} more)" if len(ids) > args.show else ""
+            print(f"[read-model] {problem}: {len(ids)} -> {ids[:args.show]}{more}")
+    if not total:
+        print("[read-model] applications_read is consistent")
+    elif args.fix:
+        print(f"[read-model] repaired {total} rows")
+        left = check()
+        if any(left.values()):
+            print(f"[read-model] still inconsistent: {sum(len(v) for v in left.values())} rows")
+            sys.exit(1)
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
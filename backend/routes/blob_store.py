@@ -0,0 +1,258 @@
+# backend/routes/blob_store.py
+# Content-addressed blob storage for resumes (keyed by SHA-256 hex digest).
+# Identical uploads are stored once. The local filesystem backend is the
+# default; other backends subclass BlobStore/BlobWriter (abstract: a missing
+# method fails at instantiation), register a factory in _BACKENDS and are
+# selected with RESUME_STORE=<name>.
+#
+# References: a blob is shared by every candidates row with its digest, so it
+# may only go once no row points at it. Everything that places a blob and
+# points a row at it, and everything that drops a reference, holds the digest's
+# advisory lock (lock_digest) for that transaction; release_resume_blob() then
+# deletes the file only if no row references it under the same lock.
+from __future__ import annotations
+
+import abc
+import asyncio
+import hashlib
+import os
+import pathlib
+import tempfile
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from .db_connection import _env, async_transaction
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobWriter(abc.ABC):
+    """
+    Incremental upload: write() chunks as they arrive, then commit() to get
+    (digest, size) or abort() to discard. The digest is computed on the fly.
+    """
+
+    @abc.abstractmethod
+    async def write(self, chunk: bytes) -> None: ...
+
+    @property
+    @abc.abstractmethod
+    def size(self) -> int: ...
+
+    @abc.abstractmethod
+    def digest(self) -> str:
+        """Hex digest of everything written so far (known before commit)."""
+
+    @abc.abstractmethod
+    async def commit(self) -> Tuple[str, int]: ...
+
+    @abc.abstractmethod
+    async def abort(self) -> None: ...
+
+
+class BlobStore(abc.ABC):
+    """Interface every backend implements. Digests are lowercase hex SHA-256."""
+
+    @abc.abstractmethod
+    def open_writer(self) -> BlobWriter: ...
+
+    async def put_bytes(self, data: bytes) -> Tuple[str, int]:
+        w = self.open_writer()
+        try:
+            for i in range(0, len(data), CHUNK_SIZE):
+                await w.write(data[i:i + CHUNK_SIZE])
+            return await w.commit()
+        except BaseException:
+            await w.abort()
+            raise
+
+    @abc.abstractmethod
+    async def exists(self, digest: str) -> bool: ...
+
+    @abc.abstractmethod
+    async def size(self, digest: str) -> Optional[int]: ...
+
+    @abc.abstractmethod
+    def iter_chunks(
+        self, digest: str, chunk_size: int = CHUNK_SIZE, start: int = 0, length: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield bytes [start, start+length) (to the end when length is None)."""
+
+    @abc.abstractmethod
+    async def delete(self, digest: str) -> None:
+        """Remove the blob outright; callers go through release_resume_blob()."""
+
+
+def _check_digest(digest: str) -> str:
+    d = (digest or "").lower()
+    if len(d) != 64 or any(ch not in "0123456789abcdef" for ch in d):
+        raise ValueError(f"Invalid blob digest: {digest!r}")
+    return d
+
+
+class _LocalFSWriter(BlobWriter):
+    def __init__(self, store: "LocalFSBlobStore") -> None:
+        self._store = store
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._fh = None
+        self._tmp: Optional[str] = None
+
+    def _open_sync(self) -> None:
+        tmp_dir = self._store.root / ".tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(dir=tmp_dir, prefix="upload-")
+        self._fh = os.fdopen(fd, "wb")
+
+    def _write_sync(self, chunk: bytes) -> None:
+        if self._fh is None:
+            self._open_sync()
+        self._fh.write(chunk)
+
+    async def write(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self._hash.update(chunk)
+        self._size += len(chunk)
+        await asyncio.to_thread(self._write_sync, chunk)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def digest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _commit_sync(self) -> str:
+        if self._fh is None:
+            self._open_sync()
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._fh.close()
+        digest = self._hash.hexdigest()
+        path = self._store._path(digest)
+        if path.exists():
+            os.unlink(self._tmp)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp, path)
+        self._tmp = None
+        return digest
+
+    async def commit(self) -> Tuple[str, int]:
+        digest = await asyncio.to_thread(self._commit_sync)
+        return digest, self._size
+
+    def _abort_sync(self) -> None:
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
+        if self._tmp is not None:
+            try:
+                os.unlink(self._tmp)
+            except FileNotFoundError:
+                pass
+            self._tmp = None
+
+    async def abort(self) -> None:
+        await asyncio.to_thread(self._abort_sync)
+
+
+class LocalFSBlobStore(BlobStore):
+    """
+    Files under <root>/<d[:2]>/<d[2:4]>/<digest>. Uploads go to <root>/.tmp
+    first and are renamed into place once the digest is known.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = pathlib.Path(root)
+
+    def _path(self, digest: str) -> pathlib.Path:
+        d = _check_digest(digest)
+        return self.root / d[:2] / d[2:4] / d
+
+    def open_writer(self) -> BlobWriter:
+        return _LocalFSWriter(self)
+
+    async def exists(self, digest: str) -> bool:
+        return await asyncio.to_thread(self._path(digest).exists)
+
+    async def size(self, digest: str) -> Optional[int]:
+        def _size() -> Optional[int]:
+            try:
+                return self._path(digest).stat().st_size
+            except FileNotFoundError:
+                return None
+        return await asyncio.to_thread(_size)
+
+    async def iter_chunks(
+        self, digest: str, chunk_size: int = CHUNK_SIZE, start: int = 0, length: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        fh = await asyncio.to_thread(open, self._path(digest), "rb")
+        try:
+            if start:
+                await asyncio.to_thread(fh.seek, start)
+            remaining = length
+            while remaining is None or remaining > 0:
+                n = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(fh.read, n)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            fh.close()
+
+    async def delete(self, digest: str) -> None:
+        def _unlink() -> None:
+            try:
+                self._path(digest).unlink()
+            except FileNotFoundError:
+                pass
+        await asyncio.to_thread(_unlink)
+
+
+_DEFAULT_ROOT = str(pathlib.Path(__file__).resolve().parent.parent / "var" / "resumes")
+
+_BACKENDS: Dict[str, Callable[[], BlobStore]] = {
+    "local": lambda: LocalFSBlobStore(_env("RESUME_STORE_DIR", _DEFAULT_ROOT)),
+}
+
+_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    global _store
+    if _store is None:
+        name = _env("RESUME_STORE", "local").lower()
+        factory = _BACKENDS.get(name)
+        if factory is None:
+            raise RuntimeError(f"Unknown RESUME_STORE backend: {name!r}")
+        _store = factory()
+    return _store
+
+
+# ---------- references ----------
+def _lock_key(digest: str) -> int:
+    # first 60 bits of the digest: a positive bigint, spread like the digest
+    return int(_check_digest(digest)[:15], 16)
+
+
+async def lock_digest(conn: Any, digest: str) -> None:
+    """Hold `digest`'s reference lock until conn's transaction ends."""
+    await conn.execute("SELECT pg_advisory_xact_lock(%s);", (_lock_key(digest),))
+
+
+async def release_resume_blob(digest: Optional[str]) -> bool:
+    """
+    Call after a change that dropped a reference to `digest` has committed.
+    Deletes the blob when no candidates row points at it; returns whether it did.
+    """
+    if not digest:
+        return False
+    async with async_transaction() as conn:
+        await lock_digest(conn, digest)
+        cur = await conn.execute("SELECT 1 FROM candidates WHERE resume_sha256 = %s LIMIT 1;", (digest,))
+        if await cur.fetchone() is not None:
+            return False
+        await get_blob_store().delete(digest)
+    return True
@@ -1,12 +1,15 @@
 # backend/routes/candidates.py
 from __future__ import annotations
 
+import base64
 import json
-from typing import Optional, Dict, Any, List, Tuple
+import time
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 from datetime import datetime, date
 
 from fastapi import (
     APIRouter,
+    Header,
     HTTPException,
     status,
     UploadFile,
@@ -14,15 +17,46 @@ from fastapi import (
     Form,
     Query,
 )
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field, EmailStr, validator
-from starlette.responses import StreamingResponse
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 # DB helpers (relative import)
 # db_connection.py must export: async_query, async_exec, get_async_pool, close_async_pool
-from .db_connection import async_query, async_exec, get_async_pool, close_async_pool
+from .blob_store import CHUNK_SIZE, get_blob_store, lock_digest, release_resume_blob
+from .db_connection import async_query, async_exec, async_transaction, get_async_pool, close_async_pool, _env
+from .name_index import NAME_INDEX
+from .schema_catalog import SCHEMA_CATALOG
 
 
-router = APIRouter(tags=["candidates"])
+class _BoundedUploadRoute(APIRoute):
+    """
+    413 for multipart requests whose Content-Length already exceeds the resume
+    limit, before FastAPI parses (and spools) the form. Chunked requests carry
+    no length; they are cut off by the streaming check in _upsert_resume_inline.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def bounded(request: Request) -> Response:
+            if request.headers.get("content-type", "").startswith("multipart/"):
+                try:
+                    length = int(request.headers.get("content-length") or 0)
+                except ValueError:
+                    length = 0
+                if length > RESUME_MAX_BYTES + _FORM_OVERHEAD_BYTES:
+                    return JSONResponse(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        content={"detail": f"Resume exceeds {RESUME_MAX_BYTES} bytes"},
+                    )
+            return await handler(request)
+
+        return bounded
+
+
+router = APIRouter(tags=["candidates"], route_class=_BoundedUploadRoute)
 
 # -----------------------
 # Helpers to open pool (small wrapper)
@@ -238,38 +272,16 @@ def _pick_params_for_write(d: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 # -----------------------
-# Lifecycle / migration helpers
+# Lifecycle
 # -----------------------
-async def _ensure_optional_columns_and_resume() -> None:
-    """
-    Add optional columns (source, notes, company) and inline resume columns if they don't exist.
-    Idempotent; safe to run on startup.
-    """
-    try:
-        await async_exec(
-            """
-            ALTER TABLE candidates
-              ADD COLUMN IF NOT EXISTS source TEXT,
-              ADD COLUMN IF NOT EXISTS notes  TEXT,
-              ADD COLUMN IF NOT EXISTS company TEXT,
-              ADD COLUMN IF NOT EXISTS resume_data BYTEA,
-              ADD COLUMN IF NOT EXISTS resume_filename TEXT,
-              ADD COLUMN IF NOT EXISTS resume_mime_type TEXT,
-              ADD COLUMN IF NOT EXISTS resume_size_bytes INT,
-              ADD COLUMN IF NOT EXISTS resume_url TEXT;
-            """,
-            {},
-        )
-    except Exception as e:
-        print(f"[candidates] ensure optional columns failed: {e}")
-
+# Optional columns (source, notes, company, resume_*) are added by
+# backend/migrations/0002_candidates_optional_columns.sql.
 async def startup_candidates() -> None:
     try:
         await open_async_pool()
         # quick ping - use public/default connection (don't set schema here)
         await async_query("SELECT 1 AS ok;", params=None, set_schema=False)
-        await _ensure_optional_columns_and_resume()
-        print("[candidates] DB ping OK & optional columns ensured")
+        print("[candidates] DB ping OK")
     except Exception as e:
         print(f"[candidates] startup DB error: {e}")
         # re-raise so uvicorn startup fails if you want it to fail hard:
@@ -318,34 +330,6 @@ COLS_READ_FULL = """
     created_at
 """
 
-# -----------------------
-# Utility: column exists
-# -----------------------
-async def _column_exists(table: str, column: str) -> bool:
-    """
-    Check whether a column exists on the given table in the *current schema*.
-    Works without raising on installations where the column is missing.
-    """
-    try:
-        rows = await async_query(
-            """
-            SELECT 1
-            FROM information_schema.columns
-            WHERE table_schema = current_schema()
-              AND table_name = %(t)s
-              AND column_name = %(c)s
-            LIMIT 1;
-            """,
-            {"t": table, "c": column},
-            # don't force schema here; information_schema is global
-            set_schema=False,
-        )
-        return bool(rows)
-    except Exception as e:
-        # If information_schema is restricted for some reason, fail closed (no column)
-        print(f"[candidates] _column_exists error: {e}")
-        return False
-
 # -----------------------
 # Options endpoint for Applications page
 # -----------------------
@@ -359,7 +343,7 @@ async def candidate_options() -> List[Dict[str, Any]]:
       - company (NULL if column doesn't exist)
     """
     try:
-        has_company = await _column_exists("candidates", "company")
+        has_company = await SCHEMA_CATALOG.has_column("candidates", "company")
 
         if has_company:
             rows = await async_query(
@@ -368,7 +352,8 @@ async def candidate_options() -> List[Dict[str, Any]]:
                 FROM candidates
                 ORDER BY full_name ASC NULLS LAST
                 LIMIT 5000;
-                """
+                """,
+                read_only=True,
             )
         else:
             rows = await async_query(
@@ -377,13 +362,158 @@ async def candidate_options() -> List[Dict[str, Any]]:
                 FROM candidates
                 ORDER BY full_name ASC NULLS LAST
                 LIMIT 5000;
-                """
+                """,
+                read_only=True,
             )
 
         return rows
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/api/candidates/options failed: {e}")
 
+# -----------------------
+# Pagination, filtering and sorting
+# -----------------------
+# Filters and sort keys are whitelisted and compiled to parameterised SQL over
+# plain candidates columns (COLS_READ_FULL aliases are never referenced).
+# Indexes: migrations 0004 (created_at, id) and 0005 (status/lookup/GIN).
+#
+# Order is `<sort> <dir>, id <dir>` with Postgres' default NULL placement
+# (NULLs sort as largest), which keeps the old COALESCE(created_at, NOW()) order
+# for the default created_at DESC. `after` cursors are opaque: urlsafe base64 of
+# [sort key, last value, last id].
+_SORTABLE: Dict[str, str] = {
+    "created_at": "created_at",
+    "full_name": "full_name",
+    "work_experience": "work_experience",
+    "id": "id",
+}
+
+def _encode_cursor(sort_key: str, value: Any, cid: int) -> str:
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    raw = json.dumps([sort_key, value, int(cid)])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def _decode_cursor(token: str, sort_key: str) -> Tuple[Any, int]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        key, value, cid = json.loads(raw)
+        if key != sort_key:
+            raise ValueError("cursor belongs to a different sort")
+        if key == "created_at" and value is not None:
+            value = datetime.fromisoformat(value)
+        return value, int(cid)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid 'after' cursor")
+
+def _multi(values: Optional[List[str]]) -> List[str]:
+    """Accept both ?k=a&k=b and ?k=a,b."""
+    out: List[str] = []
+    for v in values or []:
+        out.extend(_as_list(v))
+    return out
+
+def _compile_candidate_filters(
+    status: Optional[List[str]] = None,
+    company: Optional[str] = None,
+    job_position: Optional[str] = None,
+    city: Optional[str] = None,
+    pincode: Optional[str] = None,
+    exp_min: Optional[int] = None,
+    exp_max: Optional[int] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    languages: Optional[List[str]] = None,
+    employment_types: Optional[List[str]] = None,
+) -> Tuple[List[str], Dict[str, Any]]:
+    where: List[str] = []
+    params: Dict[str, Any] = {}
+
+    statuses = sorted({_map_status_to_enum(s) for s in _multi(status)})
+    if statuses:
+        where.append("status = ANY(%(f_status)s)")
+        params["f_status"] = statuses
+    for col, val in (("company", company), ("job_position", job_position), ("city", city)):
+        if val and val.strip():
+            where.append(f"lower({col}) = lower(%(f_{col})s)")
+            params[f"f_{col}"] = val.strip()
+    if pincode and pincode.strip():
+        where.append("pincode = %(f_pincode)s")
+        params["f_pincode"] = pincode.strip()
+    if exp_min is not None:
+        where.append("work_experience >= %(f_exp_min)s")
+        params["f_exp_min"] = exp_min
+    if exp_max is not None:
+        where.append("work_experience <= %(f_exp_max)s")
+        params["f_exp_max"] = exp_max
+    if created_from is not None:
+        where.append("created_at >= %(f_created_from)s")
+        params["f_created_from"] = created_from
+    if created_to is not None:
+        # inclusive calendar day
+        where.append("created_at < %(f_created_to)s::date + 1")
+        params["f_created_to"] = created_to
+    langs = _multi(languages)
+    if langs:
+        where.append("select_languages @> %(f_languages)s::text[]")
+        params["f_languages"] = langs
+    emp = _multi(employment_types)
+    if emp:
+        where.append("preferred_employment_types @> %(f_employment_types)s::text[]")
+        params["f_employment_types"] = emp
+    return where, params
+
+def _keyset_clause(col: str, descending: bool, value: Any) -> str:
+    """Rows strictly after (value, id) in `col <dir>, id <dir>` order (NULLs largest)."""
+    if descending:
+        if value is None:
+            return f"(({col} IS NULL AND id < %(after_id)s) OR {col} IS NOT NULL)"
+        return f"({col}, id) < (%(after_value)s, %(after_id)s)"
+    if value is None:
+        return f"({col} IS NULL AND id > %(after_id)s)"
+    return f"(({col}, id) > (%(after_value)s, %(after_id)s) OR {col} IS NULL)"
+
+# Exact counts are cached per process and per filter; every successful insert,
+# update or delete through this router invalidates the cache.
+_COUNT_TTL_SECONDS = float(_env("CANDIDATES_COUNT_TTL", "30"))
+_COUNT_CACHE_MAX = 256
+_count_cache: Dict[Any, Tuple[float, int]] = {}
+
+def _invalidate_count() -> None:
+    _count_cache.clear()
+
+def _cache_key(where_sql: str, params: Dict[str, Any]) -> Any:
+    return (where_sql, tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())))
+
+async def _candidate_total(mode: str, where_sql: str, params: Dict[str, Any]) -> Optional[int]:
+    if mode == "none":
+        return None
+    if mode == "estimate":
+        if not where_sql:
+            rows = await async_query(
+                "SELECT reltuples::bigint AS n FROM pg_class WHERE oid = 'candidates'::regclass;",
+                read_only=True,
+            )
+            n = int(rows[0]["n"]) if rows else -1
+        else:
+            rows = await async_query(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM candidates {where_sql};", params, read_only=True)
+            plan = rows[0]["QUERY PLAN"] if rows else None
+            n = int(plan[0]["Plan"]["Plan Rows"]) if plan else -1
+        if n >= 0:  # reltuples is -1 until the table has been analyzed
+            return n
+
+    key = _cache_key(where_sql, params)
+    now = time.monotonic()
+    hit = _count_cache.get(key)
+    if hit is not None and now - hit[0] <= _COUNT_TTL_SECONDS:
+        return hit[1]
+    rows = await async_query(f"SELECT COUNT(*) AS n FROM candidates {where_sql};", params, read_only=True)
+    n = int(rows[0]["n"]) if rows else 0
+    if len(_count_cache) >= _COUNT_CACHE_MAX:
+        _count_cache.clear()
+    _count_cache[key] = (now, n)
+    return n
+
 # -----------------------
 # Routes
 # -----------------------
@@ -391,30 +521,86 @@ async def candidate_options() -> List[Dict[str, Any]]:
 async def list_candidates(
     page: int = Query(1, ge=1),
     page_size: int = Query(100, ge=1, le=1000),
+    after: Optional[str] = Query(None, description="Cursor from a previous response's next_after"),
+    count: str = Query("cached", regex="^(cached|estimate|none)$"),
+    sort: str = Query("created_at", description="created_at | full_name | work_experience | id"),
+    order: str = Query("desc", regex="^(asc|desc)$"),
+    status_: Optional[List[str]] = Query(None, alias="status"),
+    company: Optional[str] = None,
+    job_position: Optional[str] = None,
+    city: Optional[str] = None,
+    pincode: Optional[str] = None,
+    exp_min: Optional[int] = Query(None, ge=0),
+    exp_max: Optional[int] = Query(None, ge=0),
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    languages: Optional[List[str]] = Query(None, description="all of these (select_languages @>)"),
+    employment_types: Optional[List[str]] = Query(None, description="all of these (preferred_employment_types @>)"),
 ) -> Dict[str, Any]:
     try:
-        offset = (page - 1) * page_size
-        total_rows = await async_query("SELECT COUNT(*) AS n FROM candidates;")
-        total = int(total_rows[0]["n"]) if total_rows else 0
+        sort_col = _SORTABLE.get(sort)
+        if sort_col is None:
+            raise HTTPException(status_code=400, detail=f"Invalid sort '{sort}'")
+        descending = order == "desc"
+        direction = "DESC" if descending else "ASC"
+
+        where, params = _compile_candidate_filters(
+            status=status_,
+            company=company,
+            job_position=job_position,
+            city=city,
+            pincode=pincode,
+            exp_min=exp_min,
+            exp_max=exp_max,
+            created_from=created_from,
+            created_to=created_to,
+            languages=languages,
+            employment_types=employment_types,
+        )
+        filter_sql = ("WHERE " + " AND ".join(where)) if where else ""
+        filter_params = dict(params)
+
+        params.update({"limit": page_size, "offset": (page - 1) * page_size})
+        if after:
+            after_value, after_id = _decode_cursor(after, sort)
+            where.append(_keyset_clause(sort_col, descending, after_value))
+            params.update({"offset": 0, "after_value": after_value, "after_id": after_id})
+        page_sql = ("WHERE " + " AND ".join(where)) if where else ""
+
+        total = await _candidate_total(count, filter_sql, filter_params)
 
         rows = await async_query(
             f"""
             SELECT
                 {COLS_READ_FULL},
-                CASE WHEN resume_data IS NOT NULL THEN id::text ELSE NULL END AS resume_url
+                {sort_col} AS _sort_value,
+                CASE WHEN resume_sha256 IS NOT NULL OR resume_data IS NOT NULL
+                     THEN id::text ELSE NULL END AS resume_url
             FROM candidates
-            ORDER BY COALESCE(created_at, NOW()) DESC, id DESC
+            {page_sql}
+            ORDER BY {sort_col} {direction}, id {direction}
             LIMIT %(limit)s OFFSET %(offset)s;
             """,
-            {"limit": page_size, "offset": offset},
+            params,
+            read_only=True,
         )
 
+        next_after = None
+        if len(rows) == page_size:
+            last = rows[-1]
+            next_after = _encode_cursor(sort, last.get("_sort_value"), last["id"])
+        for r in rows:
+            r.pop("_sort_value", None)
+
         return {
             "items": rows,
             "page": page,
             "page_size": page_size,
             "total": total,
+            "next_after": next_after,
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/api/candidates failed: {e}")
 
@@ -431,6 +617,7 @@ async def get_candidate(candidate_id: int):
             LIMIT 1;
             """,
             {"id": candidate_id},
+            prepare=True,
         )
         if not rows:
             raise HTTPException(status_code=404, detail="Candidate not found")
@@ -458,6 +645,9 @@ async def update_candidate(candidate_id: int, payload: CandidateIn):
             )
             if affected == 0:
                 raise HTTPException(status_code=404, detail="Candidate not found")
+            _invalidate_count()
+            if "full_name" in params:
+                NAME_INDEX.upsert_candidate(candidate_id, params["full_name"])
         return {"ok": True}
     except HTTPException:
         raise
@@ -474,6 +664,7 @@ async def update_candidate_status(candidate_id: int, payload: Dict[str, str]):
         )
         if affected == 0:
             raise HTTPException(status_code=404, detail="Candidate not found")
+        _invalidate_count()
         return {"ok": True}
     except HTTPException:
         raise
@@ -483,9 +674,15 @@ async def update_candidate_status(candidate_id: int, payload: Dict[str, str]):
 @router.delete("/api/candidates/{candidate_id}")
 async def delete_candidate(candidate_id: int):
     try:
-        affected = await async_exec("DELETE FROM candidates WHERE id = %(id)s;", {"id": candidate_id})
-        if affected == 0:
+        rows = await async_query(
+            "DELETE FROM candidates WHERE id = %(id)s RETURNING resume_sha256;", {"id": candidate_id}
+        )
+        if not rows:
             raise HTTPException(status_code=404, detail="Candidate not found")
+        _invalidate_count()
+        NAME_INDEX.remove_candidate(candidate_id)
+        # the resume file goes too, unless another candidate has the same one
+        await release_resume_blob(rows[0]["resume_sha256"])
         return {"ok": True}
     except HTTPException:
         raise
@@ -493,37 +690,102 @@ async def delete_candidate(candidate_id: int):
         raise HTTPException(status_code=500, detail=f"/api/candidates/{candidate_id} delete failed: {e}")
 
 # -----------------------
-# Multipart / resume inline
+# Multipart / resume upload
 # -----------------------
+# The file goes to the content-addressed blob store (blob_store.py); the row
+# keeps only its digest and metadata. Rows still carrying resume_data are moved
+# by resume_backfill.py and served inline until then.
+#
+# Uploads are copied in CHUNK_SIZE pieces, so memory per request stays at one
+# chunk whatever the file size; anything over RESUME_MAX_BYTES gets a 413.
+# Requests whose Content-Length is already over the limit are refused before
+# the form is parsed (_BoundedUploadRoute); chunked ones once the part is read.
+RESUME_MAX_BYTES = int(_env("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+# room for the `data` JSON field and multipart framing next to the file
+_FORM_OVERHEAD_BYTES = 256 * 1024
+
+_DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+_RESUME_MIMES = ("application/pdf", "application/msword", _DOCX_MIME, "application/octet-stream")
+
+def _sniff_mime(head: bytes) -> str:
+    """Content type from the leading bytes; the client-declared type is not trusted."""
+    if head.startswith(b"%PDF-"):
+        return "application/pdf"
+    if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):  # OLE2 (.doc)
+        return "application/msword"
+    if head.startswith(b"PK\x03\x04"):  # zip container (.docx)
+        return _DOCX_MIME
+    return "application/octet-stream"
+
+def _resume_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Resume exceeds {RESUME_MAX_BYTES} bytes",
+    )
+
+def _check_resume_size(file: Optional[UploadFile]) -> None:
+    """Reject before touching the DB when the spooled part's size is over the limit."""
+    if file is not None and file.size is not None and file.size > RESUME_MAX_BYTES:
+        raise _resume_too_large()
+
 async def _upsert_resume_inline(candidate_id: int, file: UploadFile) -> None:
     fname = (file.filename or "resume").strip()
-    ctype = (file.content_type or "application/octet-stream").strip().lower()
-    if ctype not in (
-        "application/pdf",
-        "application/msword",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "application/octet-stream",
-    ):
-        ctype = "application/octet-stream"
-
-    data = await file.read()
-    if not data:
-        raise HTTPException(status_code=400, detail="Empty file upload")
-
-    await async_exec(
-        """
-        UPDATE candidates
-        SET
-            resume_data        = %(bytes)s,
-            resume_filename    = %(fn)s,
-            resume_mime_type   = %(ct)s,
-            resume_size_bytes  = %(size)s,
-            resume_url         = NULL,
-            updated_at         = NOW()
-        WHERE id = %(id)s;
-        """,
-        {"id": candidate_id, "fn": fname, "ct": ctype, "bytes": data, "size": len(data)},
-    )
+    declared = (file.content_type or "application/octet-stream").strip().lower()
+    if declared not in _RESUME_MIMES:
+        declared = "application/octet-stream"
+
+    writer = get_blob_store().open_writer()
+    ctype = declared
+    placed: Optional[str] = None
+    try:
+        while True:
+            chunk = await file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if writer.size == 0:
+                ctype = _sniff_mime(chunk)
+            if writer.size + len(chunk) > RESUME_MAX_BYTES:
+                raise _resume_too_large()
+            await writer.write(chunk)
+        if writer.size == 0:
+            raise HTTPException(status_code=400, detail="Empty file upload")
+        # Place the blob and point the row at it under the digest's lock, so a
+        # concurrent release of the same digest cannot delete it in between.
+        async with async_transaction() as conn:
+            await lock_digest(conn, writer.digest())
+            digest, size = await writer.commit()
+            placed = digest
+            cur = await conn.execute(
+                """
+                UPDATE candidates AS c
+                SET
+                    resume_sha256      = %(digest)s,
+                    resume_data        = NULL,
+                    resume_filename    = %(fn)s,
+                    resume_mime_type   = %(ct)s,
+                    resume_size_bytes  = %(size)s,
+                    resume_url         = NULL,
+                    updated_at         = NOW()
+                FROM (SELECT id, resume_sha256 FROM candidates WHERE id = %(id)s FOR UPDATE) AS old
+                WHERE c.id = old.id
+                RETURNING old.resume_sha256;
+                """,
+                {"id": candidate_id, "fn": fname, "ct": ctype, "digest": digest, "size": size},
+            )
+            row = await cur.fetchone()
+    except BaseException:
+        await writer.abort()
+        if placed is not None:
+            try:
+                await release_resume_blob(placed)  # the row update rolled back
+            except Exception as e:
+                print(f"[resumes] could not release blob {placed}: {e}")
+        raise
+
+    if row is None:
+        await release_resume_blob(digest)  # candidate vanished meanwhile
+    elif row[0] and row[0] != digest:
+        await release_resume_blob(row[0])  # replaced resume
 
 @router.post("/api/candidates", status_code=status.HTTP_201_CREATED)
 async def create_candidate_multipart(
@@ -546,6 +808,7 @@ async def create_candidate_multipart(
         missing = [k for k in required_keys if not parsed.get(k)]
         if missing:
             raise HTTPException(status_code=400, detail=f"Missing required fields: {', '.join(missing)}")
+        _check_resume_size(resume)
 
         params = _pick_params_for_write(parsed)
         cols = ", ".join(params.keys())
@@ -557,6 +820,8 @@ async def create_candidate_multipart(
         if not rows:
             raise HTTPException(status_code=500, detail="Insert failed")
         cid = int(rows[0]["id"])
+        _invalidate_count()
+        NAME_INDEX.upsert_candidate(cid, params.get("full_name"))
 
         if resume is not None:
             await _upsert_resume_inline(cid, resume)
@@ -575,6 +840,7 @@ async def update_candidate_multipart(
 ):
     try:
         parsed = _parse_data_json(data)
+        _check_resume_size(resume)
         params = _pick_params_for_write(parsed)
         params["id"] = candidate_id
 
@@ -587,6 +853,9 @@ async def update_candidate_multipart(
             )
             if affected == 0:
                 raise HTTPException(status_code=404, detail="Candidate not found")
+            _invalidate_count()
+            if "full_name" in params:
+                NAME_INDEX.upsert_candidate(candidate_id, params["full_name"])
 
         if resume is not None:
             await _upsert_resume_inline(candidate_id, resume)
@@ -597,17 +866,110 @@ async def update_candidate_multipart(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/api/candidates/{candidate_id} (multipart PUT) failed: {e}")
 
+# -----------------------
+# Resume download
+# -----------------------
+# Strong ETag = content digest, so If-None-Match answers 304 without reading
+# the file, and a single Range ("bytes=a-b", "bytes=a-", "bytes=-n") answers 206.
+# Multi-range requests are served as a plain 200, which RFC 9110 allows.
+# Rows not yet moved by resume_backfill are read with substring() slices from
+# the primary; their ETag is built from id, size and updated_at (hashing the
+# bytea would read all of it on every request, 304s included). The backfill
+# does not touch updated_at, so a row it moves mid-stream is finished from the
+# blob store; any other change mid-stream aborts the response.
+_DB_CHUNK_SIZE = 256 * 1024
+
+def _parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) inclusive for a single satisfiable byte range; None to serve
+    the whole file. Raises 416 when the range cannot be satisfied.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first == "":
+            n = int(last)
+            if n < 0:
+                raise ValueError
+            # bytes=-0 asks for nothing: start = size, so 416 below
+            start, end = (max(size - n, 0), size - 1) if n else (size, size - 1)
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if start < size and (start < 0 or end < start):
+                return None
+            end = min(end, size - 1)
+    except ValueError:
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tags = [t.strip() for t in header.split(",")]
+    return etag in tags or f"W/{etag}" in tags
+
+async def _iter_inline_resume(
+    candidate_id: int, start: int, length: int, updated_at: Optional[datetime]
+) -> AsyncIterator[bytes]:
+    """Legacy rows: stream resume_data slice by slice instead of selecting the whole bytea."""
+    pos, end = start, start + length
+    while pos < end:
+        n = min(_DB_CHUNK_SIZE, end - pos)
+        # not read_only: a replica may lag behind the row the headers came from
+        rows = await async_query(
+            """
+            SELECT substring(resume_data FROM %(off)s FOR %(n)s) AS part, resume_sha256
+            FROM candidates
+            WHERE id = %(id)s AND updated_at IS NOT DISTINCT FROM %(at)s;
+            """,
+            {"id": candidate_id, "off": pos + 1, "n": n, "at": updated_at},
+            prepare=True,
+        )
+        part = rows[0]["part"] if rows else None
+        if part:
+            yield bytes(part)
+            pos += len(part)
+            continue
+        if rows and rows[0]["resume_sha256"]:
+            # moved by resume_backfill: same bytes, now in the blob store
+            async for chunk in get_blob_store().iter_chunks(rows[0]["resume_sha256"], start=pos, length=end - pos):
+                yield chunk
+            return
+        raise RuntimeError(f"resume of candidate {candidate_id} changed while streaming ({pos}/{end} bytes sent)")
+
 @router.get("/api/candidates/resume/{candidate_id}")
-async def download_resume(candidate_id: int):
+async def download_resume(
+    candidate_id: int,
+    range_: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    if_range: Optional[str] = Header(None, alias="If-Range"),
+):
     try:
         rows = await async_query(
             """
-            SELECT resume_filename, resume_mime_type, resume_data
+            SELECT resume_filename, resume_mime_type, resume_sha256, updated_at,
+                   CASE WHEN resume_sha256 IS NULL THEN octet_length(resume_data) END AS inline_size
             FROM candidates
             WHERE id = %(id)s
             LIMIT 1;
             """,
             {"id": candidate_id},
+            prepare=True,
         )
         if not rows:
             raise HTTPException(status_code=404, detail="Candidate not found")
@@ -615,15 +977,50 @@ async def download_resume(candidate_id: int):
         r = rows[0]
         filename = r.get("resume_filename") or f"resume-{candidate_id}.pdf"
         content_type = r.get("resume_mime_type") or "application/octet-stream"
-        file_bytes = r.get("resume_data")
-        if file_bytes is None:
+
+        store = get_blob_store()
+        digest = r.get("resume_sha256")
+        if digest:
+            size = await store.size(digest)
+        else:
+            # Not backfilled yet: still inline in the row.
+            size = r.get("inline_size")
+            if size is not None:
+                at = r.get("updated_at")
+                stamp = int(at.timestamp() * 1_000_000) if at else 0
+                digest = f"inline-{candidate_id}-{size}-{stamp}"
+        if not digest or size is None:
             raise HTTPException(status_code=404, detail="Resume not found")
 
-        data = bytes(file_bytes)
+        etag = f'"{digest}"'
+        headers = {
+            "Content-Disposition": f'inline; filename="{filename}"',
+            "ETag": etag,
+            "Accept-Ranges": "bytes",
+            "Cache-Control": "private, no-cache",
+        }
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        byte_range = None
+        if if_range is None or if_range.strip() == etag:
+            byte_range = _parse_range(range_, size)
+        start, end = byte_range if byte_range else (0, size - 1)
+        length = end - start + 1 if size else 0
+
+        if r.get("resume_sha256"):
+            body = store.iter_chunks(r["resume_sha256"], start=start, length=length)
+        else:
+            body = _iter_inline_resume(candidate_id, start, length, r.get("updated_at"))
+
+        headers["Content-Length"] = str(length)
+        if byte_range:
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
         return StreamingResponse(
-            iter([data]),
+            body,
+            status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
             media_type=content_type,
-            headers={"Content-Disposition": f'inline; filename="{filename}"'},
+            headers=headers,
         )
     except HTTPException:
         raise
@@ -1,13 +1,25 @@
 # backend/routes/db_connection.py
 # psycopg v3 connection helpers (sync + async) with schema handling.
+# Routers use the async pool; the sync pool is only created on first use of
+# query()/exec_(), which is meant for scripts and one-off maintenance jobs.
 from __future__ import annotations
 
+import asyncio
+import itertools
 import os
-from typing import Optional, Dict, Any, List, Union
+import re
+import time
+import weakref
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, List, NamedTuple, Sequence, Set, Tuple, Union
 
 import psycopg
 from psycopg.rows import dict_row
-from psycopg_pool import AsyncConnectionPool, ConnectionPool
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
+
+from .pool_stats import PoolStats
 
 # ---------- env helper ----------
 def _env(name: str, default: str) -> str:
@@ -16,6 +28,9 @@ def _env(name: str, default: str) -> str:
         return default
     return str(v).strip()
 
+def _flag(name: str, default: bool) -> bool:
+    return _env(name, "on" if default else "off").lower() not in {"0", "off", "false", "no"}
+
 # ---------- configuration (override with environment variables) ----------
 PG_HOST: str = _env("PGHOST", "103.14.123.44")
 PG_PORT: str = _env("PGPORT", "30018")
@@ -25,34 +40,163 @@ PG_PASS: str = _env("PGPASSWORD", "dhi@123")
 PG_SCHEMA: str = _env("PGSCHEMA", "dhi")
 PG_SSLMODE: str = _env("PGSSLMODE", "disable")  # local/docker default
 
+# Server-side prepared statements: psycopg keeps a bounded LRU of prepared plans
+# per connection. Turn PGPREPARE off behind a transaction-mode pooler (PgBouncer),
+# where a prepared plan may live on a different server connection.
+PG_PREPARE: bool = _flag("PGPREPARE", True)
+PG_PREPARE_THRESHOLD: int = int(_env("PGPREPARE_THRESHOLD", "5"))
+PG_PREPARED_MAX: int = int(_env("PGPREPARED_MAX", "100"))
+# Pipeline mode for async_pipeline(); when off the statements run one by one.
+PG_PIPELINE: bool = _flag("PGPIPELINE", True)
+
+# Async pool sizing. Size workers x PGPOOL_MAX against Postgres max_connections.
+PG_POOL_MIN: int = int(_env("PGPOOL_MIN", "1"))
+PG_POOL_MAX: int = int(_env("PGPOOL_MAX", "10"))
+# Adaptive mode moves max_size between PGPOOL_MAX_FLOOR and PGPOOL_MAX_CEILING:
+# it grows after PGPOOL_ADAPT_SUSTAIN intervals with mean wait >= PGPOOL_GROW_WAIT_MS
+# (or queued clients), and shrinks after three times as many mostly-idle intervals.
+PG_POOL_ADAPTIVE: bool = _flag("PGPOOL_ADAPTIVE", False)
+PG_POOL_MAX_FLOOR: int = int(_env("PGPOOL_MAX_FLOOR", str(PG_POOL_MAX)))
+PG_POOL_MAX_CEILING: int = int(_env("PGPOOL_MAX_CEILING", str(PG_POOL_MAX * 2)))
+PG_POOL_GROW_WAIT_MS: float = float(_env("PGPOOL_GROW_WAIT_MS", "20"))
+PG_POOL_ADAPT_INTERVAL: float = float(_env("PGPOOL_ADAPT_INTERVAL", "5"))
+PG_POOL_ADAPT_SUSTAIN: int = int(_env("PGPOOL_ADAPT_SUSTAIN", "3"))
+PG_POOL_ADAPT_STEP: int = int(_env("PGPOOL_ADAPT_STEP", "2"))
+
 # Use key/value conninfo (avoids URI escaping problems)
 DSN: str = (
     f"host={PG_HOST} port={PG_PORT} dbname={PG_DB} "
     f"user={PG_USER} password={PG_PASS} sslmode={PG_SSLMODE} connect_timeout=5"
 )
 
+# Optional read replicas, separated by ";". Each entry is either a full key/value
+# conninfo or a bare host[:port] that reuses the primary's db/user/password.
+def _replica_dsn(entry: str) -> str:
+    if "=" in entry:
+        return entry
+    host, _, port = entry.partition(":")
+    return (
+        f"host={host} port={port or PG_PORT} dbname={PG_DB} "
+        f"user={PG_USER} password={PG_PASS} sslmode={PG_SSLMODE} connect_timeout=5"
+    )
+
+PG_REPLICA_DSNS: List[str] = [_replica_dsn(x.strip()) for x in _env("PGREPLICA_DSNS", "").split(";") if x.strip()]
+PG_REPLICA_POLICY: str = _env("PGREPLICA_POLICY", "round_robin").lower()  # or least_loaded
+# After a write, reads from the same client stay on the primary this long.
+PG_RYW_SECONDS: float = float(_env("PGREPLICA_RYW_SECONDS", "5"))
+RYW_COOKIE = "dhi_primary_until"
+RYW_HEADER = "X-Primary-Until"
+
 # ---------- pools (lazy) ----------
 _async_pool: Optional[AsyncConnectionPool] = None
 _sync_pool: Optional[ConnectionPool] = None
+_adaptive_task: Optional["asyncio.Task[None]"] = None
+_replica_pools: List[AsyncConnectionPool] = []
+_replica_in_use: List[int] = []
+_replica_rr = itertools.count()
+
+POOL_STATS = PoolStats()
 
 def _print_effective_config() -> None:
     print(
         "[DB] "
         f"host={PG_HOST} port={PG_PORT} db={PG_DB} user={PG_USER} "
-        f"schema={PG_SCHEMA} sslmode={PG_SSLMODE}"
+        f"schema={PG_SCHEMA} sslmode={PG_SSLMODE} "
+        f"prepare={'on' if PG_PREPARE else 'off'} pipeline={'on' if PG_PIPELINE else 'off'} "
+        f"pool={PG_POOL_MIN}..{PG_POOL_MAX} adaptive={'on' if PG_POOL_ADAPTIVE else 'off'} "
+        f"replicas={len(PG_REPLICA_DSNS)}"
     )
 
 _print_effective_config()
 
+# ---------- helpers ----------
+def _schema_sql() -> str:
+    safe = PG_SCHEMA
+    if not safe.replace("_", "").isalnum():
+        raise ValueError(f"Unsafe schema name: {PG_SCHEMA!r}")
+    return f"SET search_path TO {safe}, public;"
+
+Params = Optional[Union[Dict[str, Any], tuple, list]]
+
+def _conn_kwargs() -> Dict[str, Any]:
+    return {"prepare_threshold": PG_PREPARE_THRESHOLD if PG_PREPARE else None}
+
+def _prepare_arg(prepare: Optional[bool]) -> Optional[bool]:
+    """
+    Per-call override: True prepares on first use (hot statements), None leaves
+    it to the connection threshold. Always False when preparing is switched off.
+    """
+    return prepare if PG_PREPARE else False
+
+# Writes pin the caller to the primary; anything that is not a plain read counts.
+_WRITE_SQL = re.compile(
+    r"\b(insert|update|delete|merge|create|alter|drop|truncate|grant|revoke|nextval|setval)\b",
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=512)
+def _is_write(sql: str) -> bool:
+    return bool(_WRITE_SQL.search(sql))
+
+# ---------- session setup (once per pooled connection) ----------
+# search_path is session state, so it is applied by the pool when a connection
+# is created instead of being re-sent before every statement. Connections that
+# ran something able to change it are re-configured when returned to the pool.
+_SESSION_MUTATORS = re.compile(r"\b(search_path|discard|reset)\b", re.IGNORECASE)
+_dirty_conns: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+@lru_cache(maxsize=512)
+def _touches_session(sql: str) -> bool:
+    return bool(_SESSION_MUTATORS.search(sql))
+
+def _note_statement(conn: Any, sql: str) -> None:
+    if _touches_session(sql):
+        _dirty_conns.add(conn)
+
+def _search_path_ok(conn: Any) -> bool:
+    """
+    Compare against the server-reported search_path when available (newer
+    servers report it); otherwise rely on the statements we have seen.
+    """
+    if conn in _dirty_conns:
+        return False
+    reported = conn.info.parameter_status("search_path")
+    if reported is None:
+        return True
+    return reported.replace(" ", "").replace('"', "") == f"{PG_SCHEMA},public"
+
+async def _configure_session_async(conn: psycopg.AsyncConnection) -> None:
+    POOL_STATS.note_connection(conn)
+    conn.prepared_max = PG_PREPARED_MAX
+    await conn.execute(_schema_sql(), prepare=False)
+    await conn.commit()
+    _dirty_conns.discard(conn)
+
+async def _reset_session_async(conn: psycopg.AsyncConnection) -> None:
+    if not _search_path_ok(conn):
+        await _configure_session_async(conn)
+
+def _configure_session_sync(conn: psycopg.Connection) -> None:
+    conn.prepared_max = PG_PREPARED_MAX
+    conn.execute(_schema_sql(), prepare=False)
+    conn.commit()
+    _dirty_conns.discard(conn)
+
+def _reset_session_sync(conn: psycopg.Connection) -> None:
+    if not _search_path_ok(conn):
+        _configure_session_sync(conn)
+
 # ---------- pool getters ----------
-def get_async_pool(min_size: int = 1, max_size: int = 10) -> AsyncConnectionPool:
+def get_async_pool(min_size: Optional[int] = None, max_size: Optional[int] = None) -> AsyncConnectionPool:
     global _async_pool
     if _async_pool is None:
         _async_pool = AsyncConnectionPool(
             conninfo=DSN,
-            min_size=min_size,
-            max_size=max_size,
-            kwargs={},   # set row_factory per-cursor
+            min_size=PG_POOL_MIN if min_size is None else min_size,
+            max_size=PG_POOL_MAX if max_size is None else max_size,
+            kwargs=_conn_kwargs(),   # set row_factory per-cursor
+            configure=_configure_session_async,
+            reset=_reset_session_async,
             open=False,
         )
     return _async_pool
@@ -64,97 +208,444 @@ def get_sync_pool(min_size: int = 1, max_size: int = 10) -> ConnectionPool:
             conninfo=DSN,
             min_size=min_size,
             max_size=max_size,
-            kwargs={"row_factory": dict_row},
+            kwargs={"row_factory": dict_row, **_conn_kwargs()},
+            configure=_configure_session_sync,
+            reset=_reset_session_sync,
+            open=True,   # opened on first use only (scripts)
         )
     return _sync_pool
 
-# ---------- helpers ----------
-def _schema_sql() -> str:
-    safe = PG_SCHEMA
-    if not safe.replace("_", "").isalnum():
-        raise ValueError(f"Unsafe schema name: {PG_SCHEMA!r}")
-    return f"SET search_path TO {safe}, public;"
+def get_replica_pools() -> List[AsyncConnectionPool]:
+    if PG_REPLICA_DSNS and not _replica_pools:
+        for dsn in PG_REPLICA_DSNS:
+            _replica_pools.append(
+                AsyncConnectionPool(
+                    conninfo=dsn,
+                    min_size=PG_POOL_MIN,
+                    max_size=PG_POOL_MAX,
+                    kwargs=_conn_kwargs(),
+                    configure=_configure_session_async,
+                    reset=_reset_session_async,
+                    open=False,
+                )
+            )
+            _replica_in_use.append(0)
+    return _replica_pools
 
-Params = Optional[Union[Dict[str, Any], tuple, list]]
+# ---------- read-your-writes ----------
+# The HTTP layer installs a per-request holder (see App.py). A write stores the
+# time until which this client's reads must go to the primary; the middleware
+# sends that deadline in the RYW_HEADER response header (and RYW_COOKIE) and the
+# client sends it back on later requests.
+_ryw: ContextVar[Optional[Dict[str, float]]] = ContextVar("dhi_ryw", default=None)
+
+def begin_request_routing(primary_until: float = 0.0) -> Dict[str, float]:
+    holder = {"primary_until": primary_until}
+    _ryw.set(holder)
+    return holder
+
+def _note_write() -> None:
+    holder = _ryw.get()
+    if holder is not None:
+        holder["primary_until"] = time.time() + PG_RYW_SECONDS
+
+def _pick_replica() -> Optional[int]:
+    """Replica index for a read, or None when it must go to the primary."""
+    if not PG_REPLICA_DSNS:
+        return None
+    holder = _ryw.get()
+    if holder is not None and holder["primary_until"] > time.time():
+        return None
+    pools = get_replica_pools()
+    if PG_REPLICA_POLICY == "least_loaded":
+        return min(range(len(pools)), key=_replica_in_use.__getitem__)
+    return next(_replica_rr) % len(pools)
+
+# ---------- per-request DB time ----------
+# The metrics middleware (metrics.py) installs a [seconds, checkouts] holder per
+# request; every async helper adds the time it held (or waited for) a
+# connection. Concurrent helpers in one request (gather) add up separately.
+_db_time: ContextVar[Optional[List[float]]] = ContextVar("dhi_db_time", default=None)
+
+def begin_request_db_timer() -> List[float]:
+    holder = [0.0, 0.0]
+    _db_time.set(holder)
+    return holder
 
 # ---------- ASYNC ----------
-async def async_query(sql: str, params: Params = None, set_schema: bool = True) -> List[Dict[str, Any]]:
-    pool = get_async_pool()
-    if pool.closed:
-        await pool.open()
-    async with pool.connection() as conn:
+@asynccontextmanager
+async def _async_connection(replica: Optional[int] = None) -> AsyncIterator[psycopg.AsyncConnection]:
+    """
+    Check out a connection from the primary pool (or replica pool `replica`),
+    recording wait time and errors for the primary, and the request's DB time.
+    """
+    t0 = time.perf_counter()
+    try:
+        if replica is not None:
+            rpool = get_replica_pools()[replica]
+            if rpool.closed:
+                await rpool.open()
+            _replica_in_use[replica] += 1
+            try:
+                async with rpool.connection() as conn:
+                    yield conn
+            finally:
+                _replica_in_use[replica] -= 1
+            return
+
+        pool = get_async_pool()
+        if pool.closed or (PG_POOL_ADAPTIVE and _adaptive_task is None):
+            await open_async_pool()
+        t0 = time.perf_counter()
+        try:
+            async with pool.connection() as conn:
+                POOL_STATS.record_acquire((time.perf_counter() - t0) * 1000.0)
+                try:
+                    yield conn
+                finally:
+                    POOL_STATS.record_release()
+        except PoolTimeout:
+            POOL_STATS.timeouts += 1
+            raise
+        except psycopg.Error:
+            POOL_STATS.query_errors += 1
+            raise
+    finally:
+        holder = _db_time.get()
+        if holder is not None:
+            holder[0] += time.perf_counter() - t0
+            holder[1] += 1
+
+# `set_schema` is kept for compatibility: the search_path is already in place on
+# every pooled connection, so neither value costs an extra round trip.
+# `read_only=True` lets a plain SELECT go to a replica (when configured).
+async def async_query(
+    sql: str,
+    params: Params = None,
+    set_schema: bool = True,
+    prepare: Optional[bool] = None,
+    read_only: bool = False,
+) -> List[Dict[str, Any]]:
+    replica = None
+    if _is_write(sql):
+        _note_write()
+    elif read_only:
+        replica = _pick_replica()
+    async with _async_connection(replica) as conn:
         async with conn.cursor(row_factory=dict_row) as cur:
-            if set_schema:
-                await cur.execute(_schema_sql())
-            if params is None:
-                await cur.execute(sql)
-            else:
-                await cur.execute(sql, params)
+            await cur.execute(sql, params, prepare=_prepare_arg(prepare))
+            _note_statement(conn, sql)
             rows = await cur.fetchall()
             return rows
 
-async def async_exec(sql: str, params: Params = None, set_schema: bool = True) -> int:
-    pool = get_async_pool()
-    if pool.closed:
-        await pool.open()
-    async with pool.connection() as conn:
+async def async_exec(
+    sql: str,
+    params: Params = None,
+    set_schema: bool = True,
+    prepare: Optional[bool] = None,
+) -> int:
+    if _is_write(sql):
+        _note_write()
+    async with _async_connection() as conn:
         async with conn.cursor() as cur:
-            if set_schema:
-                await cur.execute(_schema_sql())
-            if params is None:
-                await cur.execute(sql)
-            else:
-                await cur.execute(sql, params)
+            await cur.execute(sql, params, prepare=_prepare_arg(prepare))
+            _note_statement(conn, sql)
             return cur.rowcount
 
+@asynccontextmanager
+async def async_transaction() -> AsyncIterator[psycopg.AsyncConnection]:
+    """
+    A primary connection for multi-statement work whose later statements depend
+    on earlier results. Commits on normal exit, rolls back on error.
+    """
+    _note_write()
+    async with _async_connection() as conn:
+        yield conn
+
+Statement = Tuple[str, Params]
+
+async def async_pipeline(
+    statements: Sequence[Statement],
+    set_schema: bool = True,
+    prepare: Optional[bool] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Run several statements on one connection, in one transaction, sent in a
+    single pipeline flush. Returns the rows of each statement in order ([] for
+    statements without a result set). Later statements cannot use the results
+    of earlier ones; fold those into one statement instead.
+    """
+    if any(_is_write(sql) for sql, _ in statements):
+        _note_write()
+    async with _async_connection() as conn:
+        cursors = []
+        if PG_PIPELINE:
+            async with conn.pipeline():
+                for sql, params in statements:
+                    cur = conn.cursor(row_factory=dict_row)
+                    await cur.execute(sql, params, prepare=_prepare_arg(prepare))
+                    _note_statement(conn, sql)
+                    cursors.append(cur)
+        else:
+            for sql, params in statements:
+                cur = conn.cursor(row_factory=dict_row)
+                await cur.execute(sql, params, prepare=_prepare_arg(prepare))
+                _note_statement(conn, sql)
+                cursors.append(cur)
+
+        results: List[List[Dict[str, Any]]] = []
+        for cur in cursors:
+            results.append(await cur.fetchall() if cur.description is not None else [])
+            await cur.close()
+        return results
+
+# ---------- LISTEN/NOTIFY ----------
+# One connection per process (outside the pool) LISTENs on every channel that
+# a subsystem subscribed to and hands each notification to that channel's
+# callback, so schema_catalog, name_index and sessions share one backend.
+# Subscriptions added or dropped while it runs are picked up within
+# _LISTEN_POLL seconds (notifies(timeout=...) needs psycopg >= 3.2).
+# Callers that load state and then rely on notifications await listening()
+# first, so nothing committed between their load and the LISTEN is lost.
+_LISTEN_POLL = 0.5
+
+class _Subscription(NamedTuple):
+    on_notify: Callable[[str], Awaitable[None]]
+    on_reconnect: Optional[Callable[[], Awaitable[None]]]
+    tag: str
+
+class Listener:
+    def __init__(self) -> None:
+        self._subs: Dict[str, _Subscription] = {}
+        self._ready: Dict[str, asyncio.Event] = {}  # set while LISTEN is in place
+        self._gave_up: Set[str] = set()  # listening() timed out: catch up once it is
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def subscribe(
+        self,
+        channel: str,
+        on_notify: Callable[[str], Awaitable[None]],
+        on_reconnect: Optional[Callable[[], Awaitable[None]]] = None,
+        tag: str = "listen",
+    ) -> None:
+        """
+        Call on_notify(payload) for each notification on `channel`. After the
+        connection is lost and re-established, or a callback fails,
+        on_reconnect runs so the caller can catch up on missed events.
+        """
+        self._subs[channel] = _Subscription(on_notify, on_reconnect, tag)
+        self._ready.setdefault(channel, asyncio.Event())
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def listening(self, channel: str, timeout: float = 10.0) -> bool:
+        """
+        Wait until LISTEN on a subscribed `channel` is in place. False after
+        `timeout`; on_reconnect then runs once it is.
+        """
+        try:
+            await asyncio.wait_for(self._ready[channel].wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._gave_up.add(channel)
+            return False
+
+    async def unsubscribe(self, channel: str) -> None:
+        """Drop `channel`; the connection is closed with the last subscription."""
+        self._subs.pop(channel, None)
+        self._ready.pop(channel, None)
+        self._gave_up.discard(channel)
+        if not self._subs and self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    async def _catch_up(self, channel: str) -> None:
+        sub = self._subs.get(channel)
+        if sub is None or sub.on_reconnect is None:
+            return
+        try:
+            await sub.on_reconnect()
+        except Exception as e:
+            print(f"[{sub.tag}] catch-up after missed {channel} events failed: {e}")
+
+    async def _dispatch(self, channel: str, payload: str) -> None:
+        sub = self._subs.get(channel)
+        if sub is None:
+            return
+        try:
+            await sub.on_notify(payload)
+        except Exception as e:
+            print(f"[{sub.tag}] {channel} notification failed: {e}")
+            await self._catch_up(channel)
+
+    async def _run(self) -> None:
+        reconnect = False
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(DSN, autocommit=True) as conn:
+                    listening: Set[str] = set()
+                    while True:
+                        wanted = set(self._subs)
+                        for channel in sorted(listening - wanted):
+                            await conn.execute(f"UNLISTEN {channel};")
+                        added = sorted(wanted - listening)
+                        for channel in added:
+                            await conn.execute(f"LISTEN {channel};")
+                            ready = self._ready.get(channel)
+                            if ready is not None:
+                                ready.set()
+                        listening = wanted
+                        late = [ch for ch in added if ch in self._gave_up]
+                        self._gave_up.difference_update(late)
+                        for channel in (sorted(listening) if reconnect else late):
+                            await self._catch_up(channel)
+                        reconnect = False
+                        async for n in conn.notifies(timeout=_LISTEN_POLL):
+                            await self._dispatch(n.channel, n.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                reconnect = True
+                for ready in self._ready.values():
+                    ready.clear()
+                print(f"[listen] listener error on {', '.join(sorted(self._subs))}: {e}; retrying in 5s")
+                await asyncio.sleep(5)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"running": self._task is not None and not self._task.done(), "channels": sorted(self._subs)}
+
+LISTENER = Listener()
+
 # ---------- SYNC ----------
-def query(sql: str, params: Params = None, set_schema: bool = True) -> List[Dict[str, Any]]:
+def query(
+    sql: str,
+    params: Params = None,
+    set_schema: bool = True,
+    prepare: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
     pool = get_sync_pool()
     with pool.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
-            if set_schema:
-                cur.execute(_schema_sql())
-            if params is None:
-                cur.execute(sql)
-            else:
-                cur.execute(sql, params)
+            cur.execute(sql, params, prepare=_prepare_arg(prepare))
+            _note_statement(conn, sql)
             return cur.fetchall()
 
-def exec_(sql: str, params: Params = None, set_schema: bool = True) -> int:
+def exec_(
+    sql: str,
+    params: Params = None,
+    set_schema: bool = True,
+    prepare: Optional[bool] = None,
+) -> int:
     pool = get_sync_pool()
     with pool.connection() as conn:
         with conn.cursor() as cur:
-            if set_schema:
-                cur.execute(_schema_sql())
-            if params is None:
-                cur.execute(sql)
-            else:
-                cur.execute(sql, params)
+            cur.execute(sql, params, prepare=_prepare_arg(prepare))
+            _note_statement(conn, sql)
             conn.commit()
             return cur.rowcount
 
+# ---------- adaptive sizing ----------
+async def _adapt_pool_size(pool: AsyncConnectionPool) -> None:
+    grow = shrink = 0
+    while not pool.closed:
+        await asyncio.sleep(PG_POOL_ADAPT_INTERVAL)
+        try:
+            win = POOL_STATS.take_window()
+            waiting = pool.get_stats().get("requests_waiting", 0)
+            if win["wait_ms_avg"] >= PG_POOL_GROW_WAIT_MS or waiting:
+                grow, shrink = grow + 1, 0
+            elif win["peak_in_use"] <= pool.max_size // 2:
+                grow, shrink = 0, shrink + 1
+            else:
+                grow = shrink = 0
+
+            new_max = pool.max_size
+            if grow >= PG_POOL_ADAPT_SUSTAIN:
+                new_max = min(PG_POOL_MAX_CEILING, pool.max_size + PG_POOL_ADAPT_STEP)
+                grow = 0
+            elif shrink >= PG_POOL_ADAPT_SUSTAIN * 3:
+                new_max = max(PG_POOL_MAX_FLOOR, pool.min_size, pool.max_size - PG_POOL_ADAPT_STEP)
+                shrink = 0
+            if new_max != pool.max_size:
+                print(f"[DB] adaptive pool: max_size {pool.max_size} -> {new_max} (wait avg {win['wait_ms_avg']:.1f} ms)")
+                await pool.resize(pool.min_size, new_max)
+                POOL_STATS.resizes += 1
+        except Exception as e:
+            print(f"[DB] adaptive pool error: {e}")
+
+def _start_adaptive(pool: AsyncConnectionPool) -> None:
+    global _adaptive_task
+    if PG_POOL_ADAPTIVE and (_adaptive_task is None or _adaptive_task.done()):
+        _adaptive_task = asyncio.get_running_loop().create_task(_adapt_pool_size(pool))
+
+# ---------- stats ----------
+def pool_stats() -> Dict[str, Any]:
+    """In-process view of the async pool: occupancy, waits, connection ages, errors."""
+    out = POOL_STATS.snapshot()
+    pool = _async_pool
+    if pool is None or pool.closed:
+        out["pool"] = None
+    else:
+        raw = pool.get_stats()
+        size = raw.get("pool_size", 0)
+        idle = raw.get("pool_available", 0)
+        out["pool"] = {
+            "min_size": pool.min_size,
+            "max_size": pool.max_size,
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "waiters": raw.get("requests_waiting", 0),
+        }
+        out["psycopg_pool"] = raw
+    out["replicas"] = [
+        {
+            "index": i,
+            "policy": PG_REPLICA_POLICY,
+            "in_use": _replica_in_use[i],
+            "stats": None if rp.closed else rp.get_stats(),
+        }
+        for i, rp in enumerate(_replica_pools)
+    ]
+    out["adaptive"] = {
+        "enabled": PG_POOL_ADAPTIVE,
+        "max_floor": PG_POOL_MAX_FLOOR,
+        "max_ceiling": PG_POOL_MAX_CEILING,
+        "grow_wait_ms": PG_POOL_GROW_WAIT_MS,
+        "interval_s": PG_POOL_ADAPT_INTERVAL,
+    }
+    return out
+
 # ---------- lifecycle ----------
 async def open_async_pool() -> None:
     pool = get_async_pool()
     if pool.closed:
         await pool.open()
+    _start_adaptive(pool)
+    for rpool in get_replica_pools():
+        if rpool.closed:
+            await rpool.open()
 
 async def close_async_pool() -> None:
-    global _async_pool
+    global _async_pool, _adaptive_task
+    if _adaptive_task is not None:
+        _adaptive_task.cancel()
+        _adaptive_task = None
     if _async_pool and not _async_pool.closed:
         await _async_pool.close()
     _async_pool = None
+    for rpool in _replica_pools:
+        if not rpool.closed:
+            await rpool.close()
+    _replica_pools.clear()
+    _replica_in_use.clear()
 
 def close_sync_pool() -> None:
     global _sync_pool
     if _sync_pool:
         _sync_pool.close()
     _sync_pool = None
-
-# ---------- health ----------
-def ping() -> bool:
-    try:
-        rows = query("SELECT 1 AS ok;", set_schema=False)
-        return bool(rows and rows[0].get("ok") == 1)
-    except Exception:
-        return False
@@ -1,13 +1,17 @@
 # backend/routes/login_route.py
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Dict, Any
 import bcrypt
 
 from .db_connection import async_query, async_exec, open_async_pool
+from .login_throttle import LOGIN_THROTTLE, client_ip
+from .password_hasher import HashPoolSaturated, submit as _run_hash
+from .sessions import SESSIONS, SESSIONS_ENABLED, Session, require_session
+from .write_behind import LAST_LOGIN
 
 # Prefix keeps paths exactly /api/auth/*
 router = APIRouter(prefix="/api/auth", tags=["auth"])
@@ -24,26 +28,11 @@ class LoginPayload(BaseModel):
     password: str
 
 
-# ===== Startup: ensure table =====
+# ===== Startup =====
 async def startup_auth() -> None:
-    """Ensure the dhi.login_users table exists at startup."""
+    """Open the pool; dhi.login_users is created by migration 0001."""
     await open_async_pool()
-    await async_exec(
-        """
-        CREATE SCHEMA IF NOT EXISTS dhi;
-
-        CREATE TABLE IF NOT EXISTS dhi.login_users (
-            id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            username TEXT NOT NULL UNIQUE,
-            password_hash TEXT NOT NULL,
-            created_on TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-            last_login TIMESTAMPTZ
-        );
-        """,
-        {},
-        set_schema=False,
-    )
-    print("[auth] login_users table ensured")
+    print("[auth] ready")
 
 
 # ===== Helpers =====
@@ -73,10 +62,16 @@ def _verify_password(password: str, hashed: str) -> bool:
         return False
 
 
+def _busy() -> HTTPException:
+    # the hashing pool is full (password_hasher.py); fail fast, client retries
+    return HTTPException(status_code=503, detail="Authentication busy, retry shortly", headers={"Retry-After": "1"})
+
+
 # ===== Routes =====
 @router.post("/signup")
-async def signup(payload: SignupPayload):
+async def signup(payload: SignupPayload, request: Request):
     try:
+        LOGIN_THROTTLE.check(client_ip(request))
         uname = _normalize_username(payload.username)
         if not uname:
             raise HTTPException(status_code=400, detail="Username required")
@@ -89,7 +84,7 @@ async def signup(payload: SignupPayload):
         if exists:
             raise HTTPException(status_code=400, detail="Username already exists")
 
-        pw_hash = _hash_password(payload.password)
+        pw_hash = await _run_hash(_hash_password, payload.password)
 
         await async_exec(
             "INSERT INTO dhi.login_users (username, password_hash) VALUES (%(u)s, %(h)s);",
@@ -99,14 +94,18 @@ async def signup(payload: SignupPayload):
         return {"ok": True, "message": f"Account created successfully for '{uname}'", "username": uname}
     except HTTPException:
         raise
+    except HashPoolSaturated:
+        raise _busy()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Signup failed: {e}")
 
 
 @router.post("/login")
-async def login(payload: LoginPayload):
+async def login(payload: LoginPayload, request: Request):
     try:
         uname = _normalize_username(payload.username)
+        # before the lookup and bcrypt: 429 for bursts (login_throttle.py)
+        LOGIN_THROTTLE.check(client_ip(request), uname)
         rows = await async_query(
             """
             SELECT id, username, password_hash
@@ -120,21 +119,48 @@ async def login(payload: LoginPayload):
             raise HTTPException(status_code=401, detail="Invalid username or password")
 
         user = rows[0]
-        if not _verify_password(payload.password, user["password_hash"]):
+        if not await _run_hash(_verify_password, payload.password, user["password_hash"]):
             raise HTTPException(status_code=401, detail="Invalid username or password")
 
-        await async_exec(
-            "UPDATE dhi.login_users SET last_login = NOW() WHERE id = %(id)s;",
-            {"id": user["id"]},
-        )
-
-        return {"ok": True, "message": "Login successful", "username": user["username"]}
+        LOGIN_THROTTLE.succeeded(uname)
+        # buffered; written in batches off the request path (write_behind.py)
+        await LAST_LOGIN.touch(user["id"])
+
+        out: Dict[str, Any] = {"ok": True, "message": "Login successful", "username": user["username"]}
+        if SESSIONS_ENABLED:  # no AUTH_SESSION_SECRET: no token (sessions.py)
+            token, session = SESSIONS.issue(user["id"], user["username"])
+            # send as `Authorization: Bearer <token>`
+            out["token"] = token
+            out["token_type"] = "bearer"
+            out["expires_at"] = datetime.utcfromtimestamp(session.expires_at).isoformat() + "Z"
+        return out
     except HTTPException:
         raise
+    except HashPoolSaturated:
+        raise _busy()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Login failed: {e}")
 
 
+@router.post("/logout")
+async def logout(session: Session = Depends(require_session)):
+    try:
+        await SESSIONS.revoke(session)
+        return {"ok": True, "message": "Logged out", "username": session.username}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Logout failed: {e}")
+
+
+@router.get("/me")
+async def me(session: Session = Depends(require_session)) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "user_id": session.user_id,
+        "username": session.username,
+        "expires_at": datetime.utcfromtimestamp(session.expires_at).isoformat() + "Z",
+    }
+
+
 @router.get("/check")
 async def check_health() -> Dict[str, Any]:
     rows = await async_query(
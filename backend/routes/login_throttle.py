@@ -0,0 +1,141 @@
+# backend/routes/login_throttle.py
+# In-memory token buckets for /api/auth, checked before any DB lookup or bcrypt.
+#
+# Every login attempt takes one token from its client IP's bucket and one from
+# the username's; signup takes one from the IP's. An empty bucket answers 429
+# with Retry-After straight away, so a credential-stuffing burst costs a dict
+# lookup per request instead of a 250 ms hash. A successful login refills its
+# username's bucket, so typos do not add up across sessions.
+#
+#   AUTH_THROTTLE=off              disable
+#   AUTH_THROTTLE_USER_BURST/_PER_MIN  per username (default 5, 5 per minute)
+#   AUTH_THROTTLE_IP_BURST/_PER_MIN    per client IP (default 30, 30 per minute)
+#   AUTH_THROTTLE_MAX_KEYS         buckets kept per kind (default 100000)
+#   AUTH_TRUST_FORWARDED=on        client IP from X-Forwarded-For (behind a proxy)
+#
+# A bucket is a (tokens, updated) tuple in an OrderedDict ordered by last use.
+# A full bucket is the same as none, so a sweep every minute drops refilled
+# ones; past AUTH_THROTTLE_MAX_KEYS the least recently used go first, one O(1)
+# pop each. State is per process: with N workers the effective limits are up
+# to N times higher.
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+from .db_connection import _env, _flag
+
+AUTH_THROTTLE: bool = _flag("AUTH_THROTTLE", True)
+AUTH_TRUST_FORWARDED: bool = _flag("AUTH_TRUST_FORWARDED", False)
+AUTH_THROTTLE_MAX_KEYS: int = int(_env("AUTH_THROTTLE_MAX_KEYS", "100000"))
+
+_SWEEP_INTERVAL = 60.0
+
+
+class TokenBuckets:
+    def __init__(self, kind: str, burst: float, per_min: float) -> None:
+        self.kind = kind
+        self.burst = float(burst)
+        self.rate = float(per_min) / 60.0  # tokens per second
+        self._b: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._swept_at = time.monotonic()
+        self.rejected = 0
+
+    def _level(self, key: str, now: float) -> float:
+        state = self._b.pop(key, None)  # re-inserted by the caller: keeps LRU order
+        if state is None:
+            return self.burst
+        tokens, updated = state
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def retry_after(self, tokens: float) -> int:
+        return max(1, int((1.0 - tokens) / self.rate + 0.999)) if self.rate > 0 else 60
+
+    def peek(self, key: str, now: float) -> float:
+        tokens = self._level(key, now)
+        self._b[key] = (tokens, now)
+        return tokens
+
+    def take(self, key: str, now: float) -> None:
+        tokens, _ = self._b.get(key, (self.burst, now))
+        self._b[key] = (tokens - 1.0, now)
+        self._evict(now)
+
+    def reset(self, key: str) -> None:
+        self._b.pop(key, None)
+
+    def _evict(self, now: float) -> None:
+        # The full sweep is O(keys): at most once per interval, never per request.
+        if now - self._swept_at > _SWEEP_INTERVAL:
+            self._b = OrderedDict(
+                (k, (t, u)) for k, (t, u) in self._b.items() if t + (now - u) * self.rate < self.burst
+            )
+            self._swept_at = now
+        while len(self._b) > AUTH_THROTTLE_MAX_KEYS:
+            self._b.popitem(last=False)  # least recently used
+
+    def stats(self) -> Dict[str, Any]:
+        return {"burst": self.burst, "per_min": round(self.rate * 60.0, 3), "keys": len(self._b), "rejected": self.rejected}
+
+
+class LoginThrottle:
+    def __init__(self) -> None:
+        self.users = TokenBuckets(
+            "username",
+            float(_env("AUTH_THROTTLE_USER_BURST", "5")),
+            float(_env("AUTH_THROTTLE_USER_PER_MIN", "5")),
+        )
+        self.ips = TokenBuckets(
+            "ip",
+            float(_env("AUTH_THROTTLE_IP_BURST", "30")),
+            float(_env("AUTH_THROTTLE_IP_PER_MIN", "30")),
+        )
+        self.allowed = 0
+
+    def check(self, ip: str, username: Optional[str] = None) -> None:
+        """Take a token per bucket, or raise 429 without touching any of them."""
+        if not AUTH_THROTTLE:
+            return
+        now = time.monotonic()
+        for buckets, key in ((self.ips, ip), (self.users, username)):
+            if key is None:
+                continue
+            tokens = buckets.peek(key, now)
+            if tokens < 1.0:
+                buckets.rejected += 1
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many attempts, retry later",
+                    headers={"Retry-After": str(buckets.retry_after(tokens))},
+                )
+        self.ips.take(ip, now)
+        if username is not None:
+            self.users.take(username, now)
+        self.allowed += 1
+
+    def succeeded(self, username: str) -> None:
+        self.users.reset(username)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": AUTH_THROTTLE,
+            "allowed": self.allowed,
+            # refused before the user lookup; not all of them would have hashed
+            "rejected": self.ips.rejected + self.users.rejected,
+            "username": self.users.stats(),
+            "ip": self.ips.stats(),
+        }
+
+
+LOGIN_THROTTLE = LoginThrottle()
+
+
+def client_ip(request: Request) -> str:
+    if AUTH_TRUST_FORWARDED:
+        fwd = request.headers.get("x-forwarded-for")
+        if fwd:
+            return fwd.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
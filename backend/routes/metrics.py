@@ -0,0 +1,185 @@
+# backend/routes/metrics.py
+# Per-route request metrics and the Prometheus text rendered at GET /metrics.
+#
+# MetricsMiddleware is a plain ASGI middleware (no BaseHTTPMiddleware task per
+# request). Per request it records, under the route template
+# ("/api/applications/{app_id}", never the raw path, so label cardinality stays
+# bounded; unmatched paths share route="unmatched"):
+#   - latency histogram per method, route and status
+#   - DB time histogram: time spent in db_connection's async helpers
+#   - response body bytes
+#   - in-flight requests per method
+# Series are created once with preallocated bucket lists and then only
+# incremented; everything runs on the event loop, so no locks (as pool_stats.py).
+#
+#   METRICS=off  skip the middleware (/metrics then only shows pool and auth figures)
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .db_connection import _flag, begin_request_db_timer, pool_stats
+from .login_throttle import LOGIN_THROTTLE
+from .password_hasher import HASH_STATS
+from .pool_stats import WAIT_BUCKETS_MS
+from .write_behind import BUFFERS
+
+METRICS: bool = _flag("METRICS", True)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds (s) of the latency and DB-time histograms; the last bucket is +Inf.
+LATENCY_BUCKETS_S = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_N_BUCKETS = len(LATENCY_BUCKETS_S) + 1
+
+
+class _Series:
+    __slots__ = ("count", "seconds", "buckets", "db_seconds", "db_buckets", "db_checkouts", "bytes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.buckets = [0] * _N_BUCKETS
+        self.db_seconds = 0.0
+        self.db_buckets = [0] * _N_BUCKETS
+        self.db_checkouts = 0
+        self.bytes = 0
+
+
+class RequestMetrics:
+    def __init__(self) -> None:
+        self.series: Dict[Tuple[str, str, int], _Series] = {}
+        self.in_flight: Dict[str, int] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, db: List[float], nbytes: int) -> None:
+        key = (method, route, status)
+        s = self.series.get(key)
+        if s is None:
+            s = self.series[key] = _Series()
+        s.count += 1
+        s.seconds += seconds
+        s.buckets[bisect_left(LATENCY_BUCKETS_S, seconds)] += 1
+        s.db_seconds += db[0]
+        s.db_buckets[bisect_left(LATENCY_BUCKETS_S, db[0])] += 1
+        s.db_checkouts += int(db[1])
+        s.bytes += nbytes
+
+
+REQUEST_METRICS = RequestMetrics()
+
+
+class MetricsMiddleware:
+    def __init__(self, app: Callable[..., Any]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        flight = REQUEST_METRICS.in_flight
+        flight[method] = flight.get(method, 0) + 1
+        db = begin_request_db_timer()
+        sent = [500, 0]  # status, body bytes
+
+        async def _send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                sent[0] = message["status"]
+            elif message["type"] == "http.response.body":
+                sent[1] += len(message.get("body", b""))
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            flight[method] -= 1
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            REQUEST_METRICS.observe(method, path, sent[0], time.perf_counter() - t0, db, sent[1])
+
+
+# ---------- Prometheus text ----------
+def _esc(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: Dict[str, Any]) -> str:
+    return ",".join(f'{k}="{_esc(str(v))}"' for k, v in pairs.items())
+
+
+def _histogram(out: List[str], name: str, labels: Dict[str, Any], bounds: Tuple[float, ...],
+               buckets: List[int], total: float, count: int) -> None:
+    base = _labels(labels)
+    sep = "," if base else ""
+    running = 0
+    for bound, n in zip(bounds, buckets):
+        running += n
+        out.append(f'{name}_bucket{{{base}{sep}le="{bound:g}"}} {running}')
+    out.append(f'{name}_bucket{{{base}{sep}le="+Inf"}} {count}')
+    tail = f"{{{base}}}" if base else ""
+    out.append(f"{name}_sum{tail} {total:.6f}")
+    out.append(f"{name}_count{tail} {count}")
+
+
+def _header(out: List[str], name: str, kind: str, help_text: str) -> None:
+    out.append(f"# HELP {name} {help_text}")
+    out.append(f"# TYPE {name} {kind}")
+
+
+def render() -> str:
+    out: List[str] = []
+    series = sorted(REQUEST_METRICS.series.items())
+
+    _header(out, "dhi_http_request_duration_seconds", "histogram", "Request latency by route and status.")
+    for (method, route, status), s in series:
+        _histogram(out, "dhi_http_request_duration_seconds", {"method": method, "route": route, "status": status},
+                   LATENCY_BUCKETS_S, s.buckets, s.seconds, s.count)
+
+    _header(out, "dhi_http_request_db_seconds", "histogram", "Time per request spent in DB helpers (pool wait included).")
+    for (method, route, status), s in series:
+        _histogram(out, "dhi_http_request_db_seconds", {"method": method, "route": route, "status": status},
+                   LATENCY_BUCKETS_S, s.db_buckets, s.db_seconds, s.count)
+
+    _header(out, "dhi_http_request_db_checkouts_total", "counter", "Connection checkouts made by requests.")
+    for (method, route, status), s in series:
+        out.append(f"dhi_http_request_db_checkouts_total{{{_labels({'method': method, 'route': route, 'status': status})}}} {s.db_checkouts}")
+
+    _header(out, "dhi_http_response_bytes_total", "counter", "Response body bytes sent.")
+    for (method, route, status), s in series:
+        out.append(f"dhi_http_response_bytes_total{{{_labels({'method': method, 'route': route, 'status': status})}}} {s.bytes}")
+
+    _header(out, "dhi_http_requests_in_flight", "gauge", "Requests being handled.")
+    for method, n in sorted(REQUEST_METRICS.in_flight.items()):
+        out.append(f"dhi_http_requests_in_flight{{{_labels({'method': method})}}} {n}")
+
+    stats = pool_stats()
+    pool: Optional[Dict[str, Any]] = stats.get("pool")
+    if pool is not None:
+        for key in ("size", "idle", "in_use", "waiters", "max_size"):
+            name = f"dhi_db_pool_{key}"
+            _header(out, name, "gauge", f"Primary pool {key.replace('_', ' ')}.")
+            out.append(f"{name} {pool[key]}")
+    wait_bounds = tuple(b / 1000.0 for b in WAIT_BUCKETS_MS)
+    _header(out, "dhi_db_pool_wait_seconds", "histogram", "Wait for a primary pool connection.")
+    _histogram(out, "dhi_db_pool_wait_seconds", {}, wait_bounds,
+               list(stats["wait_histogram"].values()), stats["wait_ms_total"] / 1000.0, stats["acquired"])
+    _header(out, "dhi_db_pool_errors_total", "counter", "Primary pool query errors and checkout timeouts.")
+    out.append(f'dhi_db_pool_errors_total{{kind="query"}} {stats["errors"]["query"]}')
+    out.append(f'dhi_db_pool_errors_total{{kind="timeout"}} {stats["errors"]["timeouts"]}')
+
+    _header(out, "dhi_auth_hash_in_flight", "gauge", "bcrypt calls running or queued (password_hasher.py).")
+    out.append(f"dhi_auth_hash_in_flight {HASH_STATS.in_flight}")
+    _header(out, "dhi_auth_hash_rejected_total", "counter", "bcrypt calls refused with 503, pool full.")
+    out.append(f"dhi_auth_hash_rejected_total {HASH_STATS.rejected}")
+    _header(out, "dhi_auth_throttled_total", "counter", "Login/signup attempts refused with 429 (login_throttle.py).")
+    out.append(f'dhi_auth_throttled_total{{bucket="ip"}} {LOGIN_THROTTLE.ips.rejected}')
+    out.append(f'dhi_auth_throttled_total{{bucket="username"}} {LOGIN_THROTTLE.users.rejected}')
+    _header(out, "dhi_write_behind_pending", "gauge", "Buffered timestamp updates not yet written (write_behind.py).")
+    for buf in BUFFERS:
+        out.append(f"dhi_write_behind_pending{{{_labels({'buffer': buf.name})}}} {buf.stats()['pending']}")
+
+    out.append("")
+    return "\n".join(out)
@@ -0,0 +1,283 @@
+# backend/routes/migrations.py
+# Versioned schema migrations (backend/migrations/NNNN_name.sql).
+#
+#   python -m backend.routes.migrations status
+#   python -m backend.routes.migrations up [--to N]
+#
+# Migrations run under a Postgres advisory lock, so when several processes
+# start together only one applies them and the others wait and find nothing
+# pending. App startup only compares versions (one cheap SELECT).
+#
+# A file whose first line is `-- migrate: no-transaction` runs in autocommit,
+# one statement per `;`-terminated line (needed for CREATE INDEX CONCURRENTLY).
+# Such files must not contain function bodies; instead, a statement preceded by
+# `-- migrate: if-extension <name>` is skipped (with a notice) when that
+# extension is not installed. A failed CREATE INDEX
+# CONCURRENTLY leaves an INVALID index that IF NOT EXISTS would then skip, so
+# the runner drops invalid leftovers before each build and refuses to record
+# the version unless every index the file builds is valid.
+#
+# After applying anything, `up` sends NOTIFY dhi_schema_changed so running
+# apps refresh their schema catalog.
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import pathlib
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import psycopg
+
+from .db_connection import DSN, PG_SCHEMA, _flag, _schema_sql, async_query
+from .schema_catalog import SCHEMA_CHANNEL
+
+MIGRATIONS_DIR = pathlib.Path(__file__).resolve().parent.parent / "migrations"
+
+# Arbitrary but fixed key shared by every process of this app.
+_LOCK_KEY = 0x44484931  # "DHI1"
+
+_FILE_RE = re.compile(r"^(\d{4})_([a-z0-9_]+)\.sql$")
+
+_CONCURRENT_INDEX_RE = re.compile(
+    r"^\s*CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?([a-z_][a-z0-9_]*)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_IF_EXTENSION_RE = re.compile(r"^--\s*migrate:\s*if-extension\s+([a-z_][a-z0-9_]*)\s*$", re.IGNORECASE)
+
+_INDEX_VALID_SQL = """
+SELECT i.indisvalid
+FROM pg_index i
+JOIN pg_class c     ON c.oid = i.indexrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = %s AND c.relname = %s;
+"""
+
+PG_MIGRATE_ON_STARTUP: bool = _flag("PGMIGRATE_ON_STARTUP", False)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    sql: str
+    checksum: str
+    transactional: bool
+
+
+def discover() -> List[Migration]:
+    out: List[Migration] = []
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        m = _FILE_RE.match(path.name)
+        if not m:
+            continue
+        sql = path.read_text(encoding="utf-8")
+        first = sql.lstrip().splitlines()[0] if sql.strip() else ""
+        out.append(
+            Migration(
+                version=int(m.group(1)),
+                name=m.group(2),
+                sql=sql,
+                checksum=hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+                transactional=first.strip().lower() != "-- migrate: no-transaction",
+            )
+        )
+    versions = [mg.version for mg in out]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("duplicate migration version in backend/migrations")
+    return out
+
+
+def latest_version() -> int:
+    found = discover()
+    return found[-1].version if found else 0
+
+
+def _version_table() -> str:
+    _schema_sql()  # validates PG_SCHEMA
+    return f"{PG_SCHEMA}.schema_migrations"
+
+
+def _split_statements(sql: str) -> List[Tuple[str, Optional[str]]]:
+    """(statement, extension it requires or None) per `;`-terminated statement."""
+    stmts: List[Tuple[str, Optional[str]]] = []
+    buf: List[str] = []
+    requires: Optional[str] = None
+    for line in sql.splitlines():
+        if not buf and not line.strip():
+            continue
+        if line.strip().startswith("--") and not buf:
+            m = _IF_EXTENSION_RE.match(line.strip())
+            if m:
+                requires = m.group(1).lower()
+            continue
+        buf.append(line)
+        if line.rstrip().endswith(";"):
+            stmt = "\n".join(buf).strip()
+            if stmt:
+                stmts.append((stmt, requires))
+            buf, requires = [], None
+    tail = "\n".join(buf).strip()
+    if tail:
+        stmts.append((tail, requires))
+    return stmts
+
+
+def _index_valid(conn: psycopg.Connection, name: str) -> Optional[bool]:
+    """indisvalid of index `name` in PG_SCHEMA; None when it does not exist."""
+    row = conn.execute(_INDEX_VALID_SQL, (PG_SCHEMA, name.lower())).fetchone()
+    return None if row is None else bool(row[0])
+
+
+def _drop_invalid_index(conn: psycopg.Connection, name: str) -> None:
+    if _index_valid(conn, name) is False:
+        print(f"[migrate] dropping invalid index {name} left by an earlier failed build")
+        conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {PG_SCHEMA}.{name};")
+
+
+def _run_no_transaction(conn: psycopg.Connection, mg: Migration) -> None:
+    for stmt, requires in _split_statements(mg.sql):
+        if requires and conn.execute("SELECT 1 FROM pg_extension WHERE extname = %s;", (requires,)).fetchone() is None:
+            print(f"[migrate] {mg.version:04d}_{mg.name}: {requires} not installed, skipping: {stmt.splitlines()[0]}")
+            continue
+        m = _CONCURRENT_INDEX_RE.search(stmt)
+        if m is None:
+            conn.execute(stmt)
+            continue
+        name = m.group(1)
+        _drop_invalid_index(conn, name)
+        try:
+            conn.execute(stmt)
+        except psycopg.Error:
+            _drop_invalid_index(conn, name)  # next run starts clean
+            raise
+        if not _index_valid(conn, name):
+            raise RuntimeError(f"{mg.version:04d}_{mg.name}: index {name} is missing or invalid after build")
+
+
+def _applied(conn: psycopg.Connection) -> Dict[int, str]:
+    rows = conn.execute(f"SELECT version, checksum FROM {_version_table()} ORDER BY version;").fetchall()
+    return {int(v): c for v, c in rows}
+
+
+def _ensure_version_table(conn: psycopg.Connection) -> None:
+    conn.execute(f"CREATE SCHEMA IF NOT EXISTS {PG_SCHEMA};")
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {_version_table()} (
+            version    INT PRIMARY KEY,
+            name       TEXT NOT NULL,
+            checksum   TEXT NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        """
+    )
+
+
+def migrate(target: Optional[int] = None) -> List[int]:
+    """Apply pending migrations up to `target` (default: all). Returns applied versions."""
+    done: List[int] = []
+    with psycopg.connect(DSN, autocommit=True) as conn:
+        conn.execute("SELECT pg_advisory_lock(%s);", (_LOCK_KEY,))
+        try:
+            conn.execute(_schema_sql())
+            _ensure_version_table(conn)
+            applied = _applied(conn)
+            for mg in discover():
+                if mg.version in applied:
+                    if applied[mg.version] != mg.checksum:
+                        print(f"[migrate] WARNING: {mg.version:04d}_{mg.name} changed after it was applied")
+                    continue
+                if target is not None and mg.version > target:
+                    break
+                print(f"[migrate] applying {mg.version:04d}_{mg.name}")
+                record = (
+                    f"INSERT INTO {_version_table()} (version, name, checksum) VALUES (%s, %s, %s);",
+                    (mg.version, mg.name, mg.checksum),
+                )
+                if mg.transactional:
+                    with conn.transaction():
+                        conn.execute(mg.sql)
+                        conn.execute(*record)
+                else:
+                    _run_no_transaction(conn, mg)
+                    conn.execute(*record)
+                done.append(mg.version)
+            if done:
+                # Running apps reload their schema catalog (schema_catalog.py).
+                conn.execute("SELECT pg_notify(%s, %s);", (SCHEMA_CHANNEL, str(done[-1])))
+        finally:
+            conn.execute("SELECT pg_advisory_unlock(%s);", (_LOCK_KEY,))
+    return done
+
+
+def status() -> List[Dict[str, object]]:
+    with psycopg.connect(DSN, autocommit=True) as conn:
+        try:
+            applied = _applied(conn)
+        except psycopg.errors.UndefinedTable:
+            applied = {}
+    return [
+        {
+            "version": mg.version,
+            "name": mg.name,
+            "applied": mg.version in applied,
+            "modified": mg.version in applied and applied[mg.version] != mg.checksum,
+        }
+        for mg in discover()
+    ]
+
+
+async def check_schema_version() -> int:
+    """
+    Startup check: compare the recorded schema version with the newest file.
+    Warns when behind; with PGMIGRATE_ON_STARTUP=on it migrates instead.
+    """
+    expected = latest_version()
+    try:
+        rows = await async_query(f"SELECT COALESCE(MAX(version), 0) AS v FROM {_version_table()};")
+        current = int(rows[0]["v"]) if rows else 0
+    except psycopg.errors.UndefinedTable:
+        current = 0
+
+    if current < expected and PG_MIGRATE_ON_STARTUP:
+        await asyncio.to_thread(migrate)
+        current = expected
+
+    if current < expected:
+        print(
+            f"[migrate] WARNING: schema at version {current}, code expects {expected}. "
+            "Run: python -m backend.routes.migrations up"
+        )
+    elif current > expected:
+        print(f"[migrate] WARNING: schema version {current} is newer than this code ({expected})")
+    else:
+        print(f"[migrate] schema version {current} OK")
+    return current
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="DHI schema migrations")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("status", help="list migrations and whether they are applied")
+    up = sub.add_parser("up", help="apply pending migrations")
+    up.add_argument("--to", type=int, default=None, help="stop after this version")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "status":
+        for row in status():
+            flag = "applied" if row["applied"] else "pending"
+            if row["modified"]:
+                flag += " (modified)"
+            print(f"{row['version']:04d}_{row['name']:<40} {flag}")
+    else:
+        applied = migrate(args.to)
+        if applied:
+            print(f"[migrate] applied: {', '.join(f'{v:04d}' for v in applied)}")
+        else:
+            print("[migrate] nothing to apply")
+
+
+if __name__ == "__main__":
+    main()
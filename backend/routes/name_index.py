@@ -0,0 +1,370 @@
+# backend/routes/name_index.py
+# In-process resolver for candidate names and (job_title, company) pairs, so
+# Applications.py can turn a name into an id without a round trip.
+#
+# Exact matches come from hash maps; fuzzy matches from a trigram inverted
+# index scored the way pg_trgm's similarity() scores them. Names are loaded at
+# startup and kept current by the write handlers in this process plus a
+# trigger-fed NOTIFY channel (migration 0008) for writes made elsewhere.
+#
+# Compact layout: every distinct trigram gets an int code; each name keeps a
+# sorted array('i') of codes and each code an array('i') posting list of ids.
+# Postings are append-only: a renamed or deleted id leaves stale entries that
+# scoring ignores (it always reads the id's current codes), and the postings
+# are rebuilt once stale entries pass a quarter of the total.
+#
+# Resolution runs on the event loop, so its cost per call is bounded: query
+# trigrams with more than NAME_INDEX_MAX_POSTINGS ids (common ones at 1M rows)
+# are not merged, and when the rest cannot narrow the match to that many ids
+# the name is resolved in Postgres (pg_trgm) instead.
+#
+# NAME_INDEX=off disables it; resolution then goes straight to Postgres.
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from psycopg.rows import dict_row
+
+from .db_connection import LISTENER, _env, _flag, async_query, async_transaction
+
+NAME_INDEX_ENABLED: bool = _flag("NAME_INDEX", True)
+NAME_INDEX_MAX_POSTINGS: int = int(_env("NAME_INDEX_MAX_POSTINGS", "10000"))
+
+NAMES_CHANNEL = "dhi_names_changed"
+
+_LOAD_BATCH = 5000
+
+
+def trigrams(text: Optional[str]) -> Set[str]:
+    """Same trigram set pg_trgm builds: lowercase alnum words padded '  w '."""
+    out: Set[str] = set()
+    if not text:
+        return out
+    word: List[str] = []
+    for ch in text.lower() + " ":
+        if ch.isalnum():
+            word.append(ch)
+        elif word:
+            padded = "  " + "".join(word) + " "
+            for i in range(len(padded) - 2):
+                out.add(padded[i:i + 3])
+            word = []
+    return out
+
+
+class _TrigramSet:
+    """Trigram postings for one text field of one table."""
+
+    def __init__(self, codes: Dict[str, int]) -> None:
+        self._codes = codes                      # shared trigram -> code
+        self.items: Dict[int, array] = {}        # id -> sorted codes
+        self.postings: Dict[int, array] = {}     # code -> ids (may hold stale ids)
+        self.stale = 0
+        self.total = 0
+
+    def _encode(self, grams: Iterable[str]) -> array:
+        codes = self._codes
+        out = []
+        for g in grams:
+            c = codes.get(g)
+            if c is None:
+                c = codes[g] = len(codes)
+            out.append(c)
+        out.sort()
+        return array("i", out)
+
+    def put(self, item_id: int, text: Optional[str]) -> None:
+        new = self._encode(trigrams(text))
+        old = self.items.get(item_id)
+        if old is not None:
+            if old == new:
+                return
+            self.stale += len(old)
+        self.items[item_id] = new
+        for c in new:
+            self.postings.setdefault(c, array("i")).append(item_id)
+        self.total += len(new)
+        if self.stale * 4 > self.total:
+            self._compact()
+
+    def remove(self, item_id: int) -> None:
+        old = self.items.pop(item_id, None)
+        if old is not None:
+            self.stale += len(old)
+            if self.stale * 4 > self.total:
+                self._compact()
+
+    def _compact(self) -> None:
+        postings: Dict[int, array] = {}
+        for item_id, codes in self.items.items():
+            for c in codes:
+                postings.setdefault(c, array("i")).append(item_id)
+        self.postings = postings
+        self.total = sum(len(v) for v in self.items.values())
+        self.stale = 0
+
+    def candidates(self, q: Set[str], threshold: float) -> Optional[Set[int]]:
+        """
+        Ids that can reach `threshold`. similarity <= shared/|q|, so a match
+        shares at least ceil(t*|q|) of the query trigrams: count postings hits
+        per id (Counter.update runs in C) and keep those with enough. Stale
+        postings only over-count, so nothing that qualifies is dropped.
+
+        Posting lists longer than NAME_INDEX_MAX_POSTINGS are skipped; a match
+        still shares `need - skipped` of the others. None when that is <= 0 or
+        more than NAME_INDEX_MAX_POSTINGS ids remain: the caller scores every
+        id returned, so it cannot be narrowed cheaply enough.
+        """
+        if not q:
+            return set()
+        need = max(1, math.ceil(threshold * len(q) - 1e-9))
+        codes = self._codes
+        lists = []
+        for g in q:
+            c = codes.get(g)
+            postings = self.postings.get(c) if c is not None else None
+            if postings is None:
+                continue
+            if len(postings) > NAME_INDEX_MAX_POSTINGS:
+                need -= 1
+            else:
+                lists.append(postings)
+        if need <= 0:
+            return None
+        hits: Counter = Counter()
+        for postings in lists:
+            hits.update(postings)
+        pool = {i for i, n in hits.items() if n >= need}
+        return pool if len(pool) <= NAME_INDEX_MAX_POSTINGS else None
+
+    def similarity(self, item_id: int, q_codes: Set[int], q_len: int) -> float:
+        codes = self.items.get(item_id)
+        if codes is None or not q_len:
+            return 0.0
+        shared = sum(1 for c in codes if c in q_codes)
+        union = q_len + len(codes) - shared
+        return shared / union if union else 0.0
+
+
+class NameIndex:
+    def __init__(self) -> None:
+        self._codes: Dict[str, int] = {}
+        self._cand_names: Dict[int, str] = {}
+        self._cand_exact: Dict[str, int] = {}
+        self._cand_trgm = _TrigramSet(self._codes)
+        self._jobs: Dict[int, Tuple[str, str]] = {}
+        self._job_exact: Dict[Tuple[str, str], int] = {}
+        self._title_trgm = _TrigramSet(self._codes)
+        self._company_trgm = _TrigramSet(self._codes)
+        self.ready = False
+        self.loaded_at: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+        self.too_common = 0  # fuzzy lookups left to Postgres (all-common trigrams)
+        self._pending: Optional[List[str]] = None  # changes seen while load() runs
+
+    # ----- maintenance -----
+    def upsert_candidate(self, cid: int, full_name: Optional[str]) -> None:
+        old = self._cand_names.get(cid)
+        if old is not None and self._cand_exact.get(old) == cid:
+            del self._cand_exact[old]
+        if not full_name:
+            self.remove_candidate(cid)
+            return
+        self._cand_names[cid] = full_name
+        cur = self._cand_exact.get(full_name)
+        if cur is None or cid < cur:
+            self._cand_exact[full_name] = cid
+        self._cand_trgm.put(cid, full_name)
+
+    def remove_candidate(self, cid: int) -> None:
+        old = self._cand_names.pop(cid, None)
+        if old is not None and self._cand_exact.get(old) == cid:
+            # another candidate with the same name still matches via fuzzy (sim 1.0)
+            del self._cand_exact[old]
+        self._cand_trgm.remove(cid)
+
+    def upsert_job(self, jid: int, job_title: Optional[str], company: Optional[str]) -> None:
+        old = self._jobs.get(jid)
+        if old is not None and self._job_exact.get(old) == jid:
+            del self._job_exact[old]
+        if not job_title or not company:
+            self.remove_job(jid)
+            return
+        key = (job_title, company)
+        self._jobs[jid] = key
+        cur = self._job_exact.get(key)
+        if cur is None or jid < cur:
+            self._job_exact[key] = jid
+        self._title_trgm.put(jid, job_title)
+        self._company_trgm.put(jid, company)
+
+    def remove_job(self, jid: int) -> None:
+        old = self._jobs.pop(jid, None)
+        if old is not None and self._job_exact.get(old) == jid:
+            del self._job_exact[old]
+        self._title_trgm.remove(jid)
+        self._company_trgm.remove(jid)
+
+    # ----- resolution -----
+    def _query(self, text: str) -> Tuple[Set[str], Set[int]]:
+        q = trigrams(text)
+        return q, {self._codes[g] for g in q if g in self._codes}
+
+    def resolve_candidate(self, name: str, threshold: float) -> Optional[int]:
+        """Exact name, else the most similar name scoring >= threshold."""
+        cid = self._cand_exact.get(name)
+        if cid is None:
+            q, q_codes = self._query(name)
+            pool = self._cand_trgm.candidates(q, threshold)
+            if pool is None:
+                self.too_common += 1
+                return None
+            best, best_sim = None, threshold
+            for i in pool:
+                sim = self._cand_trgm.similarity(i, q_codes, len(q))
+                if sim > best_sim or (sim == best_sim and (best is None or i < best)):
+                    best, best_sim = i, sim
+            cid = best
+        if cid is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cid
+
+    def resolve_job(self, job_title: str, company: str, threshold: float) -> Optional[int]:
+        """
+        Exact pair, else the best average of title and company similarity
+        scoring >= threshold. avg >= t needs max(title, company) >= t, so only
+        ids reaching t on one side are scored.
+        """
+        jid = self._job_exact.get((job_title, company))
+        if jid is None:
+            qt, qt_codes = self._query(job_title)
+            qc, qc_codes = self._query(company)
+            titles = self._title_trgm.candidates(qt, threshold)
+            companies = self._company_trgm.candidates(qc, threshold)
+            if titles is None or companies is None:
+                self.too_common += 1
+                return None
+            pool = titles | companies
+            best, best_sim = None, threshold
+            for i in pool:
+                avg = (
+                    self._title_trgm.similarity(i, qt_codes, len(qt))
+                    + self._company_trgm.similarity(i, qc_codes, len(qc))
+                ) / 2.0
+                if avg > best_sim or (avg == best_sim and (best is None or i < best)):
+                    best, best_sim = i, avg
+            jid = best
+        if jid is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return jid
+
+    def resolve_candidates(self, names: Sequence[str], threshold: float) -> Dict[str, Optional[int]]:
+        """Batch form of resolve_candidate (each distinct name scored once)."""
+        return {n: self.resolve_candidate(n, threshold) for n in dict.fromkeys(names)}
+
+    def resolve_jobs(
+        self, pairs: Sequence[Tuple[str, str]], threshold: float
+    ) -> Dict[Tuple[str, str], Optional[int]]:
+        return {p: self.resolve_job(p[0], p[1], threshold) for p in dict.fromkeys(pairs)}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "loaded_at": self.loaded_at,
+            "candidates": len(self._cand_names),
+            "jobs": len(self._jobs),
+            "trigrams": len(self._codes),
+            "hits": self.hits,
+            "misses": self.misses,
+            "too_common": self.too_common,
+            "max_postings": NAME_INDEX_MAX_POSTINGS,
+        }
+
+    # ----- loading -----
+    async def load(self) -> None:
+        """(Re)build from the tables; streamed with server-side cursors."""
+        fresh = NameIndex()
+        self._pending = []
+        try:
+            async with async_transaction() as conn:
+                async with conn.cursor(name="name_index_candidates", row_factory=dict_row) as cur:
+                    cur.itersize = _LOAD_BATCH
+                    await cur.execute("SELECT id, full_name FROM candidates WHERE full_name IS NOT NULL ORDER BY id;")
+                    async for r in cur:
+                        fresh.upsert_candidate(int(r["id"]), r["full_name"])
+                async with conn.cursor(name="name_index_jobs", row_factory=dict_row) as cur:
+                    cur.itersize = _LOAD_BATCH
+                    await cur.execute("SELECT id, job_title, company FROM jobs ORDER BY id;")
+                    async for r in cur:
+                        fresh.upsert_job(int(r["id"]), r["job_title"], r["company"])
+            self._codes = fresh._codes
+            self._cand_names, self._cand_exact, self._cand_trgm = fresh._cand_names, fresh._cand_exact, fresh._cand_trgm
+            self._jobs, self._job_exact = fresh._jobs, fresh._job_exact
+            self._title_trgm, self._company_trgm = fresh._title_trgm, fresh._company_trgm
+            self.ready, self.loaded_at = True, time.time()
+        finally:
+            # a failed load must not leave apply_change queueing for ever
+            pending, self._pending = self._pending, None
+        for payload in pending:
+            await self.apply_change(payload)
+
+    async def apply_change(self, payload: str) -> None:
+        """NOTIFY payload '<table>:<id>' from the 0008 triggers."""
+        if self._pending is not None:
+            self._pending.append(payload)
+            return
+        table, _, raw_id = payload.partition(":")
+        try:
+            item_id = int(raw_id)
+        except ValueError:
+            return
+        if table == "candidates":
+            rows = await async_query("SELECT full_name FROM candidates WHERE id = %(id)s;", {"id": item_id}, prepare=True)
+            if rows:
+                self.upsert_candidate(item_id, rows[0]["full_name"])
+            else:
+                self.remove_candidate(item_id)
+        elif table == "jobs":
+            rows = await async_query(
+                "SELECT job_title, company FROM jobs WHERE id = %(id)s;", {"id": item_id}, prepare=True
+            )
+            if rows:
+                self.upsert_job(item_id, rows[0]["job_title"], rows[0]["company"])
+            else:
+                self.remove_job(item_id)
+
+
+NAME_INDEX = NameIndex()
+
+
+async def start_name_index() -> None:
+    if not NAME_INDEX_ENABLED:
+        return
+    # listen first: changes arriving during the load are replayed after it
+    LISTENER.subscribe(NAMES_CHANNEL, NAME_INDEX.apply_change, NAME_INDEX.load, tag="names")
+    if not await LISTENER.listening(NAMES_CHANNEL):
+        print(f"[names] not listening on {NAMES_CHANNEL} yet; reloading once it is")
+    try:
+        t0 = time.perf_counter()
+        await NAME_INDEX.load()
+        s = NAME_INDEX.stats()
+        print(
+            f"[names] index loaded: {s['candidates']} candidates, {s['jobs']} jobs, "
+            f"{s['trigrams']} trigrams in {time.perf_counter() - t0:.2f}s"
+        )
+    except Exception as e:
+        print(f"[names] index load failed, resolving in Postgres: {e}")
+
+
+async def stop_name_index() -> None:
+    await LISTENER.unsubscribe(NAMES_CHANNEL)
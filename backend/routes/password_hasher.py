@@ -0,0 +1,151 @@
+# backend/routes/password_hasher.py
+# bcrypt off the event loop. hashpw/checkpw at 12 rounds cost ~250 ms of CPU
+# each; called inline they stall every request in the worker. Here they run on
+# a small dedicated thread pool (bcrypt releases the GIL while hashing), and
+# at most AUTH_HASH_MAX_INFLIGHT calls may be running or queued at once. Past
+# that, submit() raises HashPoolSaturated straight away and the auth routes
+# answer 503 instead of piling up seconds of queued work.
+#
+#   AUTH_HASH_WORKERS       threads (default: min(4, CPUs))
+#   AUTH_HASH_MAX_INFLIGHT  running + queued calls (default: 8 per thread)
+#
+# Counters are touched from the event loop only (completion is handed back
+# with call_soon_threadsafe), so plain ints are enough, as in pool_stats.py.
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .db_connection import _env
+
+T = TypeVar("T")
+
+AUTH_HASH_WORKERS: int = max(1, int(_env("AUTH_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))))
+AUTH_HASH_MAX_INFLIGHT: int = max(1, int(_env("AUTH_HASH_MAX_INFLIGHT", str(AUTH_HASH_WORKERS * 8))))
+
+# Upper bounds (ms) of the queue-wait and run-time histograms; the last bucket is +Inf.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class HashPoolSaturated(Exception):
+    """AUTH_HASH_MAX_INFLIGHT calls are already running or queued."""
+
+
+class HashStats:
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.wait_ms_total = 0.0
+        self.run_ms_total = 0.0
+        self.run_ms_max = 0.0
+        self.wait_buckets: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.run_buckets: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record_submit(self) -> None:
+        self.submitted += 1
+        self.in_flight += 1
+        if self.in_flight > self.peak_in_flight:
+            self.peak_in_flight = self.in_flight
+
+    def record_done(self, wait_ms: float, run_ms: float, ok: bool) -> None:
+        self.in_flight -= 1
+        if ok:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.wait_ms_total += wait_ms
+        self.run_ms_total += run_ms
+        if run_ms > self.run_ms_max:
+            self.run_ms_max = run_ms
+        self.wait_buckets[bisect_left(LATENCY_BUCKETS_MS, wait_ms)] += 1
+        self.run_buckets[bisect_left(LATENCY_BUCKETS_MS, run_ms)] += 1
+
+    @staticmethod
+    def _histogram(buckets: List[int]) -> Dict[str, int]:
+        labels = [f"le_{b}ms" for b in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return dict(zip(labels, buckets))
+
+    def snapshot(self) -> Dict[str, Any]:
+        done = self.completed + self.failed
+        return {
+            "workers": AUTH_HASH_WORKERS,
+            "max_in_flight": AUTH_HASH_MAX_INFLIGHT,
+            "in_flight": self.in_flight,
+            # the pool is FIFO, so everything past the busy threads is waiting
+            "queue_depth": max(0, self.in_flight - AUTH_HASH_WORKERS),
+            "peak_in_flight": self.peak_in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "wait_ms_avg": round(self.wait_ms_total / done, 2) if done else 0.0,
+            "run_ms_avg": round(self.run_ms_total / done, 2) if done else 0.0,
+            "run_ms_max": round(self.run_ms_max, 2),
+            "wait_histogram": self._histogram(self.wait_buckets),
+            "run_histogram": self._histogram(self.run_buckets),
+        }
+
+
+HASH_STATS = HashStats()
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=AUTH_HASH_WORKERS, thread_name_prefix="bcrypt")
+    return _executor
+
+
+def _timed(fn: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[float, T]:
+    started = time.monotonic()
+    return started, fn(*args)
+
+
+async def submit(fn: Callable[..., T], *args: Any) -> T:
+    """Run fn(*args) on the hashing pool; HashPoolSaturated when it is full."""
+    if HASH_STATS.in_flight >= AUTH_HASH_MAX_INFLIGHT:
+        HASH_STATS.rejected += 1
+        raise HashPoolSaturated(f"{HASH_STATS.in_flight} password checks in flight")
+
+    loop = asyncio.get_running_loop()
+    queued = time.monotonic()
+    HASH_STATS.record_submit()
+    cf = _get_executor().submit(_timed, fn, args)
+
+    def _finished(f: "Future[Tuple[float, T]]") -> None:
+        # worker thread (or the caller, if cancelled before starting)
+        end = time.monotonic()
+        if f.cancelled() or f.exception() is not None:
+            started, ok = end, False
+        else:
+            started, ok = f.result()[0], True
+        try:
+            loop.call_soon_threadsafe(HASH_STATS.record_done, (started - queued) * 1000.0, (end - started) * 1000.0, ok)
+        except RuntimeError:  # loop already closed (shutdown)
+            pass
+
+    # counted until the work really ends, even if the awaiting request goes away
+    cf.add_done_callback(_finished)
+    _, result = await asyncio.wrap_future(cf)
+    return result
+
+
+def hash_stats() -> Dict[str, Any]:
+    return HASH_STATS.snapshot()
+
+
+def shutdown_hasher() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
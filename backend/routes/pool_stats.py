@@ -0,0 +1,90 @@
+# backend/routes/pool_stats.py
+# In-process counters for the async connection pool.
+# Updated from the event loop only, so plain ints are enough (no locks).
+from __future__ import annotations
+
+import time
+import weakref
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+# Upper bounds (ms) of the connection wait-time histogram; the last bucket is +Inf.
+WAIT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolStats:
+    def __init__(self) -> None:
+        self.acquired = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.wait_buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.in_use = 0
+        self.peak_in_use = 0          # since the last take_window()
+        self.query_errors = 0
+        self.timeouts = 0
+        self.resizes = 0
+        self._window_acquired = 0
+        self._window_wait_ms = 0.0
+        self._born: "weakref.WeakKeyDictionary[Any, float]" = weakref.WeakKeyDictionary()
+
+    # ----- connection lifecycle -----
+    def note_connection(self, conn: Any) -> None:
+        self._born[conn] = time.monotonic()
+
+    def connection_ages(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        ages = [now - t for c, t in list(self._born.items()) if not c.closed]
+        if not ages:
+            return {"count": 0, "age_s_min": None, "age_s_max": None, "age_s_avg": None}
+        return {
+            "count": len(ages),
+            "age_s_min": round(min(ages), 1),
+            "age_s_max": round(max(ages), 1),
+            "age_s_avg": round(sum(ages) / len(ages), 1),
+        }
+
+    # ----- checkout / checkin -----
+    def record_acquire(self, wait_ms: float) -> None:
+        self.acquired += 1
+        self.wait_ms_total += wait_ms
+        if wait_ms > self.wait_ms_max:
+            self.wait_ms_max = wait_ms
+        self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+        self._window_acquired += 1
+        self._window_wait_ms += wait_ms
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+
+    def record_release(self) -> None:
+        self.in_use -= 1
+
+    def take_window(self) -> Dict[str, Any]:
+        """Acquisitions, mean wait and peak in-use since the previous call."""
+        n = self._window_acquired
+        out = {
+            "acquired": n,
+            "wait_ms_avg": (self._window_wait_ms / n) if n else 0.0,
+            "peak_in_use": self.peak_in_use,
+        }
+        self._window_acquired = 0
+        self._window_wait_ms = 0.0
+        self.peak_in_use = self.in_use
+        return out
+
+    def histogram(self) -> Dict[str, int]:
+        labels = [f"le_{b}ms" for b in WAIT_BUCKETS_MS] + ["le_inf"]
+        return dict(zip(labels, self.wait_buckets))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "wait_ms_total": round(self.wait_ms_total, 2),
+            "wait_ms_avg": round(self.wait_ms_total / self.acquired, 3) if self.acquired else 0.0,
+            "wait_ms_max": round(self.wait_ms_max, 2),
+            "wait_histogram": self.histogram(),
+            "in_use": self.in_use,
+            "errors": {"query": self.query_errors, "timeouts": self.timeouts},
+            "resizes": self.resizes,
+            "connections": self.connection_ages(),
+        }
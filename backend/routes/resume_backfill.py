@@ -0,0 +1,116 @@
+# backend/routes/resume_backfill.py
+# Moves legacy candidates.resume_data bytea into the blob store, in batches.
+#
+#   python -m backend.routes.resume_backfill [--batch 20] [--max-batches N]
+#
+# Safe to run from several processes at once (rows are claimed with
+# FOR UPDATE SKIP LOCKED). App startup runs it in the background when
+# RESUME_BACKFILL=on.
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+from typing import Optional
+
+from psycopg.rows import dict_row
+
+from .blob_store import get_blob_store, lock_digest
+from .db_connection import _env, _flag, async_transaction, close_async_pool, open_async_pool
+
+RESUME_BACKFILL: bool = _flag("RESUME_BACKFILL", False)
+BACKFILL_BATCH: int = int(_env("RESUME_BACKFILL_BATCH", "20"))
+BACKFILL_PAUSE_SECONDS: float = float(_env("RESUME_BACKFILL_PAUSE", "0.5"))
+
+_task: Optional["asyncio.Task[None]"] = None
+
+
+async def backfill_batch(batch_size: int = BACKFILL_BATCH) -> int:
+    """Move one batch; returns how many rows were moved (0 when done)."""
+    store = get_blob_store()
+    async with async_transaction() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(
+                """
+                SELECT id, resume_data
+                FROM candidates
+                WHERE resume_data IS NOT NULL AND resume_sha256 IS NULL
+                ORDER BY id
+                LIMIT %(n)s
+                FOR UPDATE SKIP LOCKED;
+                """,
+                {"n": batch_size},
+            )
+            rows = await cur.fetchall()
+            for r in rows:
+                data = bytes(r["resume_data"])
+                # held until commit: a concurrent release of this digest waits
+                await lock_digest(conn, hashlib.sha256(data).hexdigest())
+                digest, size = await store.put_bytes(data)
+                await cur.execute(
+                    """
+                    UPDATE candidates
+                    SET resume_sha256 = %(d)s,
+                        resume_size_bytes = %(size)s,
+                        resume_data = NULL
+                    WHERE id = %(id)s;
+                    """,
+                    {"d": digest, "size": size, "id": r["id"]},
+                )
+    return len(rows)
+
+
+async def run_backfill(batch_size: int = BACKFILL_BATCH, max_batches: Optional[int] = None) -> int:
+    moved = batches = 0
+    while max_batches is None or batches < max_batches:
+        n = await backfill_batch(batch_size)
+        if n == 0:
+            break
+        moved += n
+        batches += 1
+        await asyncio.sleep(BACKFILL_PAUSE_SECONDS)
+    return moved
+
+
+async def _background() -> None:
+    try:
+        moved = await run_backfill()
+        print(f"[resumes] backfill finished: {moved} resume(s) moved to the blob store")
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[resumes] backfill error: {e}")
+
+
+def start_resume_backfill() -> None:
+    global _task
+    if RESUME_BACKFILL and (_task is None or _task.done()):
+        _task = asyncio.get_running_loop().create_task(_background())
+
+
+def stop_resume_backfill() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        _task = None
+
+
+async def _main(batch: int, max_batches: Optional[int]) -> None:
+    await open_async_pool()
+    try:
+        moved = await run_backfill(batch, max_batches)
+        print(f"[resumes] {moved} resume(s) moved to the blob store")
+    finally:
+        await close_async_pool()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Move candidates.resume_data into the blob store")
+    ap.add_argument("--batch", type=int, default=BACKFILL_BATCH)
+    ap.add_argument("--max-batches", type=int, default=None)
+    args = ap.parse_args()
+    asyncio.run(_main(args.batch, args.max_batches))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,14 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 # Relative import (db_connection.py is in same folder)
-from .db_connection import query, exec_, async_query
+# Async helpers only: handlers run on the event loop and share the async pool.
+from .db_connection import async_query, async_exec, pool_stats
+from .name_index import NAME_INDEX
+from .password_hasher import hash_stats
+from .sessions import SESSIONS
+from .login_throttle import LOGIN_THROTTLE
+from .write_behind import write_behind_stats
+from .schema_catalog import SCHEMA_CATALOG
 
 router = APIRouter(tags=["jobs"])
 
@@ -66,21 +73,56 @@ def map_job_row(row: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 @router.get("/", tags=["health"])
-def root():
+async def root():
     return {"ok": True, "service": "DHI Jobs Router"}
 
 @router.get("/api/health", tags=["health"])
-def health():
+async def health():
     try:
-        _ = query("SELECT 1 AS ok;")
+        _ = await async_query("SELECT 1 AS ok;", prepare=True)
         return {"ok": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/api/health/pool", tags=["health"])
+async def health_pool() -> Dict[str, Any]:
+    """Connection pool occupancy, wait-time histogram, connection ages and errors."""
+    return pool_stats()
+
+@router.get("/api/health/schema", tags=["health"])
+async def health_schema() -> Dict[str, Any]:
+    """Cached table columns (schema_catalog.py) and when they were last loaded."""
+    return SCHEMA_CATALOG.snapshot()
+
+@router.get("/api/health/names", tags=["health"])
+async def health_names() -> Dict[str, Any]:
+    """Size and hit rate of the in-process name index (name_index.py)."""
+    return NAME_INDEX.stats()
+
+@router.get("/api/health/hashing", tags=["health"])
+async def health_hashing() -> Dict[str, Any]:
+    """bcrypt pool occupancy, queue depth, latencies and 503 rejections (password_hasher.py)."""
+    return hash_stats()
+
+@router.get("/api/health/sessions", tags=["health"])
+async def health_sessions() -> Dict[str, Any]:
+    """Session token cache hit rate and revocation set size (sessions.py)."""
+    return SESSIONS.stats()
+
+@router.get("/api/health/write-behind", tags=["health"])
+async def health_write_behind() -> Dict[str, Any]:
+    """Pending and flushed buffered timestamp updates (write_behind.py)."""
+    return write_behind_stats()
+
+@router.get("/api/health/throttle", tags=["health"])
+async def health_throttle() -> Dict[str, Any]:
+    """Login throttle buckets and attempts rejected before lookup (login_throttle.py)."""
+    return LOGIN_THROTTLE.stats()
+
 @router.get("/api/jobs", response_model=List[Dict[str, Any]])
-def list_jobs() -> List[Dict[str, Any]]:
+async def list_jobs() -> List[Dict[str, Any]]:
     try:
-        rows = query(
+        rows = await async_query(
             """
             SELECT
                 id,
@@ -110,14 +152,16 @@ def list_jobs() -> List[Dict[str, Any]]:
                 created_at
             FROM jobs
             ORDER BY COALESCE(created_at, NOW()) DESC, id DESC;
-            """
+            """,
+            prepare=True,
+            read_only=True,
         )
         return [map_job_row(r) for r in rows]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/api/jobs failed: {e}")
 
 @router.post("/api/jobs", status_code=status.HTTP_201_CREATED)
-def create_job(data: dict = Body(...)):
+async def create_job(data: dict = Body(...)):
     if not data.get("job_title"):
         raise HTTPException(status_code=400, detail="Missing job_title")
     if not data.get("company"):
@@ -140,9 +184,10 @@ def create_job(data: dict = Body(...)):
         )
         RETURNING id;
         """
-        rows = query(sql, data)
+        rows = await async_query(sql, data)
         if not rows:
             raise HTTPException(status_code=500, detail="Insert failed")
+        NAME_INDEX.upsert_job(int(rows[0]["id"]), data.get("job_title"), data.get("company"))
         return {"ok": True, "id": str(rows[0]["id"])}
     except HTTPException:
         raise
@@ -150,7 +195,7 @@ def create_job(data: dict = Body(...)):
         raise HTTPException(status_code=500, detail=f"/api/jobs (POST) failed: {e}")
 
 @router.put("/api/jobs/{job_id}", status_code=status.HTTP_200_OK)
-def update_job(job_id: str = Path(..., description="Job ID"), data: dict = Body(...)):
+async def update_job(job_id: str = Path(..., description="Job ID"), data: dict = Body(...)):
     """
     Update an existing job identified by job_id.
     Expects the same DB-keyed payload as POST (job_title, company, etc).
@@ -197,9 +242,10 @@ def update_job(job_id: str = Path(..., description="Job ID"), data: dict = Body(
         """
         params = dict(data)  # shallow copy
         params["id"] = jid
-        rows = query(sql, params)
+        rows = await async_query(sql, params)
         if not rows:
             raise HTTPException(status_code=404, detail="Job not found")
+        NAME_INDEX.upsert_job(jid, data.get("job_title"), data.get("company"))
         return {"ok": True, "id": str(rows[0]["id"])}
     except HTTPException:
         raise
@@ -207,7 +253,7 @@ def update_job(job_id: str = Path(..., description="Job ID"), data: dict = Body(
         raise HTTPException(status_code=500, detail=f"/api/jobs/{job_id} (PUT) failed: {e}")
 
 @router.patch("/api/jobs/{job_id}/status")
-def update_status(
+async def update_status(
     job_id: str = Path(..., description="Job ID"),
     payload: StatusPayload = None,
 ):
@@ -222,7 +268,7 @@ def update_status(
         raise HTTPException(status_code=400, detail="Invalid job id")
 
     try:
-        affected = exec_(
+        affected = await async_exec(
             "UPDATE jobs SET status = %(status)s, updated_at = NOW() WHERE id = %(id)s;",
             {"status": payload.status, "id": jid},
         )
@@ -235,16 +281,17 @@ def update_status(
         raise HTTPException(status_code=500, detail=f"/api/jobs/{job_id}/status failed: {e}")
 
 @router.delete("/api/jobs/{job_id}")
-def delete_job(job_id: str = Path(..., description="Job ID")):
+async def delete_job(job_id: str = Path(..., description="Job ID")):
     try:
         jid = int(job_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid job id")
 
     try:
-        affected = exec_("DELETE FROM jobs WHERE id = %(id)s;", {"id": jid})
+        affected = await async_exec("DELETE FROM jobs WHERE id = %(id)s;", {"id": jid})
         if affected == 0:
             raise HTTPException(status_code=404, detail="Job not found")
+        NAME_INDEX.remove_job(jid)
         return {"ok": True}
     except HTTPException:
         raise
@@ -252,9 +299,9 @@ def delete_job(job_id: str = Path(..., description="Job ID")):
         raise HTTPException(status_code=500, detail=f"/api/jobs/{job_id} delete failed: {e}")
 
 @router.get("/api/debug/ping-jobs")
-def ping_jobs():
+async def ping_jobs():
     try:
-        r = query("SELECT id FROM jobs ORDER BY id DESC LIMIT 1;", None)
+        r = await async_query("SELECT id FROM jobs ORDER BY id DESC LIMIT 1;", None)
         return {"ok": True, "sample": r}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"debug failed: {e}")
@@ -0,0 +1,107 @@
+# backend/routes/schema_catalog.py
+# In-process copy of the columns (and types) of the tables this app reads,
+# plus the installed extensions, loaded once at startup instead of asking
+# information_schema per request.
+#
+# Refreshed after `migrations up` applies something (it sends a NOTIFY on
+# SCHEMA_CHANNEL) and on any manual `NOTIFY dhi_schema_changed;` — e.g. after
+# hand-run DDL. Notifications arrive through the process-wide listener
+# (db_connection.LISTENER).
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, FrozenSet, Optional
+
+from .db_connection import LISTENER, PG_SCHEMA, async_pipeline
+
+SCHEMA_CHANNEL = "dhi_schema_changed"
+
+CATALOG_TABLES = ("candidates", "jobs", "applications", "applications_view", "applications_read", "login_users")
+
+_COLUMNS_SQL = """
+SELECT c.relname AS table_name,
+       a.attname AS column_name,
+       format_type(a.atttypid, a.atttypmod) AS data_type
+FROM pg_attribute a
+JOIN pg_class c     ON c.oid = a.attrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = %(schema)s
+  AND c.relname = ANY(%(tables)s)
+  AND a.attnum > 0
+  AND NOT a.attisdropped
+ORDER BY c.relname, a.attnum;
+"""
+
+_EXTENSIONS_SQL = "SELECT extname FROM pg_extension;"
+
+
+class SchemaCatalog:
+    def __init__(self) -> None:
+        self._tables: Dict[str, Dict[str, str]] = {}
+        self._extensions: FrozenSet[str] = frozenset()
+        self.loaded_at: Optional[float] = None
+        self.refreshes = 0
+
+    async def refresh(self) -> None:
+        rows, ext_rows = await async_pipeline(
+            [
+                (_COLUMNS_SQL, {"schema": PG_SCHEMA, "tables": list(CATALOG_TABLES)}),
+                (_EXTENSIONS_SQL, None),
+            ]
+        )
+        tables: Dict[str, Dict[str, str]] = {}
+        for r in rows:
+            tables.setdefault(r["table_name"], {})[r["column_name"]] = r["data_type"]
+        # swap in one go; readers never see a half-built map
+        self._tables = tables
+        self._extensions = frozenset(r["extname"] for r in ext_rows)
+        self.loaded_at = time.time()
+        self.refreshes += 1
+
+    async def _ensure_loaded(self) -> None:
+        if self.loaded_at is None:
+            await self.refresh()
+
+    async def columns(self, table: str) -> Dict[str, str]:
+        """column -> type for `table` ({} when the table does not exist)."""
+        await self._ensure_loaded()
+        return dict(self._tables.get(table, {}))
+
+    async def has_column(self, table: str, column: str) -> bool:
+        await self._ensure_loaded()
+        return column in self._tables.get(table, {})
+
+    async def has_extension(self, name: str) -> bool:
+        await self._ensure_loaded()
+        return name in self._extensions
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "schema": PG_SCHEMA,
+            "extensions": sorted(self._extensions),
+            "loaded_at": self.loaded_at,
+            "refreshes": self.refreshes,
+            "tables": {t: dict(cols) for t, cols in self._tables.items()},
+        }
+
+
+SCHEMA_CATALOG = SchemaCatalog()
+
+async def _on_notify(_payload: str) -> None:
+    await SCHEMA_CATALOG.refresh()
+    print(f"[schema] catalog refreshed ({SCHEMA_CHANNEL})")
+
+
+async def start_schema_catalog() -> None:
+    """Load the catalog and start listening for refresh notifications."""
+    try:
+        await SCHEMA_CATALOG.refresh()
+        print(f"[schema] catalog loaded: {', '.join(sorted(SCHEMA_CATALOG.snapshot()['tables']))}")
+    except Exception as e:
+        print(f"[schema] catalog load failed: {e}")
+    LISTENER.subscribe(SCHEMA_CHANNEL, _on_notify, SCHEMA_CATALOG.refresh, tag="schema")
+
+
+async def stop_schema_catalog() -> None:
+    await LISTENER.unsubscribe(SCHEMA_CHANNEL)
@@ -0,0 +1,230 @@
+# backend/routes/sessions.py
+# Signed session tokens for /api/auth/login, verified without Postgres or bcrypt.
+#
+# A token is base64url(claims JSON) + "." + base64url(HMAC-SHA256(claims)),
+# keyed by AUTH_SESSION_SECRET. Claims: uid, u (username), exp (epoch s) and
+# jti (16 random bytes, hex). require_session() checks, per request:
+#   1. an LRU of recently verified tokens (hit: no HMAC, no JSON parsing),
+#   2. otherwise the signature and claims, then caches the result,
+#   3. expiry and the in-memory revocation set, every time.
+# Logout writes the jti to dhi.revoked_sessions (migration 0012). Each process
+# loads the unexpired rows at startup and hears new ones on
+# dhi_sessions_revoked, so a logout elsewhere takes effect within one NOTIFY.
+#
+#   AUTH_SESSION_SECRET     HMAC key, shared by every worker. Without it no
+#                           tokens are issued, and AUTH_REQUIRED=on refuses to
+#                           start
+#   AUTH_SESSION_DEV_KEY    on: without a secret, use a random per-process key
+#                           (single-process dev only: tokens end on restart and
+#                           other workers reject them)
+#   AUTH_SESSION_TTL        token lifetime in seconds (default 8h)
+#   AUTH_SESSION_CACHE_MAX  verified tokens kept in the LRU (default 10000)
+#   AUTH_REQUIRED           on: App.py puts require_session on the API routers
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from fastapi import Header, HTTPException
+
+from .db_connection import LISTENER, _env, _flag, async_exec, async_query
+
+AUTH_SESSION_TTL: int = int(_env("AUTH_SESSION_TTL", str(8 * 3600)))
+AUTH_SESSION_CACHE_MAX: int = int(_env("AUTH_SESSION_CACHE_MAX", "10000"))
+AUTH_REQUIRED: bool = _flag("AUTH_REQUIRED", False)
+AUTH_SESSION_DEV_KEY: bool = _flag("AUTH_SESSION_DEV_KEY", False)
+
+SESSIONS_CHANNEL = "dhi_sessions_revoked"
+
+_SECRET_FROM_ENV = bool(_env("AUTH_SESSION_SECRET", ""))
+_SECRET: bytes = _env("AUTH_SESSION_SECRET", "").encode("utf-8") or (
+    secrets.token_bytes(32) if AUTH_SESSION_DEV_KEY else b""
+)
+# False: no key, so login answers without a token and every token is rejected
+SESSIONS_ENABLED = bool(_SECRET)
+
+# how often (s) expired jtis are dropped from the in-memory set
+_PRUNE_INTERVAL = 60.0
+
+
+class Session(NamedTuple):
+    user_id: int
+    username: str
+    expires_at: int
+    jti: bytes
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(body: str) -> str:
+    return _b64(hmac.new(_SECRET, body.encode("ascii"), hashlib.sha256).digest())
+
+
+class SessionStore:
+    def __init__(self) -> None:
+        self._verified: "OrderedDict[str, Session]" = OrderedDict()
+        self._revoked: Dict[bytes, float] = {}   # jti -> expiry; dropped once expired
+        self._pruned_at = time.time()
+        self.loaded_at: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+    # ----- tokens -----
+    def issue(self, user_id: int, username: str) -> Tuple[str, Session]:
+        if not SESSIONS_ENABLED:
+            raise RuntimeError("session tokens disabled: AUTH_SESSION_SECRET not set")
+        jti = secrets.token_bytes(16)
+        exp = int(time.time()) + AUTH_SESSION_TTL
+        claims = {"uid": int(user_id), "u": username, "exp": exp, "jti": jti.hex()}
+        body = _b64(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        return f"{body}.{_sign(body)}", Session(int(user_id), username, exp, jti)
+
+    def _decode(self, token: str) -> Optional[Session]:
+        if not SESSIONS_ENABLED:
+            return None
+        body, dot, sig = token.partition(".")
+        if not dot or not hmac.compare_digest(sig, _sign(body)):
+            return None
+        try:
+            c = json.loads(_unb64(body))
+            return Session(int(c["uid"]), str(c["u"]), int(c["exp"]), bytes.fromhex(c["jti"]))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def verify(self, token: str) -> Optional[Session]:
+        """The token's session, or None when it is forged, expired or revoked."""
+        s = self._verified.get(token)
+        if s is not None:
+            self.hits += 1
+            self._verified.move_to_end(token)
+        else:
+            self.misses += 1
+            s = self._decode(token)
+            if s is None:
+                self.rejected += 1
+                return None
+            self._verified[token] = s
+            if len(self._verified) > AUTH_SESSION_CACHE_MAX:
+                self._verified.popitem(last=False)
+        if s.expires_at <= time.time() or s.jti in self._revoked:
+            self._verified.pop(token, None)
+            self.rejected += 1
+            return None
+        return s
+
+    # ----- revocation -----
+    def note_revoked(self, jti: bytes, expires_at: float) -> None:
+        now = time.time()
+        if expires_at > now:
+            self._revoked[jti] = expires_at
+        if now - self._pruned_at > _PRUNE_INTERVAL:
+            self._revoked = {j: e for j, e in self._revoked.items() if e > now}
+            self._pruned_at = now
+
+    async def revoke(self, s: Session) -> None:
+        await async_exec(
+            """
+            INSERT INTO dhi.revoked_sessions (jti, user_id, expires_at)
+            VALUES (%(jti)s, %(uid)s, to_timestamp(%(exp)s))
+            ON CONFLICT (jti) DO NOTHING;
+            """,
+            {"jti": s.jti, "uid": s.user_id, "exp": s.expires_at},
+        )
+        self.note_revoked(s.jti, s.expires_at)
+
+    async def apply_revocation(self, payload: str) -> None:
+        jti_hex, _, exp = payload.partition(":")
+        try:
+            self.note_revoked(bytes.fromhex(jti_hex), float(exp))
+        except ValueError:
+            print(f"[auth] ignoring malformed {SESSIONS_CHANNEL} payload: {payload!r}")
+
+    async def load(self) -> None:
+        await async_exec("DELETE FROM dhi.revoked_sessions WHERE expires_at <= NOW();")
+        rows = await async_query(
+            """
+            SELECT jti, extract(epoch FROM expires_at)::float8 AS exp
+            FROM dhi.revoked_sessions;
+            """,
+            read_only=True,
+        )
+        now = time.time()
+        # keep what NOTIFY delivered while the query ran; revocations only accumulate
+        fresh = {j: e for j, e in self._revoked.items() if e > now}
+        fresh.update((bytes(r["jti"]), r["exp"]) for r in rows)
+        self._revoked = fresh
+        self._pruned_at = now
+        self.loaded_at = now
+
+    def stats(self) -> Dict[str, Any]:
+        looked_up = self.hits + self.misses
+        return {
+            "required": AUTH_REQUIRED,
+            "enabled": SESSIONS_ENABLED,
+            "secret_from_env": _SECRET_FROM_ENV,
+            "ttl_s": AUTH_SESSION_TTL,
+            "cached": len(self._verified),
+            "cache_max": AUTH_SESSION_CACHE_MAX,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / looked_up, 4) if looked_up else None,
+            "rejected": self.rejected,
+            "revoked": len(self._revoked),
+            "loaded_at": self.loaded_at,
+        }
+
+
+SESSIONS = SessionStore()
+
+
+async def require_session(authorization: Optional[str] = Header(None)) -> Session:
+    """FastAPI dependency: the caller's session from `Authorization: Bearer <token>`, else 401."""
+    scheme, _, token = (authorization or "").partition(" ")
+    s = SESSIONS.verify(token.strip()) if scheme.lower() == "bearer" and token else None
+    if s is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Missing or invalid session token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return s
+
+
+async def start_sessions() -> None:
+    if not _SECRET_FROM_ENV:
+        if AUTH_REQUIRED and not AUTH_SESSION_DEV_KEY:
+            # a per-worker key would reject tokens issued by the other workers
+            raise RuntimeError(
+                "AUTH_REQUIRED=on needs AUTH_SESSION_SECRET (or AUTH_SESSION_DEV_KEY=on for single-process dev)"
+            )
+        if AUTH_SESSION_DEV_KEY:
+            print("[auth] AUTH_SESSION_DEV_KEY=on: using a per-process key (single process only; tokens end on restart)")
+        else:
+            print("[auth] AUTH_SESSION_SECRET not set: session tokens disabled")
+    # listen first: a revocation committed during the load still arrives
+    LISTENER.subscribe(SESSIONS_CHANNEL, SESSIONS.apply_revocation, SESSIONS.load, tag="auth")
+    if not await LISTENER.listening(SESSIONS_CHANNEL):
+        print(f"[auth] not listening on {SESSIONS_CHANNEL} yet; reloading revocations once it is")
+    try:
+        await SESSIONS.load()
+        print(f"[auth] sessions ready: {len(SESSIONS._revoked)} revoked tokens loaded")
+    except Exception as e:
+        print(f"[auth] revoked session load failed: {e}")
+
+
+async def stop_sessions() -> None:
+    await LISTENER.unsubscribe(SESSIONS_CHANNEL)
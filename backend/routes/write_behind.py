@@ -0,0 +1,158 @@
+# backend/routes/write_behind.py
+# Write-behind for "last seen" style timestamps on hot rows (login_users.last_login).
+#
+# touch(id) records the time in memory and returns at once; repeated touches
+# of one row coalesce to the newest time. A background task writes everything
+# pending in one UPDATE ... FROM unnest(ids, times) every WRITE_BEHIND_INTERVAL
+# seconds, or sooner once WRITE_BEHIND_MAX_PENDING rows are waiting. App
+# shutdown flushes what is left before the pool closes.
+#
+# GREATEST() keeps a late flush from moving a timestamp backwards, and rows are
+# updated in id order so concurrent flushes from several processes lock them
+# in the same order. A failed flush puts its rows back for the next attempt.
+# Up to one interval of touches is lost if the process dies without shutdown.
+#
+#   WRITE_BEHIND=off  write synchronously in touch() instead (old behaviour)
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from .db_connection import PG_SCHEMA, _env, _flag, _schema_sql, async_exec
+
+WRITE_BEHIND: bool = _flag("WRITE_BEHIND", True)
+WRITE_BEHIND_INTERVAL: float = float(_env("WRITE_BEHIND_INTERVAL", "2"))
+WRITE_BEHIND_MAX_PENDING: int = int(_env("WRITE_BEHIND_MAX_PENDING", "500"))
+
+
+class TimestampBuffer:
+    """Pending `<table>.<column> = time` updates keyed by `<table>.id`."""
+
+    def __init__(self, table: str, column: str) -> None:
+        _schema_sql()  # validates PG_SCHEMA before it goes into SQL text
+        self.name = f"{table}.{column}"
+        self._sql = f"""
+            UPDATE {PG_SCHEMA}.{table} AS t
+            SET {column} = GREATEST(t.{column}, v.ts)
+            FROM unnest(%(ids)s::bigint[], %(ts)s::timestamptz[]) AS v(id, ts)
+            WHERE t.id = v.id;
+        """
+        self._pending: Dict[int, datetime] = {}
+        self._lock: Optional[asyncio.Lock] = None  # made on the running loop (3.9 binds at creation)
+        self._wake: Optional[asyncio.Event] = None
+        self.touched = 0
+        self.flushed_rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_flush_ms: Optional[float] = None
+
+    def bind(self, wake: asyncio.Event) -> None:
+        self._wake = wake
+
+    async def touch(self, row_id: int, at: Optional[datetime] = None) -> None:
+        at = at or datetime.now(timezone.utc)
+        self.touched += 1
+        if not WRITE_BEHIND or self._wake is None:
+            # no flusher running (disabled, CLI use): write now
+            await async_exec(self._sql, {"ids": [row_id], "ts": [at]}, set_schema=False, prepare=True)
+            return
+        prev = self._pending.get(row_id)
+        if prev is None or at > prev:
+            self._pending[row_id] = at
+        if len(self._pending) >= WRITE_BEHIND_MAX_PENDING:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        """Write everything pending; returns the number of rows sent."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            ids = sorted(batch)
+            t0 = time.perf_counter()
+            try:
+                await async_exec(
+                    self._sql, {"ids": ids, "ts": [batch[i] for i in ids]}, set_schema=False, prepare=True
+                )
+            except BaseException:  # includes cancellation at shutdown
+                self.errors += 1
+                for row_id, at in batch.items():  # keep the newer of old and new
+                    if row_id not in self._pending or at > self._pending[row_id]:
+                        self._pending[row_id] = at
+                raise
+            self.last_flush_ms = round((time.perf_counter() - t0) * 1000.0, 2)
+            self.flushed_rows += len(ids)
+            self.batches += 1
+            return len(ids)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "touched": self.touched,
+            "flushed_rows": self.flushed_rows,
+            "batches": self.batches,
+            "errors": self.errors,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+LAST_LOGIN = TimestampBuffer("login_users", "last_login")
+
+BUFFERS = (LAST_LOGIN,)
+
+_task: Optional["asyncio.Task[None]"] = None
+
+
+async def flush_all() -> None:
+    for buf in BUFFERS:
+        try:
+            await buf.flush()
+        except Exception as e:
+            print(f"[write-behind] {buf.name} flush failed ({len(buf._pending)} pending): {e}")
+
+
+async def _flusher(wake: asyncio.Event) -> None:
+    while True:
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=WRITE_BEHIND_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        wake.clear()
+        await flush_all()
+
+
+def start_write_behind() -> None:
+    global _task
+    if WRITE_BEHIND and (_task is None or _task.done()):
+        wake = asyncio.Event()
+        for buf in BUFFERS:
+            buf.bind(wake)
+        _task = asyncio.get_running_loop().create_task(_flusher(wake))
+
+
+async def stop_write_behind() -> None:
+    """Stop the flusher and write what is pending; call before the pool closes."""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _task = None
+    await flush_all()
+    for buf in BUFFERS:
+        buf._wake = None
+
+
+def write_behind_stats() -> Dict[str, Any]:
+    return {
+        "enabled": WRITE_BEHIND,
+        "interval_s": WRITE_BEHIND_INTERVAL,
+        "max_pending": WRITE_BEHIND_MAX_PENDING,
+        "buffers": {buf.name: buf.stats() for buf in BUFFERS},
+    }
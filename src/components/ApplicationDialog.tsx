@@ -19,6 +19,7 @@ import {
   SelectValue,
 } from "@/components/ui/select";
 import { toast } from "sonner";
+import { registerApiBase } from "@/lib/readYourWrites";
 
 /**
  * This component is robust to mismatched backend ports:
@@ -219,6 +220,7 @@ export default function ApplicationDialog({
         if (!base) {
           base = await findWorkingApiBase();
           if (!alive) return;
+          registerApiBase(base);
           setApiBase(base);
         }
 
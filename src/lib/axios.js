@@ -1,5 +1,6 @@
 // src/lib/axios.js
 import axios from "axios";
+import { RYW_HEADER, notePrimaryUntil, primaryUntil } from "./readYourWrites";
 
 /**
  * FRONTEND: Axios instance for DHI API
@@ -22,13 +23,18 @@ api.interceptors.request.use(
   (cfg) => {
     const token = localStorage.getItem("token");
     if (token) cfg.headers.Authorization = `Bearer ${token}`;
+    const pin = primaryUntil();
+    if (pin) cfg.headers[RYW_HEADER] = pin;
     return cfg;
   },
   (err) => Promise.reject(err)
 );
 
 api.interceptors.response.use(
-  (r) => r,
+  (r) => {
+    notePrimaryUntil(r.headers?.["x-primary-until"]);
+    return r;
+  },
   (err) => {
     // central error handling, map server errors to friendly messages
     if (err.response) {
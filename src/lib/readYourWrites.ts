@@ -0,0 +1,101 @@
+// src/lib/readYourWrites.ts
+/**
+ * Read-your-writes with read replicas (backend App.py `_read_your_writes`).
+ *
+ * After a write the API answers with `X-Primary-Until: <epoch seconds>`; until
+ * then this client's reads must go to the primary. The API is cross-origin and
+ * called without credentials, so the server's cookie never comes back; instead
+ * we keep the value and echo it as a request header (the server ignores it
+ * once expired). Covers `fetch` calls to the API (installed once from
+ * main.tsx) and the axios instance in lib/axios.js.
+ *
+ * The header is only sent to the API. A custom header makes any cross-origin
+ * request preflighted, and other services (Supabase) would refuse it.
+ */
+export const RYW_HEADER = "X-Primary-Until";
+
+const KEY = "dhi_primary_until";
+// stop echoing after this long on our clock, whatever the server's clock says
+const MAX_PIN_MS = 60_000;
+
+export function primaryUntil(): string | null {
+  try {
+    const raw = sessionStorage.getItem(KEY);
+    if (!raw) return null;
+    const [value, seenAt] = raw.split("@");
+    if (Date.now() - Number(seenAt) > MAX_PIN_MS) {
+      sessionStorage.removeItem(KEY);
+      return null;
+    }
+    return value;
+  } catch {
+    return null;
+  }
+}
+
+export function notePrimaryUntil(value: string | null | undefined): void {
+  if (!value) return;
+  try {
+    sessionStorage.setItem(KEY, `${value}@${Date.now()}`);
+  } catch {
+    /* storage unavailable: pin lasts for this request only */
+  }
+}
+
+/** API base (same resolution as the pages: Vite env, Next env, host:30020). */
+function defaultApiBase(): string {
+  const viteEnv = (import.meta as unknown as { env?: Record<string, string> }).env;
+  const fromVite = viteEnv?.VITE_API_BASE || viteEnv?.VITE_API_URL;
+  if (fromVite && fromVite.trim()) return fromVite.replace(/\/+$/, "");
+  if (typeof process !== "undefined" && process.env?.NEXT_PUBLIC_API_BASE) {
+    return process.env.NEXT_PUBLIC_API_BASE.replace(/\/+$/, "");
+  }
+  if (typeof window !== "undefined") {
+    return `${window.location.protocol}//${window.location.hostname}:30020`;
+  }
+  return "http://localhost:30020";
+}
+
+export const API_BASE = defaultApiBase();
+
+const apiBases = new Set<string>([API_BASE]);
+
+/** For components that discover the API base at runtime (ApplicationDialog). */
+export function registerApiBase(base: string): void {
+  apiBases.add(base.replace(/\/+$/, ""));
+}
+
+function isApiRequest(input: RequestInfo | URL): boolean {
+  const raw = typeof input === "string" ? input : input instanceof URL ? input.href : input.url;
+  let url: URL;
+  try {
+    url = new URL(raw, window.location.href);
+  } catch {
+    return false;
+  }
+  if (url.origin === window.location.origin && url.pathname.startsWith("/api/")) return true;
+  for (const base of apiBases) {
+    if (url.href === base || url.href.startsWith(`${base}/`)) return true;
+  }
+  return false;
+}
+
+let installed = false;
+
+export function installReadYourWrites(): void {
+  if (installed || typeof window === "undefined") return;
+  installed = true;
+  const original = window.fetch.bind(window);
+  window.fetch = async (input: RequestInfo | URL, init?: RequestInit) => {
+    if (!isApiRequest(input)) return original(input, init);
+    const pin = primaryUntil();
+    if (pin) {
+      const headers = new Headers(init?.headers ?? (input instanceof Request ? input.headers : undefined));
+      headers.set(RYW_HEADER, pin);
+      init = { ...init, headers };
+    }
+    const res = await original(input, init);
+    notePrimaryUntil(res.headers.get(RYW_HEADER));
+    return res;
+  };
+}
@@ -1,5 +1,8 @@
 import { createRoot } from "react-dom/client";
 import App from "./App.tsx";
 import "./index.css";
+import { installReadYourWrites } from "./lib/readYourWrites";
+
+installReadYourWrites();
 
 createRoot(document.getElementById("root")!).render(<App />);